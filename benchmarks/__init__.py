@@ -0,0 +1,2 @@
+# Benchmarks reproducibles del motor (timers, render, bridges).
+# Se ejecutan como módulos desde la raíz del proyecto: python -m benchmarks.<nombre>
@@ -0,0 +1,181 @@
+"""
+Prueba de carga de la API HTTP de control (server.control).
+
+La aplicación corre como siempre (QPA offscreen, GameManager en el hilo de
+Qt) y N clientes locales, en otro proceso, mandan comandos a la vez:
+  - single: un comando por pedido ("+1 local")
+  - batch: un lote de 3 comandos por pedido ("+2 local, falta visita, -1 s")
+  - sin keep-alive: un comando por pedido abriendo una conexión nueva cada vez
+Para cada escenario reporta pedidos por segundo y la latencia de cada
+pedido (envío hasta respuesta con la versión nueva) en percentiles, además
+de cuántas veces se emitió 'updated' y cuántos saltos al hilo de Qt hubo.
+Antes de medir verifica que un lote que sólo configura el countdown previo
+también publica una versión nueva del estado.
+
+Uso:
+    python -m benchmarks.control_api --clients 8 --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+
+_SINGLE = {"op": "score_local", "args": [1]}
+_BATCH = {"commands": [
+    {"op": "score_local", "args": [2]},
+    {"op": "foul_visit"},
+    {"op": "adjust_time", "args": [-1]},
+]}
+
+
+def _request_bytes(payload: dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    return (
+        "POST /commands HTTP/1.1\r\n"
+        "Host: 127.0.0.1\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+async def _read_response(reader: asyncio.StreamReader) -> dict:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.decode("latin-1").split("\r\n"):
+        name, _, value = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(await reader.readexactly(length))
+
+
+async def _client(port: int, requests: int, payload: dict, keep_alive: bool, samples: List[float]) -> None:
+    message = _request_bytes(payload, keep_alive)
+    reader = writer = None
+    for _ in range(requests):
+        start = time.perf_counter_ns()
+        if writer is None:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(message)
+        response = await _read_response(reader)
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+        if "version" not in response:
+            raise RuntimeError(f"Respuesta inesperada: {response}")
+        if not keep_alive:
+            writer.close()
+            await writer.wait_closed()
+            writer = None
+    if writer is not None:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _check_version_bump(port: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    versions = []
+    for mmss in ("05:00", "04:00"):
+        writer.write(_request_bytes({"op": "set_pregame_countdown", "args": [mmss]}, keep_alive=True))
+        versions.append((await _read_response(reader))["version"])
+    writer.close()
+    await writer.wait_closed()
+    if versions[1] <= versions[0]:
+        raise RuntimeError(f"set_pregame_countdown no publicó un estado nuevo (versiones {versions})")
+
+
+def _run_clients(port: int, clients: int, requests: int) -> dict:
+    from benchmarks.state_block import _summary
+
+    asyncio.run(_check_version_bump(port))
+    scenarios = {
+        "single": (_SINGLE, True),
+        "batch": (_BATCH, True),
+        "single_no_keepalive": (_SINGLE, False),
+    }
+    results = {}
+    for name, (payload, keep_alive) in scenarios.items():
+        samples: List[float] = []
+
+        async def run_all() -> None:
+            await asyncio.gather(*(
+                _client(port, requests, payload, keep_alive, samples) for _ in range(clients)
+            ))
+
+        start = time.perf_counter()
+        asyncio.run(run_all())
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "requests_per_s": round(len(samples) / elapsed),
+            "latency_ms": _summary(samples, 3),
+        }
+    return results
+
+
+def run(clients: int, requests: int) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from benchmarks.suite import _pump
+    from core.game_manager import GameManager
+    from core.qt_dispatch import MainThreadDispatcher
+    from models.game_type import GameType
+    from models.match import Match
+    from models.team import Team
+    from server.control import ControlServer
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = GameManager(Match(
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+        GameType("FIBA", 4, "10:00", "02:00", "05:00"),
+    ))
+    emits = {"updated": 0}
+    manager.updated.connect(lambda: emits.__setitem__("updated", emits["updated"] + 1))
+    dispatcher = MainThreadDispatcher()
+    server = ControlServer(dispatcher.call_soon, host="127.0.0.1", port=0)
+    server.add_court(1, manager)
+    port = server.start()
+
+    worker = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.control_api", "--client-port", str(port),
+         "--clients", str(clients), "--requests", str(requests)],
+        cwd=_ROOT_DIR, stdout=subprocess.PIPE, text=True,
+    )
+    # El hilo de Qt tiene que girar para aplicar los comandos
+    _pump(600_000, lambda: worker.poll() is not None)
+    scenarios = json.loads(worker.stdout.read() or "{}")
+    stats = server.stats()
+    server.stop()
+    app.processEvents()
+    return {
+        "benchmark": "control_api",
+        "clients": clients,
+        "requests_per_client": requests,
+        "scenarios": scenarios,
+        "server": stats,
+        "updated_emits": emits["updated"],
+        "final_version": manager.snapshots.version,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=8, help="clientes concurrentes")
+    parser.add_argument("--requests", type=int, default=500, help="pedidos por cliente y escenario")
+    parser.add_argument("--client-port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.client_port:
+        print(json.dumps(_run_clients(args.client_port, args.clients, args.requests)))
+        return
+    print(json.dumps(run(args.clients, args.requests), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Costo por cancha del modo multi-cancha (MatchRegistry).
+
+Agrega canchas de a una y mide la memoria que suma cada una (tracemalloc,
+motor + journal) y el CPU del proceso con todos los relojes corriendo en
+tiempo real sobre un único TimingWheel (montado en asyncio). Con --windows arma
+además las ventanas Qt (operador + display, QPA offscreen) y reporta el
+RSS máximo por cancha, que es donde está el grueso de la memoria.
+
+Uso:
+    python -m benchmarks.courts_scaling --courts 8 --seconds 5
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.courts_scaling --courts 4 --windows
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from core.engine import MatchEngine
+from core.match_registry import MatchRegistry
+from core.timer import AsyncioScheduler, TimingWheel
+from models.game_type import GameType
+from models.team import Team
+
+
+def _presets():
+    teams = [Team(f"Equipo {i}", "", "#ff0000", "#ffffff") for i in range(16)]
+    game_types = [GameType("FIBA", 4, "10:00", "02:00", "05:00")]
+    return teams, game_types
+
+
+async def _engine_courts(courts: int, seconds: float, journal_root: Path) -> dict:
+    teams, game_types = _presets()
+    # Mismo esquema que la aplicación: todos los relojes sobre un TimingWheel
+    wheel = TimingWheel(AsyncioScheduler())
+    registry = MatchRegistry(teams, game_types, MatchEngine, wheel, journal_root)
+
+    tracemalloc.start()
+    per_court_kib = []
+    for _ in range(courts):
+        before = tracemalloc.get_traced_memory()[0]
+        registry.add_court()
+        per_court_kib.append((tracemalloc.get_traced_memory()[0] - before) / 1024)
+    tracemalloc.stop()
+
+    for court in registry.courts():
+        # Último minuto: el reloj dispara cada décima (peor caso de CPU)
+        court.engine.set_time("00:59")
+        court.engine.start_time()
+
+    cpu_start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu_s = time.process_time() - cpu_start
+    registry.shutdown()
+    return {
+        "courts": courts,
+        "memory_per_court_kib": round(sum(per_court_kib) / courts, 1),
+        "memory_first_court_kib": round(per_court_kib[0], 1),
+        "cpu_percent_total": round(100 * cpu_s / seconds, 2),
+        "cpu_percent_per_court": round(100 * cpu_s / seconds / courts, 3),
+        "scheduler_wakeups_per_s": round(wheel.stats()["wakeups"] / seconds, 1),
+    }
+
+
+def _window_courts(courts: int, seconds: float, journal_root: Path) -> dict:
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from core.game_manager import GameManager
+    from ui.update_scheduler import UpdateScheduler
+    from ui.windows import DisplayWindow, OperatorWindow
+
+    app = QApplication.instance() or QApplication([])
+    teams, game_types = _presets()
+    registry = MatchRegistry(teams, game_types, GameManager, journal_root=journal_root)
+
+    def pump(ms: int) -> None:
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def rss_kib() -> int:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    rss = [rss_kib()]
+    keep = []
+    for _ in range(courts):
+        court = registry.add_court()
+        updates = UpdateScheduler(court.manager)
+        display = DisplayWindow(court.manager, updates=updates)
+        operator = OperatorWindow(court.manager, teams, game_types, lambda *_: None, display.set_template,
+                                  updates=updates)
+        display.show()
+        operator.show()
+        keep.append((updates, display, operator))
+        pump(1500)  # esperar a que carguen las páginas
+        rss.append(rss_kib())
+
+    for court in registry.courts():
+        court.manager.set_time("00:59")
+        court.manager.start_time()
+    cpu_start = time.process_time()
+    pump(int(seconds * 1000))
+    cpu_s = time.process_time() - cpu_start
+    registry.shutdown()
+    app.processEvents()
+
+    steps = [b - a for a, b in zip(rss, rss[1:])]
+    return {
+        "courts": courts,
+        "max_rss_kib_first_court": steps[0],
+        "max_rss_kib_per_extra_court": round(sum(steps[1:]) / max(1, len(steps) - 1), 1),
+        "cpu_percent_total": round(100 * cpu_s / seconds, 2),
+        "cpu_percent_per_court": round(100 * cpu_s / seconds / courts, 3),
+    }
+
+
+def run(courts: int, seconds: float, windows: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        result = {
+            "benchmark": "courts_scaling",
+            "engine": asyncio.run(_engine_courts(courts, seconds, Path(tmp) / "engine")),
+        }
+        if windows:
+            result["windows"] = _window_courts(courts, seconds, Path(tmp) / "windows")
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courts", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--windows", action="store_true", help="incluir ventanas Qt (requiere PySide6)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.courts, args.seconds, args.windows), indent=2))
+
+
+if __name__ == "__main__":
+    main()
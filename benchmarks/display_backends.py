@@ -0,0 +1,156 @@
+"""
+Display WebEngine contra display nativo (QPainter): memoria y tiempo de frame.
+
+Cada backend corre en su propio proceso (QPA offscreen) con un GameManager
+y un DisplayWindow de 1280x720, igual que en la aplicación:
+  - rss_kib: RSS del proceso más todos sus descendientes (los procesos de
+    Chromium cuentan para WebEngine), medido en /proc (sólo Linux)
+  - update_to_frame: desde manager.score_local() hasta que el cambio llegó
+    a pantalla (DOM mutado en WebEngine, paintEvent terminado en nativo)
+  - paint (sólo nativo): costo de pintar la región del marcador y la
+    ventana completa
+
+Uso:
+    python -m benchmarks.display_backends --iterations 100
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def _tree_rss_kib(pid: int) -> int:
+    """VmRSS de 'pid' y de todos sus descendientes."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, ()))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total
+
+
+def _worker(backend: str, iterations: int) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from benchmarks.suite import _PROBE_PREFIX, _install_probe, _pump, _summary, _time_us
+    from core.game_manager import GameManager
+    from models.game_type import GameType
+    from models.match import Match
+    from models.team import Team
+    from ui.native_display import NATIVE_TEMPLATE
+    from ui.update_scheduler import UpdateScheduler
+    from ui.windows import DisplayWindow
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    baseline_kib = _tree_rss_kib(os.getpid())
+    manager = GameManager(Match(
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+        GameType("FIBA", 4, "10:00", "02:00", "05:00"),
+    ))
+    updates = UpdateScheduler(manager)
+    display = DisplayWindow(manager, NATIVE_TEMPLATE if backend == "native" else None, updates=updates)
+    display.resize(1280, 720)
+    display.show()
+
+    samples: List[float] = []
+    result: dict = {"backend": backend}
+    if backend == "native":
+        native = display.native
+        _pump(300)
+        for _ in range(iterations):
+            painted = native.paints
+            start = time.perf_counter_ns()
+            manager.score_local(1)
+            if _pump(1000, lambda: native.paints > painted):
+                samples.append((time.perf_counter_ns() - start) / 1e6)
+        score_rect = native._rects["score_local"]
+        result["paint_us"] = {
+            "score_region": _time_us(lambda: native.repaint(score_rect), iterations),
+            "full_window": _time_us(native.repaint, iterations),
+        }
+    else:
+        if not _pump(15000, lambda: display._page_ready):
+            return {"backend": backend, "error": "page did not load"}
+        _pump(500)
+        state = {"count": -1, "stamp": 0}
+
+        def on_title(title: str) -> None:
+            if title.startswith(_PROBE_PREFIX) and title[len(_PROBE_PREFIX):].isdigit():
+                state["count"] = int(title[len(_PROBE_PREFIX):])
+                state["stamp"] = time.perf_counter_ns()
+
+        display.view.titleChanged.connect(on_title)
+        _install_probe(display.view, '[data-field="points_local"]')
+        if not _pump(5000, lambda: state["count"] >= 0):
+            return {"backend": backend, "error": "probe not installed"}
+        for _ in range(iterations):
+            before = state["count"]
+            start = time.perf_counter_ns()
+            manager.score_local(1)
+            if _pump(2000, lambda: state["count"] > before):
+                samples.append((state["stamp"] - start) / 1e6)
+            _pump(20)
+
+    _pump(500)
+    result["rss_kib"] = _tree_rss_kib(os.getpid())
+    result["rss_kib_display"] = result["rss_kib"] - baseline_kib
+    result["update_to_frame_ms"] = _summary(samples, 3)
+    return result
+
+
+def run(iterations: int) -> dict:
+    backends = {}
+    for backend in ("web", "native"):
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.display_backends", "--worker", backend,
+             "--iterations", str(iterations)],
+            cwd=_ROOT_DIR, capture_output=True, text=True, timeout=600,
+        )
+        try:
+            backends[backend] = json.loads(completed.stdout)
+        except ValueError:
+            backends[backend] = {"error": completed.stderr.strip().splitlines()[-1:] or "no output"}
+    return {"benchmark": "display_backends", "iterations": iterations, "backends": backends}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--worker", choices=("web", "native"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.iterations)))
+        return
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
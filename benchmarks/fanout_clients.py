@@ -0,0 +1,183 @@
+"""
+Prueba de carga del servidor de displays remotos (FanoutServer).
+
+Levanta el servidor en loopback, conecta N clientes SSE desde un proceso
+aparte (algunos lentos, con buffer de recepción chico y lecturas espaciadas)
+y publica estados a la frecuencia pedida desde el hilo principal, como lo
+haría el hilo de Qt.
+Informa el costo de publish(), la latencia publicación→recepción de los
+clientes normales y cuántos frames se descartaron en los lentos.
+
+Uso:
+    python -m benchmarks.fanout_clients --clients 200 --slow 10 --hz 10 --seconds 10
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import statistics
+import time
+from typing import Dict, List
+
+from server.fanout import FanoutServer
+
+_SLOW_READ_DELAY_S = 0.5
+_SLOW_RCVBUF = 1024
+
+
+def _sample_state(seq: int) -> Dict[str, object]:
+    team = {"name": "Equipo", "logo": "", "color_primary": "#ff0000", "color_secondary": "#ffffff"}
+    return {
+        "time": f"{9 - seq // 600 % 10:02d}:{59 - seq // 10 % 60:02d}",
+        "time_style": "regular",
+        "period": 1,
+        "points_local": seq % 120,
+        "points_visit": seq % 97,
+        "fouls_local": seq % 5,
+        "fouls_visit": seq % 4,
+        "team_local": team,
+        "team_visit": team,
+        "game_type": {"name": "FIBA", "quarters": "4", "time_per_quarter": "10:00",
+                      "rest_between_quarters": "02:00", "halftime_rest": "05:00"},
+        "_sent_ns": time.monotonic_ns(),
+    }
+
+
+async def _client(port: int, slow: bool, result: Dict[str, object], stop: asyncio.Event) -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if slow:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SLOW_RCVBUF)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock, limit=1024 * 1024)
+    writer.write(b"GET /events HTTP/1.1\r\nHost: bench\r\n\r\n")
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+
+    latencies: List[float] = result["latencies"]  # type: ignore[assignment]
+    try:
+        while not stop.is_set():
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.startswith(b"data: "):
+                continue
+            received_ns = time.monotonic_ns()
+            state = json.loads(line[6:])
+            result["frames"] += 1  # type: ignore[operator]
+            if not slow:
+                latencies.append((received_ns - state["_sent_ns"]) / 1e6)
+            else:
+                await asyncio.sleep(_SLOW_READ_DELAY_S)
+    finally:
+        writer.close()
+
+
+def _run_clients(port: int, clients: int, slow: int, conn) -> None:
+    """Proceso hijo: conecta los clientes, avisa y junta resultados hasta la orden de parar."""
+
+    async def main() -> List[Dict[str, object]]:
+        stop = asyncio.Event()
+        results: List[Dict[str, object]] = []
+        tasks = []
+        for index in range(clients):
+            result = {"slow": index < slow, "frames": 0, "latencies": []}
+            results.append(result)
+            tasks.append(asyncio.create_task(_client(port, index < slow, result, stop)))
+        # Espera a que todos estén suscritos antes de empezar a publicar
+        await asyncio.sleep(0.5)
+        conn.send("ready")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, conn.recv)
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
+    conn.send(asyncio.run(main()))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+def run(clients: int, slow: int, hz: float, seconds: float) -> dict:
+    server = FanoutServer(host="127.0.0.1", port=0)
+    port = server.start()
+    server.publish(_sample_state(0))
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    client_process = multiprocessing.get_context("spawn").Process(
+        target=_run_clients, args=(port, clients, slow, child_conn), daemon=True
+    )
+    client_process.start()
+    parent_conn.recv()
+
+    interval = 1.0 / hz
+    publish_us: List[float] = []
+    published = 0
+    next_at = time.perf_counter()
+    deadline = next_at + seconds
+    while next_at < deadline:
+        time.sleep(max(0.0, next_at - time.perf_counter()))
+        published += 1
+        state = _sample_state(published)
+        start = time.perf_counter_ns()
+        server.publish(state)
+        publish_us.append((time.perf_counter_ns() - start) / 1000)
+        next_at += interval
+
+    time.sleep(0.5)
+    stats = server.stats()
+    parent_conn.send("stop")
+    results = parent_conn.recv()
+    client_process.join()
+    server.stop()
+
+    fast = [result for result in results if not result["slow"]]
+    slow_results = [result for result in results if result["slow"]]
+    latencies = [value for result in fast for value in result["latencies"]]
+    return {
+        "benchmark": "fanout_clients",
+        "clients": clients,
+        "slow_clients": slow,
+        "hz": hz,
+        "published": published,
+        "publish_call_us": {
+            "mean": round(statistics.mean(publish_us), 2),
+            "p99": _percentile(publish_us, 99),
+            "max": round(max(publish_us), 2),
+        },
+        "latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "frames_per_fast_client_min": min((result["frames"] for result in fast), default=0),
+        "frames_per_slow_client_mean": round(
+            statistics.mean(result["frames"] for result in slow_results), 1
+        ) if slow_results else 0,
+        "server": stats,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--slow", type=int, default=10)
+    parser.add_argument("--hz", type=float, default=10.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.clients, args.slow, args.hz, args.seconds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
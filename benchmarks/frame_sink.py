@@ -0,0 +1,137 @@
+"""
+Salida de frames para overlays (ui.frame_sink) a ritmo fijo, con un lector.
+
+Con QPA offscreen arma un GameManager con el reloj corriendo y un doble
+cada 500 ms, publica frames RGBA en un anillo de memoria compartida y un
+proceso aparte los consume como lo haría un encoder:
+  - sink: frames publicados, rasterizaciones, frames perdidos por atraso
+    del loop, costo de rasterizar y atraso de cada tick
+  - reader: frames recibidos, salteados, reescritos durante la lectura y
+    latencia desde el instante nominal del frame hasta que el lector lo vio
+  - widget_grab_us: lo que cuesta por frame capturar un display nativo del
+    mismo tamaño con QWidget.grab() (la alternativa de capturar la ventana)
+
+Uso:
+    python -m benchmarks.frame_sink --seconds 10 --fps 60 --size 1920x1080
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def _reader(name: str, seconds: float) -> dict:
+    from benchmarks.suite import _summary
+    from utils.frame_ring import FrameRingReader
+
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            reader = FrameRingReader(name)
+            break
+        except FileNotFoundError:
+            if time.monotonic() > deadline:
+                return {"error": "ring not found"}
+            time.sleep(0.01)
+
+    latencies = []
+    last = received = skipped = torn = 0
+    period_s = 1 / max(1, reader.fps)
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        frame = reader.read()
+        if frame is None or frame.number == last:
+            time.sleep(period_s / 8)
+            continue
+        latencies.append((time.monotonic_ns() - frame.timestamp_ns) / 1e6)
+        if last and frame.number > last + 1:
+            skipped += frame.number - last - 1
+        last = frame.number
+        received += 1
+        if not reader.intact(frame):
+            torn += 1
+        frame = None
+    reader.close()
+    return {
+        "received": received,
+        "skipped": skipped,
+        "torn": torn,
+        "latency_ms": _summary(latencies, 3),
+    }
+
+
+def run(seconds: float, fps: int, width: int, height: int) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from benchmarks.suite import _pump, _time_us
+    from core.game_manager import GameManager
+    from models.game_type import GameType
+    from models.match import Match
+    from models.team import Team
+    from ui.frame_sink import FrameSink, RingOutput
+    from ui.native_display import NativeScoreboard
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = GameManager(Match(
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+        GameType("FIBA", 4, "10:00", "02:00", "05:00"),
+    ))
+    name = f"bbp-bench-{os.getpid()}"
+    sink = FrameSink(manager, RingOutput(name, width, height, fps), width, height, fps)
+    reader = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.frame_sink", "--reader", name, "--seconds", str(seconds)],
+        cwd=_ROOT_DIR, stdout=subprocess.PIPE, text=True,
+    )
+
+    manager.start_time()
+    baskets = QTimer()
+    baskets.timeout.connect(lambda: manager.score_local(2))
+    baskets.start(500)
+    sink.start()
+    _pump(int(seconds * 1000) + 500)
+    baskets.stop()
+    stats = sink.stats()
+    sink.stop()
+    reader_result = json.loads(reader.communicate(timeout=60)[0] or "{}")
+
+    widget = NativeScoreboard(manager.timer.monotonic_ms)
+    widget.resize(width, height)
+    widget.set_state(manager.snapshots.display_state())
+    widget.show()
+    _pump(200)
+    grab = _time_us(lambda: widget.grab().toImage(), 60)
+    app.processEvents()
+    return {
+        "benchmark": "frame_sink",
+        "seconds": seconds,
+        "sink": stats,
+        "reader": reader_result,
+        "widget_grab_us": grab,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--fps", type=int, choices=(30, 60), default=60)
+    parser.add_argument("--size", default="1920x1080", help="ancho x alto de los frames")
+    parser.add_argument("--reader", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.reader:
+        print(json.dumps(_reader(args.reader, args.seconds)))
+        return
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    print(json.dumps(run(args.seconds, args.fps, width, height), indent=2))
+
+
+if __name__ == "__main__":
+    main()
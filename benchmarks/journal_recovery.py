@@ -0,0 +1,99 @@
+"""
+Benchmark de recuperación del journal de partido.
+
+Genera en tiempo virtual el journal de un partido de 2 horas (acciones de
+operador cada pocos segundos, relojes corriendo) y mide cuánto tarda
+MatchJournal.recover() en reconstruirlo, con snapshots periódicos y sin
+ellos (peor caso: re-aplicar todo el journal).
+
+Uso:
+    python -m benchmarks.journal_recovery --hours 2 --action-every-s 3
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from core.engine import MatchEngine
+from core.journal import MatchJournal
+from core.timer import VirtualClock
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+_ACTIONS = (
+    ("score_local", (1, 2, 3)),
+    ("score_visit", (1, 2, 3)),
+    ("foul_local", (1,)),
+    ("foul_visit", (1,)),
+    ("start_pause", ()),
+    ("adjust_time", (-1, 1)),
+)
+
+
+def _play(directory: Path, hours: float, action_every_s: float, snapshot_every: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    clock = VirtualClock()
+    game_type = GameType("Benchmark", 4, "10:00", "02:00", "05:00")
+    engine = MatchEngine(
+        Match(Team("Local", "", "#ff0000", "#ffffff"), Team("Visitante", "", "#0000ff", "#ffffff"), game_type),
+        scheduler=clock,
+    )
+    journal = MatchJournal(directory, snapshot_every=snapshot_every)
+    journal.attach(engine)
+    engine.start_time()
+
+    total_ms = int(hours * 3600 * 1000)
+    step_ms = int(action_every_s * 1000)
+    records = 0
+    while clock.now_ms < total_ms:
+        clock.advance(step_ms)
+        if engine.timer.remaining_ms == 0:
+            engine.next_period()
+            engine.start_time()
+        op, values = rng.choice(_ACTIONS)
+        method = getattr(engine, op)
+        method(rng.choice(values)) if values else method()
+        records += 1
+
+    journal.flush()
+    # Simula una caída: no se llama a close(), así no hay snapshot final limpio
+    expected = (engine.match.points_local, engine.match.points_visit, engine.match.current_period)
+    return {"records": records, "expected": expected}
+
+
+def run(hours: float, action_every_s: float, seed: int) -> dict:
+    results = {}
+    for label, snapshot_every in (("with_snapshots", 500), ("no_snapshots", 10**9)):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            played = _play(directory, hours, action_every_s, snapshot_every, seed)
+            size = sum(path.stat().st_size for path in directory.iterdir())
+            start = time.perf_counter()
+            recovered = MatchJournal.recover(directory)
+            elapsed = time.perf_counter() - start
+            match = recovered.build_match()
+            results[label] = {
+                "records": played["records"],
+                "replayed": recovered.replayed,
+                "journal_bytes": size,
+                "recover_ms": round(elapsed * 1000, 2),
+                "consistent": (match.points_local, match.points_visit, match.current_period) == played["expected"],
+            }
+    return {"benchmark": "journal_recovery", "hours": hours, "results": results}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--action-every-s", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.hours, args.action_every_s, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Costo del pipeline de logos (core.logo_pipeline) con un catálogo grande.
+
+Genera N logos PNG sintéticos de alta resolución en una carpeta temporal y
+mide lo que paga el hilo de Qt (prepare() y variant()), el tiempo total
+del hilo de fondo y el tamaño de las variantes frente a los originales.
+Una segunda pasada sobre los mismos archivos mide el arranque en caliente
+(variantes ya en disco, sólo se hashean los originales).
+
+Uso:
+    python -m benchmarks.logo_pipeline --teams 100 --size 2048
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from core.logo_pipeline import DEFAULT_LOGO_PX, LogoPipeline
+
+
+def _make_logos(root: Path, teams: int, size: int) -> list:
+    logos = []
+    (root / "logos").mkdir()
+    for index in range(teams):
+        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        hue = (index * 47) % 255
+        draw.ellipse((size // 16, size // 16, size - size // 16, size - size // 16), fill=(hue, 80, 255 - hue, 255))
+        draw.text((size // 3, size // 2), f"Equipo {index}", fill=(255, 255, 255, 255))
+        relative = f"logos/team-{index}.png"
+        image.save(root / relative)
+        logos.append(relative)
+    return logos
+
+
+def _pass(root: Path, logos: list) -> dict:
+    pipeline = LogoPipeline(root=root, cache_dir=root / "cache")
+    start = time.perf_counter()
+    pipeline.prepare(logos)
+    prepare_ms = (time.perf_counter() - start) * 1000
+    pipeline.wait()
+    total_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter_ns()
+    for logo in logos:
+        pipeline.variant(logo, DEFAULT_LOGO_PX)
+    lookup_ns = (time.perf_counter_ns() - start) / len(logos)
+    pipeline.shutdown()
+    return {
+        "prepare_ms_gui_thread": round(prepare_ms, 2),
+        "background_total_ms": round(total_ms, 1),
+        "variant_lookup_ns": round(lookup_ns),
+        "variants_ready": sum(pipeline.variant(logo, DEFAULT_LOGO_PX) != logo for logo in logos),
+    }
+
+
+def run(teams: int, size: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        logos = _make_logos(root, teams, size)
+        cold = _pass(root, logos)
+        warm = _pass(root, logos)
+        original_kib = sum((root / logo).stat().st_size for logo in logos) / 1024
+        variant_kib = sum(path.stat().st_size for path in (root / "cache").glob(f"*-{DEFAULT_LOGO_PX}.png")) / 1024
+    return {
+        "benchmark": "logo_pipeline",
+        "teams": teams,
+        "source_px": size,
+        "cold": cold,
+        "warm": warm,
+        "original_kib_per_logo": round(original_kib / teams, 1),
+        f"variant_{DEFAULT_LOGO_PX}px_kib_per_logo": round(variant_kib / teams, 1),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=100)
+    parser.add_argument("--size", type=int, default=2048, help="lado de los logos sintéticos en px")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.teams, args.size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Throughput del bloque de estado en memoria compartida (core.state_block).
+
+Un MatchEngine sin Qt publica a ritmo fijo (anota alternando local y
+visita) y N procesos lectores leen el bloque tan rápido como pueden:
+  - writer: publicaciones logradas y costo de una acción con su publicación
+  - readers: lecturas por segundo, publicaciones vistas, reintentos del
+    seqlock, costo de read() y atraso desde la publicación hasta que el
+    lector la vio
+  - torn: registros inconsistentes (puntos que no cuadran con la versión
+    del Match); con el seqlock tiene que ser 0
+
+Uso:
+    python -m benchmarks.state_block --seconds 5 --readers 2 --write-hz 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from core.engine import MatchEngine
+from core.state_block import StateBlockReader, StateBlockWriter
+from core.timer import AsyncioScheduler
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+# Se mide el costo de 1 de cada N lecturas para no inflar el resultado
+_SAMPLE_EVERY = 64
+
+
+def _summary(samples: List[float], digits: int) -> Dict[str, float]:
+    """n, media, p50, p99 y máximo (sin importar benchmarks.suite, que carga Qt)."""
+    if not samples:
+        return {"n": 0}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), digits),
+        "p50": round(ordered[len(ordered) // 2], digits),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], digits),
+        "max": round(ordered[-1], digits),
+    }
+
+
+def _reader(name: str, seconds: float) -> dict:
+    reader = StateBlockReader(name)
+    reads = seen = torn = 0
+    last_version = 0
+    read_us = []
+    lag_us = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        if reads % _SAMPLE_EVERY:
+            record = reader.read()
+        else:
+            start = time.perf_counter_ns()
+            record = reader.read()
+            read_us.append((time.perf_counter_ns() - start) / 1000)
+        reads += 1
+        if record is None or record.match_version == last_version:
+            continue
+        lag_us.append((time.monotonic_ns() - record.published_ns) / 1000)
+        last_version = record.match_version
+        seen += 1
+        if record.points_local + record.points_visit != record.match_version:
+            torn += 1
+    reader.close()
+    return {
+        "reads_per_s": round(reads / seconds),
+        "publications_seen": seen,
+        "torn": torn,
+        "seqlock_retries": reader.retries,
+        "read_us": _summary(read_us, 2),
+        "publish_to_read_us": _summary(lag_us, 1),
+    }
+
+
+def run(seconds: float, readers: int, write_hz: float) -> dict:
+    loop = asyncio.new_event_loop()
+    engine = MatchEngine(
+        Match(
+            Team("Local", "", "#ff0000", "#ffffff"),
+            Team("Visitante", "", "#0000ff", "#ffffff"),
+            GameType("FIBA", 4, "10:00", "02:00", "05:00"),
+        ),
+        scheduler=AsyncioScheduler(loop),
+    )
+    name = f"bbp-bench-state-{os.getpid()}"
+    writer = StateBlockWriter(name)
+    writer.track(engine)
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.state_block", "--reader", name, "--seconds", str(seconds)],
+            cwd=_ROOT_DIR, stdout=subprocess.PIPE, text=True,
+        )
+        for _ in range(readers)
+    ]
+    # Margen para que los lectores arranquen antes de empezar a publicar
+    time.sleep(0.5)
+
+    period_ns = int(1e9 / write_hz) if write_hz > 0 else 0
+    publish_us = []
+    start_ns = time.monotonic_ns()
+    end_ns = start_ns + int(seconds * 1e9)
+    publications = 0
+    while True:
+        now_ns = time.monotonic_ns()
+        if now_ns >= end_ns:
+            break
+        if period_ns:
+            due_ns = start_ns + publications * period_ns
+            if now_ns < due_ns:
+                time.sleep(min(due_ns - now_ns, 1_000_000) / 1e9)
+                continue
+        start = time.perf_counter_ns()
+        # Una acción = una versión nueva del Match = una publicación
+        if publications % 2:
+            engine.score_visit(1)
+        else:
+            engine.score_local(1)
+        publish_us.append((time.perf_counter_ns() - start) / 1000)
+        publications += 1
+
+    results = [json.loads(worker.communicate(timeout=seconds + 60)[0] or "{}") for worker in workers]
+    writer.close()
+    loop.close()
+    return {
+        "benchmark": "state_block",
+        "seconds": seconds,
+        "write_hz": write_hz or "max",
+        "writer": {
+            "publications": publications,
+            "publications_per_s": round(publications / seconds),
+            "action_plus_publish_us": _summary(publish_us, 2),
+        },
+        "readers": results,
+        "torn": sum(result.get("torn", 0) for result in results),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--write-hz", type=float, default=1000, help="publicaciones por segundo (0 = sin límite)")
+    parser.add_argument("--reader", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.reader:
+        print(json.dumps(_reader(args.reader, args.seconds)))
+        return
+    print(json.dumps(run(args.seconds, args.readers, args.write_hz), indent=2))
+
+
+if __name__ == "__main__":
+    main()
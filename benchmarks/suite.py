@@ -0,0 +1,405 @@
+"""
+Suite de benchmarks de punta a punta (Qt headless, plataforma offscreen).
+
+Arma un GameManager con sus ventanas de operador y display tal como lo hace
+AppController y mide los caminos que corren en cada acción o tick:
+  - slot_to_mutation: llamada a un slot de OperatorBridge hasta que el
+    GameManager quedó modificado
+  - build_state: _build_state / _build_context de ambas ventanas
+  - render: TemplateRenderer.render por template (frío, sin cache, cacheado)
+  - payload_bytes: tamaño de los JSON que cruzan el bridge y el SSE
+  - slot_to_dom: desde la acción hasta que el DOM de cada vista cambió
+    (un MutationObserver avisa cambiando document.title)
+  - clock: atraso de cada tick respecto del cambio ideal y deriva total
+    contra el reloj de pared; mientras corre (último minuto, 10 ticks por
+    segundo) también el CPU del proceso con sus hijos de Chromium, el atraso
+    de un timer de 16 ms en el hilo de UI y las recargas de la página
+
+El resultado es un JSON estable (mismas claves en cada corrida) para
+comparar entre versiones; con --output además se guarda en un archivo.
+benchmarks/baseline_suite.json es una corrida de referencia (PySide6 6.9.2,
+offscreen) contra la cual comparar.
+
+Uso:
+    python -m benchmarks.suite --iterations 200 --output data/cache/bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from core.game_manager import GameManager
+from core.state import clock_now_ms
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+from ui.template_renderer import renderer
+from ui.update_scheduler import UpdateScheduler
+from ui.windows import DisplayWindow, OperatorWindow
+
+_PROBE_PREFIX = "bbp-probe:"
+_DOM_TIMEOUT_MS = 2000
+_FRAME_MS = 16
+
+
+# -------------------------------------------------
+# 🔧 Utilidades de medición
+# -------------------------------------------------
+def _summary(samples: List[float], digits: int = 2) -> Dict[str, float]:
+    """Resumen fijo (n, media, p50, p95, p99, máx) de una lista de muestras."""
+    if not samples:
+        return {"n": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def pct(value: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(round(value / 100 * (len(ordered) - 1))))], digits)
+
+    return {
+        "n": len(ordered),
+        "mean": round(statistics.mean(ordered), digits),
+        "p50": pct(50),
+        "p95": pct(95),
+        "p99": pct(99),
+        "max": round(ordered[-1], digits),
+    }
+
+
+def _time_us(func: Callable[[], object], iterations: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return _summary(samples)
+
+
+def _pump(ms: int = 0, until: Optional[Callable[[], bool]] = None) -> bool:
+    """Procesa eventos de Qt hasta que 'until' sea verdadero o pasen 'ms'."""
+    deadline = time.monotonic() + ms / 1000
+    app = QApplication.instance()
+    while time.monotonic() < deadline:
+        if until is not None and until():
+            return True
+        loop = QEventLoop()
+        QTimer.singleShot(5, loop.quit)
+        loop.exec()
+    app.processEvents()
+    return until() if until is not None else True
+
+
+def _tree_cpu_s(pid: int) -> float:
+    """Segundos de CPU (usuario + sistema) de 'pid' y todos sus descendientes."""
+    children: Dict[int, List[int]] = {}
+    times: Dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+        times[int(entry)] = int(fields[11]) + int(fields[12])
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, ()))
+        total += times.get(current, 0)
+    return total / os.sysconf("SC_CLK_TCK")
+
+
+# -------------------------------------------------
+# 🏗️ Escenario
+# -------------------------------------------------
+def _build_scenario():
+    teams = [
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+    ]
+    game_types = [GameType("FIBA", 4, "10:00", "02:00", "05:00")]
+    manager = GameManager(Match(teams[0], teams[1], game_types[0]))
+    updates = UpdateScheduler(manager)
+    display = DisplayWindow(manager, updates=updates)
+    operator = OperatorWindow(
+        manager, teams, game_types, lambda *_: None, display.set_template, updates=updates
+    )
+    display.resize(1280, 720)
+    operator.resize(1000, 700)
+    display.show()
+    operator.show()
+    return manager, updates, display, operator
+
+
+def _wait_pages(display: DisplayWindow, operator: OperatorWindow) -> bool:
+    ready = _pump(15000, lambda: display._page_ready and operator._page_ready)
+    # Margen para que QWebChannel conecte y llegue el estado inicial
+    _pump(500)
+    return ready
+
+
+# -------------------------------------------------
+# 📏 Mediciones
+# -------------------------------------------------
+def bench_slot_to_mutation(manager: GameManager, operator: OperatorWindow, iterations: int) -> Dict[str, object]:
+    bridge = operator._bridge
+    results = {}
+    for name, slot, check in (
+        ("scoreLocal", lambda: bridge.scoreLocal(1), lambda: manager.match.points_local),
+        ("foulVisit", lambda: bridge.foulVisit(1), lambda: manager.match.fouls_visit),
+        ("adjustTime", lambda: bridge.adjustTime(1), lambda: manager.timer.remaining_ms),
+    ):
+        samples = []
+        for _ in range(iterations):
+            before = check()
+            start = time.perf_counter_ns()
+            slot()
+            elapsed = (time.perf_counter_ns() - start) / 1000
+            if check() != before:
+                samples.append(elapsed)
+        results[name] = _summary(samples)
+        _pump(20)  # dejar que el UpdateScheduler refresque entre rondas
+    return {"unit": "us", **results}
+
+
+def bench_build_state(display: DisplayWindow, operator: OperatorWindow, iterations: int) -> Dict[str, object]:
+    state = display._build_state()
+    return {
+        "unit": "us",
+        "display_build_state": _time_us(display._build_state, iterations),
+        "display_build_context": _time_us(lambda: display._build_context(state), iterations),
+        "operator_build_state": _time_us(operator._build_state, iterations),
+        "operator_build_template_context": _time_us(operator._build_template_context, iterations),
+    }
+
+
+def bench_render(display: DisplayWindow, operator: OperatorWindow, iterations: int) -> Dict[str, object]:
+    display_context = display._build_context(display._build_state())
+    operator_context = operator._build_template_context()
+    results = {}
+    for name in sorted(renderer.template_names()):
+        base = operator_context if name.startswith("operator/") else display_context
+
+        def fresh_context(seq: int) -> Dict[str, object]:
+            # Un valor distinto por render fuerza un miss en el LRU de salida
+            state = dict(base["state"], points_local=seq)
+            return dict(base, state=state)
+
+        renderer.invalidate(name)
+        start = time.perf_counter_ns()
+        renderer.render(name, fresh_context(-1))
+        cold_us = (time.perf_counter_ns() - start) / 1000
+
+        counter = iter(range(iterations))
+        uncached = _time_us(lambda: renderer.render(name, fresh_context(next(counter))), iterations)
+        cached_context = fresh_context(-2)
+        renderer.render(name, cached_context)
+        cached = _time_us(lambda: renderer.render(name, cached_context), iterations)
+        # Con clave precalculada (como DisplayWindow y el fan-out): sin fingerprint del contexto
+        renderer.render(name, cached_context, cache_key="bench")
+        keyed = _time_us(lambda: renderer.render(name, cached_context, cache_key="bench"), iterations)
+        results[name] = {"cold": round(cold_us, 2), "uncached": uncached, "cached": cached, "cached_keyed": keyed}
+    return {"unit": "us", "templates": results}
+
+
+def bench_payloads(manager: GameManager, display: DisplayWindow, operator: OperatorWindow) -> Dict[str, int]:
+    now_ms = clock_now_ms(manager)
+    display_payload = json.dumps(dict(display._build_state(), now_ms=now_ms))
+    operator_state = operator._build_state()
+    operator_full = json.dumps({"version": 1, "full": True, "state": operator_state, "now_ms": now_ms})
+
+    manager.score_local(2)
+    changed = operator._build_state()
+    changes = {key: value for key, value in changed.items() if operator_state.get(key) != value}
+    operator_delta = json.dumps({"version": 2, "full": False, "state": changes, "now_ms": now_ms})
+    sse_data = json.dumps(display._build_state(), separators=(",", ":"))
+    return {
+        "display_push": len(display_payload.encode("utf-8")),
+        "operator_full": len(operator_full.encode("utf-8")),
+        "operator_score_delta": len(operator_delta.encode("utf-8")),
+        "sse_frame": len(f"id: 1\ndata: {sse_data}\n\n".encode("utf-8")),
+    }
+
+
+def _install_probe(view, selector: str) -> None:
+    script = """
+    (function () {
+        const el = document.querySelector(%s);
+        if (!el) {
+            document.title = '%smissing';
+            return;
+        }
+        let seq = 0;
+        new MutationObserver(() => {
+            seq += 1;
+            document.title = '%s' + seq;
+        }).observe(el, { childList: true, characterData: true, subtree: true });
+        document.title = '%s0';
+    })();
+    """ % (json.dumps(selector), _PROBE_PREFIX, _PROBE_PREFIX, _PROBE_PREFIX)
+    view.page().runJavaScript(script)
+
+
+def bench_slot_to_dom(manager: GameManager, display: DisplayWindow, operator: OperatorWindow,
+                      iterations: int) -> Dict[str, object]:
+    probes = {
+        "display": (display.view, '[data-field="points_local"]'),
+        "operator": (operator.view, '[data-field="local-score"]'),
+    }
+    counts: Dict[str, int] = {}
+    stamps: Dict[str, int] = {}
+
+    def on_title(name: str):
+        def _record(title: str) -> None:
+            if title.startswith(_PROBE_PREFIX) and title[len(_PROBE_PREFIX):].isdigit():
+                counts[name] = int(title[len(_PROBE_PREFIX):])
+                stamps[name] = time.perf_counter_ns()
+        return _record
+
+    for name, (view, selector) in probes.items():
+        view.titleChanged.connect(on_title(name))
+        _install_probe(view, selector)
+    if not _pump(5000, lambda: all(name in counts for name in probes)):
+        return {"unit": "ms", "error": "probe not installed"}
+
+    samples: Dict[str, List[float]] = {name: [] for name in probes}
+    timeouts = 0
+    for _ in range(iterations):
+        baseline = dict(counts)
+        start = time.perf_counter_ns()
+        manager.score_local(1)
+        if not _pump(_DOM_TIMEOUT_MS, lambda: all(counts[name] > baseline[name] for name in probes)):
+            timeouts += 1
+            break
+        for name in probes:
+            samples[name].append((stamps[name] - start) / 1e6)
+        _pump(20)  # que terminen de aplicarse las mutaciones de esta ronda
+    return {
+        "unit": "ms",
+        "note": "incluye el aviso de vuelta (titleChanged): es una cota superior",
+        "timeouts": timeouts,
+        **{name: _summary(values, 3) for name, values in samples.items()},
+    }
+
+
+def bench_clock(manager: GameManager, display: DisplayWindow, seconds: int) -> Dict[str, object]:
+    timer = manager.timer
+    lateness: List[float] = []
+
+    def on_tick(*_):
+        # El tick debería llegar justo cuando el valor visible cambió:
+        # la diferencia entre lo mostrado y lo que realmente queda es el atraso.
+        if not timer.is_running:
+            return
+        shown_ms = timer.remaining_deciseconds * 100
+        lateness.append(max(0, shown_ms - timer.remaining_ms))
+
+    # Un timer de un frame en el hilo de UI: cuánto se atrasa cada disparo
+    # es el tiempo que el loop estuvo ocupado (recargas, render, bridge)
+    frame_lateness: List[float] = []
+    last_frame = [0]
+
+    def on_frame():
+        now = time.perf_counter_ns()
+        frame_lateness.append(max(0.0, (now - last_frame[0]) / 1e6 - _FRAME_MS))
+        last_frame[0] = now
+
+    frame_timer = QTimer()
+    frame_timer.setInterval(_FRAME_MS)
+    frame_timer.timeout.connect(on_frame)
+    page_loads: List[bool] = []
+    display.view.loadFinished.connect(page_loads.append)
+
+    finished_at: List[float] = []
+    timer.tick.connect(on_tick)
+    timer.finished.connect(lambda: finished_at.append(time.monotonic()))
+    manager.set_time(f"00:{seconds:02d}")
+    cpu_start = _tree_cpu_s(os.getpid())
+    start = time.monotonic()
+    manager.start_time()
+    last_frame[0] = time.perf_counter_ns()
+    frame_timer.start()
+    _pump(seconds * 1000 + 2000, lambda: bool(finished_at))
+    frame_timer.stop()
+    elapsed = time.monotonic() - start
+    cpu = _tree_cpu_s(os.getpid()) - cpu_start
+    timer.tick.disconnect(on_tick)
+    display.view.loadFinished.disconnect(page_loads.append)
+
+    scheduler = manager.timer._scheduler
+    return {
+        "unit": "ms",
+        "period_s": seconds,
+        "tick_lateness": _summary(lateness, 3),
+        "finish_drift": round((finished_at[0] - start - seconds) * 1000, 3) if finished_at else None,
+        "scheduler": type(scheduler).__name__,
+        "cpu_percent": round(100 * cpu / elapsed, 1),
+        "frame_lateness": _summary(frame_lateness, 3),
+        "display_page_loads": len(page_loads),
+    }
+
+
+# -------------------------------------------------
+# ▶️ Entrada
+# -------------------------------------------------
+def run(iterations: int, dom_iterations: int, clock_seconds: int) -> dict:
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setApplicationName("BasketBoard Pro Bench")
+    manager, updates, display, operator = _build_scenario()
+    pages_ready = _wait_pages(display, operator)
+
+    results = {
+        "slot_to_mutation": bench_slot_to_mutation(manager, operator, iterations),
+        "build_state": bench_build_state(display, operator, iterations),
+        "render": bench_render(display, operator, iterations),
+        "payload_bytes": bench_payloads(manager, display, operator),
+        "slot_to_dom": bench_slot_to_dom(manager, display, operator, dom_iterations) if pages_ready
+        else {"unit": "ms", "error": "pages did not load"},
+        "clock": bench_clock(manager, display, clock_seconds),
+        "update_scheduler": updates.stats(),
+    }
+    return {
+        "benchmark": "suite",
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "iterations": iterations,
+            "dom_iterations": dom_iterations,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--dom-iterations", type=int, default=50)
+    parser.add_argument("--clock-seconds", type=int, default=5, help="duración del período de prueba (máx. 59)")
+    parser.add_argument("--output", help="además de imprimirlo, guardar el JSON en este archivo")
+    args = parser.parse_args(argv)
+    result = run(args.iterations, args.dom_iterations, min(59, max(1, args.clock_seconds)))
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark de deriva del reloj de juego bajo bloqueos del event loop.
+
+Corre un período completo con el CountdownTimer basado en deadline y, en
+paralelo, con el algoritmo anterior de paso fijo (restar 1 s / 0,1 s por
+timeout), mientras un QTimer "saboteador" bloquea el loop con sleeps
+aleatorios. Imprime un JSON con el tiempo real transcurrido de cada uno.
+
+Uso:
+    python -m benchmarks.timer_drift --period 10:00 --max-stall-ms 80
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
+
+from core.timer import DECIS_PER_SECOND, CountdownTimer, mmss_to_secs
+
+
+class _FixedStepTimer(QObject):
+    """Réplica del algoritmo previo: resta un paso fijo por cada timeout."""
+
+    finished = Signal()
+
+    def __init__(self, initial_mmss: str):
+        super().__init__()
+        self._remaining_decis = mmss_to_secs(initial_mmss) * DECIS_PER_SECOND
+        self._qtimer = QTimer(self)
+        self._qtimer.timeout.connect(self._on_timeout)
+
+    def start(self):
+        self._qtimer.start(self._interval())
+
+    def _interval(self) -> int:
+        return 1000 if self._remaining_decis > 60 * DECIS_PER_SECOND else 100
+
+    def _on_timeout(self):
+        step = DECIS_PER_SECOND if self._remaining_decis > 60 * DECIS_PER_SECOND else 1
+        self._remaining_decis = max(0, self._remaining_decis - step)
+        if self._remaining_decis <= 0:
+            self._qtimer.stop()
+            self.finished.emit()
+        elif self._qtimer.interval() != self._interval():
+            self._qtimer.setInterval(self._interval())
+
+
+def run(period: str, stall_every_ms: int, max_stall_ms: int, seed: int) -> dict:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    rng = random.Random(seed)
+    nominal = float(mmss_to_secs(period))
+    results = {}
+    stalls = {"count": 0, "total_ms": 0.0}
+
+    def stall():
+        pause_ms = rng.uniform(0, max_stall_ms)
+        time.sleep(pause_ms / 1000)
+        stalls["count"] += 1
+        stalls["total_ms"] += pause_ms
+
+    saboteur = QTimer()
+    saboteur.timeout.connect(stall)
+    saboteur.start(stall_every_ms)
+
+    deadline_timer = CountdownTimer(period)
+    legacy_timer = _FixedStepTimer(period)
+    start = time.monotonic()
+
+    def finished(name):
+        def _record():
+            elapsed = time.monotonic() - start
+            results[name] = {"elapsed_s": round(elapsed, 4), "drift_s": round(elapsed - nominal, 4)}
+            if len(results) == 2:
+                app.quit()
+        return _record
+
+    deadline_timer.finished.connect(finished("deadline"))
+    legacy_timer.finished.connect(finished("fixed_step"))
+    deadline_timer.start()
+    legacy_timer.start()
+    app.exec()
+    saboteur.stop()
+
+    return {
+        "benchmark": "timer_drift",
+        "period_s": nominal,
+        "stall_every_ms": stall_every_ms,
+        "max_stall_ms": max_stall_ms,
+        "stalls": {"count": stalls["count"], "total_ms": round(stalls["total_ms"], 1)},
+        "results": results,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--period", default="10:00", help="Duración del período (MM:SS)")
+    parser.add_argument("--stall-every-ms", type=int, default=250)
+    parser.add_argument("--max-stall-ms", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.period, args.stall_every_ms, args.max_stall_ms, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Comandos del partido por nombre, para aplicarlos en lote (sin Qt).
+
+La API HTTP de control (server/control.py) y el bridge del operador
+(applyCommands) reciben JSON con una lista de comandos:
+
+    [{"op": "score_local", "args": [2]}, {"op": "foul_visit"}]
+
+parse_commands() valida el lote completo antes de tocar el partido: si un
+comando es desconocido o tiene argumentos inválidos no se aplica ninguno.
+Después MatchEngine.apply_commands() los aplica en orden con una sola
+emisión de 'updated' (una sola publicación del estado).
+"""
+
+from typing import Dict, List, Tuple
+
+from utils.timefmt import mmss_to_secs
+
+# Operación -> tipos de sus argumentos (los métodos homónimos de MatchEngine)
+COMMANDS: Dict[str, Tuple[type, ...]] = {
+    "start_pause": (),
+    "start_time": (),
+    "pause_time": (),
+    "reset_time": (),
+    "set_time": (str,),
+    "adjust_time": (int,),
+    "score_local": (int,),
+    "score_visit": (int,),
+    "foul_local": (int,),
+    "foul_visit": (int,),
+    "next_period": (),
+    "set_pregame_countdown": (str,),
+    "start_pregame": (),
+}
+# Argumentos que se pueden omitir (tienen default en el método)
+_OPTIONAL_ARGS = {"foul_local": 1, "foul_visit": 1}
+# Ops cuyo argumento de texto es un tiempo 'MM:SS'
+_MMSS_OPS = frozenset(("set_time", "set_pregame_countdown"))
+
+MAX_COMMANDS = 64
+
+
+class CommandError(ValueError):
+    """Lote inválido; no se aplicó ningún comando."""
+
+
+Command = Tuple[str, tuple]
+
+
+def parse_command(raw: object) -> Command:
+    if not isinstance(raw, dict):
+        raise CommandError(f"Comando inválido (se esperaba un objeto): {raw!r}")
+    op = raw.get("op")
+    if op not in COMMANDS:
+        raise CommandError(f"Comando desconocido: {op!r}")
+    args = raw.get("args", [])
+    if not isinstance(args, list):
+        raise CommandError(f"{op}: 'args' tiene que ser una lista")
+    types = COMMANDS[op]
+    if not len(types) - _OPTIONAL_ARGS.get(op, 0) <= len(args) <= len(types):
+        raise CommandError(f"{op}: se esperaban {len(types)} argumentos, llegaron {len(args)}")
+    for value, expected in zip(args, types):
+        # bool es subclase de int, pero True no es una cantidad de puntos
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise CommandError(f"{op}: argumento inválido {value!r}")
+    if op in _MMSS_OPS:
+        try:
+            mmss_to_secs(args[0])
+        except ValueError as exc:
+            raise CommandError(f"{op}: {exc}")
+    return op, tuple(args)
+
+
+def parse_commands(payload: object) -> List[Command]:
+    """
+    Valida un comando suelto ({"op": ...}), una lista de comandos o un
+    objeto {"commands": [...]}; devuelve [(op, args), ...].
+    """
+    if isinstance(payload, dict) and "commands" in payload:
+        payload = payload["commands"]
+    raw_commands = payload if isinstance(payload, list) else [payload]
+    if not raw_commands:
+        raise CommandError("Lote vacío")
+    if len(raw_commands) > MAX_COMMANDS:
+        raise CommandError(f"Demasiados comandos en un lote (máximo {MAX_COMMANDS})")
+    return [parse_command(raw) for raw in raw_commands]
@@ -1,22 +1,60 @@
+from typing import Dict, List, Optional
+
 from PySide6.QtWidgets import QApplication
-from models.match import Match
 from models.team import Team
 from models.game_type import GameType
 from .game_manager import GameManager
+from .logo_pipeline import logo_pipeline
+from .match_registry import DEFAULT_GAME_TYPE, Court, MatchRegistry
+from .qt_dispatch import MainThreadDispatcher
+from . import storage_manager
 from .storage_manager import load_teams, load_game_types, load_config
+from ui.metrics_panel import MetricsPanel
+from ui.native_display import NATIVE_TEMPLATE
+from ui.update_scheduler import UpdateScheduler
 from ui.windows import OperatorWindow, DisplayWindow
+from utils import logger, metrics
+
+
+class CourtViews:
+    """Ventanas y servicios de una cancha (operador, display y display remoto)."""
+
+    def __init__(self, court: Court, updates: UpdateScheduler, display: DisplayWindow, operator: OperatorWindow):
+        self.court = court
+        self.updates = updates
+        self.display = display
+        self.operator = operator
+        self.fanout = None
+        self.frame_sink = None
+        self.state_block = None
+
+    def publish_remote_state(self) -> None:
+        self.fanout.publish(self.court.manager.snapshots.display_state())
+
+
+def _valid_game_types(presets: List[Dict[str, object]]) -> List[GameType]:
+    """Tipos de juego del JSON; un preset con tiempos inválidos se saltea en vez de frenar el arranque."""
+    game_types = []
+    for preset in presets:
+        try:
+            game_types.append(GameType(**preset))
+        except (TypeError, ValueError) as exc:  # campos faltantes o tiempos 'MM:SS' inválidos
+            logger.warning(f"Tipo de juego ignorado ({preset.get('name', '?')}): {exc}")
+    return game_types
 
 
 class AppController:
     """
     Controlador principal de la aplicación.
     Coordina la lógica del juego, la persistencia de datos y las interfaces gráficas.
+    Con "courts" > 1 en config.json maneja varias canchas a la vez, cada una
+    con su operador y su display.
     """
 
     def __init__(self):
         # --- Cargar configuraciones y presets ---
         self.teams = [Team(**t) for t in load_teams()]
-        self.game_types = [GameType(**g) for g in load_game_types()]
+        self.game_types = _valid_game_types(load_game_types())
         if not self.teams:
             self.teams = [
                 Team("Local", "", "#ff0000", "#ffffff"),
@@ -26,64 +64,176 @@ class AppController:
             self.teams.append(Team("Visitante", "", "#0000ff", "#ffffff"))
 
         if not self.game_types:
-            self.game_types = [GameType("Genérico", 4, "10:00", "02:00", "05:00")]
-        config = load_config()
-
-        # --- Crear partido inicial usando presets ---
-        local = self.teams[0] if self.teams else Team("Local", "", "#ff0000", "#ffffff")
-        visit = self.teams[1] if len(self.teams) > 1 else Team("Visitante", "", "#0000ff", "#ffffff")
-        gtype = self.game_types[0] if self.game_types else GameType("Genérico", 4, "10:00", "02:00", "05:00")
+            self.game_types = [GameType(*DEFAULT_GAME_TYPE)]
+        self.config = load_config()
+
+        # Para volver al hilo de Qt desde hilos de fondo (logos, API de control)
+        self._dispatcher = MainThreadDispatcher()
+
+        # --- Variantes escaladas de los logos, en segundo plano ---
+        logo_pipeline.ready.connect(self._on_logo_ready)
+        logo_pipeline.prepare(team.logo for team in self.teams)
+
+        # --- Métricas: panel oculto (Ctrl+Shift+M en el operador) ---
+        metrics.enable(bool(self.config.get("metrics")))
+        self.metrics_panel = MetricsPanel()
+
+        # --- API HTTP de control para tablets (un servidor para todas las canchas) ---
+        self.control_server = None
+        control_port = int(self.config.get("control_api_port") or 0)
+        if control_port:
+            from server.control import ControlServer
+
+            try:
+                self.control_server = ControlServer(
+                    self._dispatcher.call_soon,
+                    host=self.config.get("control_api_host") or None,
+                    port=control_port,
+                    token=str(self.config.get("control_api_token") or ""),
+                )
+            except ValueError as exc:
+                logger.error(f"API de control desactivada: {exc}")
+
+        # --- Registro de canchas: presets, templates y reloj compartidos ---
+        self.registry = MatchRegistry(self.teams, self.game_types, GameManager)
+        self.views: Dict[int, CourtViews] = {}
+        court_count = max(1, int(self.config.get("courts") or 1))
+        # Con una sola cancha las ventanas conservan sus títulos de siempre
+        self._show_court_names = court_count > 1
+        for _ in range(court_count):
+            self.add_court()
+        if self.control_server is not None:
+            try:
+                self.control_server.start()
+            except OSError as exc:
+                logger.error(f"API de control desactivada: {exc}")
+                self.control_server = None
 
-        match = Match(local, visit, gtype)
-        self.manager = GameManager(match)
-
-        # --- Crear ventanas ---
-        self.display = DisplayWindow(manager=self.manager)
-        self.operator = OperatorWindow(
-            manager=self.manager,
+    # ------------------------------------------------------------------
+    # Canchas
+    # ------------------------------------------------------------------
+    def add_court(self, name: Optional[str] = None) -> CourtViews:
+        """Crea una cancha con sus ventanas (y su display remoto si está activado)."""
+        court = self.registry.add_court(name)
+        metrics.track_engine(court.engine)
+        court_name = court.name if self._show_court_names else None
+
+        # --- Crear ventanas (un refresco por frame, sin importar cuántos emits) ---
+        updates = UpdateScheduler(court.manager)
+        display = DisplayWindow(
+            manager=court.manager,
+            template_name=NATIVE_TEMPLATE if self.config.get("native_display") else None,
+            updates=updates,
+            court_name=court_name,
+        )
+        operator = OperatorWindow(
+            manager=court.manager,
             teams=self.teams,
             game_types=self.game_types,
-            on_create_match=self.configure_match,
-            on_set_display_template=self.set_display_template,
-            initial_display_template=self.display.template_name,
+            on_create_match=lambda local, visit, game_type: self.configure_match(
+                court.court_id, local, visit, game_type
+            ),
+            on_set_display_template=display.set_template,
+            initial_display_template=display.template_name,
+            updates=updates,
+            court_name=court_name,
+            metrics_panel=self.metrics_panel,
         )
+        views = CourtViews(court, updates, display, operator)
+
+        # --- Displays remotos en la LAN (un puerto por cancha a partir del configurado) ---
+        remote_port = int(self.config.get("remote_display_port") or 0)
+        if remote_port:
+            from server.fanout import FanoutServer
+
+            fanout = FanoutServer(
+                port=remote_port + court.court_id - 1,
+                clock_ms=court.manager.timer.monotonic_ms,
+            )
+            try:
+                fanout.start()
+            except OSError as exc:
+                logger.error(f"Display remoto de la cancha {court.court_id} desactivado: {exc}")
+            else:
+                views.fanout = fanout
+                updates.register(views.publish_remote_state)
+                views.publish_remote_state()
+
+        # --- Frames RGBA para overlays de transmisión (sin capturar la pantalla) ---
+        if self.config.get("frame_output"):
+            from ui.frame_sink import frame_sink_from_config
+
+            views.frame_sink = frame_sink_from_config(court.manager, self.config, court.court_id)
+            views.frame_sink.start()
+
+        if self.control_server is not None:
+            self.control_server.add_court(court.court_id, court.manager)
+
+        # --- Estado en memoria compartida para gráficas y estadísticas externas ---
+        if self.config.get("state_block"):
+            from .state_block import StateBlockWriter
+
+            block_name = self.config.get("state_block_name") or "bbp-state"
+            views.state_block = StateBlockWriter(f"{block_name}-{court.court_id}")
+            views.state_block.track(court.engine)
 
         # --- Ajustar tamaños iniciales ---
-        self.operator.resize(1000, 700)
-        self.display.resize(1280, 720)
+        operator.resize(1000, 700)
+        display.resize(1280, 720)
 
         # --- Conectar sirena a feedback visual (o sonido real en el futuro) ---
-        self.manager.siren.connect(self.display.beep)
+        court.manager.siren.connect(display.beep)
+
+        self.views[court.court_id] = views
+        return views
 
     def show(self):
-        """Muestra las ventanas del operador y del display."""
+        """Muestra las ventanas de operador y display de cada cancha."""
         screens = QApplication.screens()
-        if len(screens) > 1:
-            # Si hay dos monitores, mostrar display en el segundo
-            geometry = screens[1].geometry()
-            self.display.move(geometry.left() + 40, geometry.top() + 40)
-
-        self.display.show()
-        self.operator.show()
+        for index, views in enumerate(self.views.values()):
+            if len(screens) > 1:
+                # Displays a partir del segundo monitor (en cascada si no alcanzan)
+                screen = screens[1 + index % (len(screens) - 1)]
+                geometry = screen.geometry()
+                offset = 40 * (1 + index // (len(screens) - 1))
+                views.display.move(geometry.left() + offset, geometry.top() + offset)
+            elif index:
+                views.display.move(40 * index, 40 * index)
+                views.operator.move(40 * index, 40 * index)
+
+            views.display.show()
+            views.operator.show()
+
+    def shutdown(self) -> None:
+        """Cierre ordenado: journals marcados como sesión limpia y guardados pendientes en disco."""
+        if self.control_server is not None:
+            self.control_server.stop()
+        for views in self.views.values():
+            if views.fanout is not None:
+                views.fanout.stop()
+            if views.frame_sink is not None:
+                views.frame_sink.stop()
+            if views.state_block is not None:
+                views.state_block.close()
+        self.registry.shutdown()
+        logo_pipeline.ready.disconnect(self._on_logo_ready)
+        logo_pipeline.shutdown()
+        storage_manager.flush()
+        if metrics.enabled:
+            metrics.export()
+
+    def _on_logo_ready(self, _logo: str) -> None:
+        # Hilo de fondo del pipeline: los displays se refrescan en el de Qt
+        self._dispatcher.call_soon(self._reload_logos)
+
+    def _reload_logos(self) -> None:
+        for views in self.views.values():
+            views.display.reload_logos()
+            if views.frame_sink is not None:
+                views.frame_sink.reload_logos()
 
     # ------------------------------------------------------------------
     # Interacciones desencadenadas por la interfaz web
     # ------------------------------------------------------------------
-    def configure_match(self, local_index: int, visit_index: int, game_type_index: int) -> None:
-        if not self.teams:
-            return
-
-        local_index = max(0, min(local_index, len(self.teams) - 1))
-        visit_index = max(0, min(visit_index, len(self.teams) - 1))
-        local = self.teams[local_index]
-        visit = self.teams[visit_index]
-
-        game_type_index = max(0, min(game_type_index, len(self.game_types) - 1))
-        game_type = self.game_types[game_type_index] if self.game_types else GameType("Genérico", 4, "10:00", "02:00", "05:00")
-
-        match = Match(local, visit, game_type)
-        self.manager.configure_match(match)
-
-    def set_display_template(self, template_name: str) -> None:
-        self.display.set_template(template_name)
-
+    def configure_match(self, court_id: int, local_index: int, visit_index: int, game_type_index: int) -> None:
+        self.registry.configure_match(court_id, local_index, visit_index, game_type_index)
@@ -0,0 +1,217 @@
+"""
+Motor del partido en Python puro (sin Qt).
+
+Puntos, faltas, períodos, reloj de juego y countdown previo viven acá; la
+aplicación Qt lo usa a través de core.game_manager.GameManager y los
+servicios o workers de test pueden importarlo sin cargar PySide6.
+"""
+
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+from models.match import Match
+
+from .events import Event
+from .timer import CountdownTimer, Scheduler
+
+
+class MatchEngine:
+    """
+    Controla la lógica del partido de básquet.
+    Se encarga del cronómetro, puntos, faltas, períodos y sirena.
+    Con un 'scheduler' virtual (core.timer.VirtualClock) el partido corre
+    tan rápido como se avance el reloj.
+    Eventos:
+      - updated(): hay que refrescar la interfaz
+      - siren(): terminó el tiempo o el countdown
+      - action(str op, tuple args): se aplicó una mutación (journal, auditoría)
+    """
+
+    def __init__(self, match, scheduler: Optional[Scheduler] = None):
+        self.updated = Event()
+        self.siren = Event()
+        self.action = Event()
+        self.match = match
+        self.scheduler = scheduler
+        # Lotes en curso (batch()): 'updated' se difiere hasta el final
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        # --- Timer principal del juego ---
+        # Los ticks no refrescan la interfaz: las vistas animan el reloj a
+        # partir de timer.clock_descriptor(), que sólo cambia con las
+        # acciones de tiempo (todas emiten 'updated').
+        self.timer = CountdownTimer(match.game_type.time_per_quarter, scheduler=scheduler)
+        self.timer.finished.connect(self._on_period_finished)
+
+        # --- Timer para countdown previo al partido ---
+        self.countdown = CountdownTimer("00:00", scheduler=scheduler)
+        self.countdown.finished.connect(self._on_countdown_finished)
+
+    # -------------------------------------------------
+    # 🕐 Control del tiempo del partido
+    # -------------------------------------------------
+    def start_pause(self):
+        """Inicia o pausa el cronómetro del partido."""
+        if self.timer.remaining_secs <= 0:
+            return
+        if self.timer.is_running:
+            self.timer.pause()
+        else:
+            self.timer.start()
+        self.action.emit("start_pause", ())
+        self._notify()
+
+    def start_time(self) -> None:
+        """Inicia el cronómetro si hay tiempo disponible."""
+
+        if self.timer.remaining_secs <= 0:
+            return
+        self.timer.start()
+        self.action.emit("start_time", ())
+        self._notify()
+
+    def pause_time(self) -> None:
+        """Pausa el cronómetro del partido."""
+
+        self.timer.pause()
+        self.action.emit("pause_time", ())
+        self._notify()
+
+    def reset_time(self):
+        """Reinicia el tiempo del cuarto actual."""
+        self.timer.reset_secs(self.match.game_type.time_per_quarter_secs)
+        self.action.emit("reset_time", ())
+        self._notify()
+
+    def set_time(self, mmss: str):
+        """Ajusta manualmente el tiempo restante."""
+        self.timer.reset(mmss)
+        self.action.emit("set_time", (mmss,))
+        self._notify()
+
+    def adjust_time(self, delta_secs: int) -> None:
+        """Suma o resta segundos al tiempo restante del período."""
+
+        self.timer.adjust_seconds(delta_secs)
+        self.action.emit("adjust_time", (delta_secs,))
+        self._notify()
+
+    # -------------------------------------------------
+    # 🏀 Control del marcador
+    # -------------------------------------------------
+    def score_local(self, pts: int):
+        """Suma o resta puntos al equipo local."""
+        self.match.points_local = max(0, self.match.points_local + pts)
+        self.action.emit("score_local", (pts,))
+        self._notify()
+
+    def score_visit(self, pts: int):
+        """Suma o resta puntos al equipo visitante."""
+        self.match.points_visit = max(0, self.match.points_visit + pts)
+        self.action.emit("score_visit", (pts,))
+        self._notify()
+
+    # -------------------------------------------------
+    # 🚫 Control de faltas
+    # -------------------------------------------------
+    def foul_local(self, delta: int = 1):
+        """Incrementa o decrementa las faltas del equipo local."""
+        self.match.fouls_local = max(0, self.match.fouls_local + delta)
+        self.action.emit("foul_local", (delta,))
+        self._notify()
+
+    def foul_visit(self, delta: int = 1):
+        """Incrementa o decrementa las faltas del equipo visitante."""
+        self.match.fouls_visit = max(0, self.match.fouls_visit + delta)
+        self.action.emit("foul_visit", (delta,))
+        self._notify()
+
+    # -------------------------------------------------
+    # 🔢 Control del período
+    # -------------------------------------------------
+    def next_period(self):
+        """Avanza al siguiente período y resetea faltas y tiempo."""
+        with self.batch():
+            self.match.current_period += 1
+            self.reset_time()
+            self.match.fouls_local = 0
+            self.match.fouls_visit = 0
+            self.action.emit("next_period", ())
+            self._notify()
+
+    # -------------------------------------------------
+    # ⏳ Countdown previo al inicio del partido
+    # -------------------------------------------------
+    def set_pregame_countdown(self, mmss: str):
+        """Configura la cuenta regresiva antes del partido."""
+        self.countdown.reset(mmss)
+        self.action.emit("set_pregame_countdown", (mmss,))
+        self._notify()
+
+    def start_pregame(self):
+        """Inicia el countdown previo (si se configuró un tiempo > 0)."""
+        if self.countdown.remaining_secs > 0:
+            self.countdown.start()
+            self.action.emit("start_pregame", ())
+            self._notify()
+
+    # -------------------------------------------------
+    # 🔁 Configuración completa del partido
+    # -------------------------------------------------
+    def configure_match(self, match: Match):
+        """Reemplaza el partido actual por uno nuevo y reinicia temporizadores."""
+        self.timer.pause()
+        self.countdown.pause()
+        self.match = match
+        self.timer.reset_secs(self.match.game_type.time_per_quarter_secs)
+        self.countdown.reset("00:00")
+        self.action.emit("configure_match", (match,))
+        self._notify()
+
+    # -------------------------------------------------
+    # 📦 Lotes de comandos
+    # -------------------------------------------------
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Agrupa acciones: 'updated' se emite una sola vez al final (si hubo alguna)."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.updated.emit()
+
+    def apply_commands(self, commands: Iterable[tuple]) -> None:
+        """
+        Aplica en orden comandos ya validados por core.commands.parse_commands
+        ([(op, args), ...]) con una sola emisión de 'updated'.
+        """
+        with self.batch():
+            for op, args in commands:
+                getattr(self, op)(*args)
+
+    # -------------------------------------------------
+    # 🔔 Eventos internos
+    # -------------------------------------------------
+    def _notify(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self.updated.emit()
+
+    def _on_period_finished(self):
+        """Se ejecuta cuando el reloj llega a 0:00."""
+        self.action.emit("period_finished", ())
+        self.siren.emit()
+        self._notify()
+
+    def _on_countdown_finished(self):
+        """Cuando termina la cuenta regresiva previa, suena la sirena e inicia el partido."""
+        self.siren.emit()
+        self.timer.start()
+        self.action.emit("countdown_finished", ())
+        self._notify()
+
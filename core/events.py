@@ -0,0 +1,34 @@
+"""
+Despacho de eventos liviano, sin dependencias de Qt.
+
+Imita la parte de la API de Signal que usa el proyecto (connect, disconnect,
+emit) para que el motor del partido funcione igual dentro de la aplicación
+Qt, en servicios y en workers de test.
+"""
+
+from typing import Callable, List
+
+
+class Event:
+    """Lista de callbacks que se invocan en orden de conexión."""
+
+    __slots__ = ("_callbacks",)
+
+    def __init__(self):
+        self._callbacks: List[Callable] = []
+
+    def connect(self, callback: Callable) -> None:
+        """Registra un callback; recibe los mismos argumentos que emit()."""
+        self._callbacks.append(callback)
+
+    def disconnect(self, callback: Callable = None) -> None:
+        """Quita un callback (o todos si no se indica ninguno)."""
+        if callback is None:
+            self._callbacks.clear()
+        else:
+            self._callbacks.remove(callback)
+
+    def emit(self, *args) -> None:
+        # Copia para tolerar conexiones/desconexiones durante el despacho
+        for callback in tuple(self._callbacks):
+            callback(*args)
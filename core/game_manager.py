@@ -1,151 +1,124 @@
+from typing import Iterable, Optional
+
 from PySide6.QtCore import QObject, Signal
 
 from models.match import Match
 
-from .timer import CountdownTimer, mmss_to_secs
+from .engine import MatchEngine
+from .state import StateSnapshots
+from .timer import CountdownTimer, Scheduler
 
 
 class GameManager(QObject):
     """
-    Controla la lógica del partido de básquet.
-    Se encarga del cronómetro, puntos, faltas, períodos y sirena.
+    Adaptador Qt del motor del partido (core.engine.MatchEngine).
+    Re-emite los eventos del motor como señales Qt y mantiene la API que
+    usan las ventanas y el controlador.
     """
 
     updated = Signal()   # Se emite cuando hay que refrescar la interfaz
     siren = Signal()     # Se emite cuando termina el tiempo o countdown
 
-    def __init__(self, match):
+    def __init__(self, match, scheduler: Optional[Scheduler] = None):
         super().__init__()
-        self.match = match
+        self.engine = MatchEngine(match, scheduler)
+        # Primero los snapshots: cuando las ventanas reciben 'updated' la
+        # versión anterior ya está invalidada.
+        self.snapshots = StateSnapshots(self.engine)
+        self.engine.updated.connect(self.updated.emit)
+        self.engine.siren.connect(self.siren.emit)
+
+    # -------------------------------------------------
+    # 📦 Estado expuesto por el motor
+    # -------------------------------------------------
+    @property
+    def match(self) -> Match:
+        return self.engine.match
+
+    @property
+    def timer(self) -> CountdownTimer:
+        return self.engine.timer
 
-        # --- Timer principal del juego ---
-        self.timer = CountdownTimer(match.game_type.time_per_quarter)
-        self.timer.tick.connect(self._on_tick)
-        self.timer.finished.connect(self._on_period_finished)
+    @property
+    def countdown(self) -> CountdownTimer:
+        return self.engine.countdown
 
-        # --- Timer para countdown previo al partido ---
-        self.countdown = CountdownTimer("00:00")
-        self.countdown.finished.connect(self._on_countdown_finished)
+    @property
+    def scheduler(self) -> Optional[Scheduler]:
+        return self.engine.scheduler
 
     # -------------------------------------------------
     # 🕐 Control del tiempo del partido
     # -------------------------------------------------
     def start_pause(self):
         """Inicia o pausa el cronómetro del partido."""
-        if self.timer.remaining_secs <= 0:
-            return
-        if self.timer._qtimer.isActive():
-            self.timer.pause()
-        else:
-            self.timer.start()
-        self.updated.emit()
+        self.engine.start_pause()
 
     def start_time(self) -> None:
         """Inicia el cronómetro si hay tiempo disponible."""
-
-        if self.timer.remaining_secs <= 0:
-            return
-        self.timer.start()
-        self.updated.emit()
+        self.engine.start_time()
 
     def pause_time(self) -> None:
         """Pausa el cronómetro del partido."""
-
-        self.timer.pause()
-        self.updated.emit()
+        self.engine.pause_time()
 
     def reset_time(self):
         """Reinicia el tiempo del cuarto actual."""
-        self.timer.reset(self.match.game_type.time_per_quarter)
-        self.updated.emit()
+        self.engine.reset_time()
 
     def set_time(self, mmss: str):
         """Ajusta manualmente el tiempo restante."""
-        self.timer.reset(mmss)
-        self.updated.emit()
+        self.engine.set_time(mmss)
 
     def adjust_time(self, delta_secs: int) -> None:
         """Suma o resta segundos al tiempo restante del período."""
-
-        self.timer.adjust_seconds(delta_secs)
-        self.updated.emit()
+        self.engine.adjust_time(delta_secs)
 
     # -------------------------------------------------
-    # 🏀 Control del marcador
+    # 🏀 Marcador, faltas y períodos
     # -------------------------------------------------
     def score_local(self, pts: int):
         """Suma o resta puntos al equipo local."""
-        self.match.points_local = max(0, self.match.points_local + pts)
-        self.updated.emit()
+        self.engine.score_local(pts)
 
     def score_visit(self, pts: int):
         """Suma o resta puntos al equipo visitante."""
-        self.match.points_visit = max(0, self.match.points_visit + pts)
-        self.updated.emit()
+        self.engine.score_visit(pts)
 
-    # -------------------------------------------------
-    # 🚫 Control de faltas
-    # -------------------------------------------------
     def foul_local(self, delta: int = 1):
         """Incrementa o decrementa las faltas del equipo local."""
-        self.match.fouls_local = max(0, self.match.fouls_local + delta)
-        self.updated.emit()
+        self.engine.foul_local(delta)
 
     def foul_visit(self, delta: int = 1):
         """Incrementa o decrementa las faltas del equipo visitante."""
-        self.match.fouls_visit = max(0, self.match.fouls_visit + delta)
-        self.updated.emit()
+        self.engine.foul_visit(delta)
 
-    # -------------------------------------------------
-    # 🔢 Control del período
-    # -------------------------------------------------
     def next_period(self):
         """Avanza al siguiente período y resetea faltas y tiempo."""
-        self.match.current_period += 1
-        self.reset_time()
-        self.match.fouls_local = 0
-        self.match.fouls_visit = 0
-        self.updated.emit()
+        self.engine.next_period()
 
     # -------------------------------------------------
-    # ⏳ Countdown previo al inicio del partido
+    # ⏳ Countdown previo y configuración del partido
     # -------------------------------------------------
     def set_pregame_countdown(self, mmss: str):
         """Configura la cuenta regresiva antes del partido."""
-        self.countdown.reset(mmss)
+        self.engine.set_pregame_countdown(mmss)
 
     def start_pregame(self):
         """Inicia el countdown previo (si se configuró un tiempo > 0)."""
-        if mmss_to_secs(self.countdown.remaining_mmss) > 0:
-            self.countdown.start()
-            self.updated.emit()
+        self.engine.start_pregame()
 
-    # -------------------------------------------------
-    # 🔁 Configuración completa del partido
-    # -------------------------------------------------
     def configure_match(self, match: Match):
         """Reemplaza el partido actual por uno nuevo y reinicia temporizadores."""
-        self.timer.pause()
-        self.countdown.pause()
-        self.match = match
-        self.timer.reset(self.match.game_type.time_per_quarter)
-        self.countdown.reset("00:00")
-        self.updated.emit()
+        self.engine.configure_match(match)
 
     # -------------------------------------------------
-    # 🔔 Eventos internos
+    # 📦 Lotes de comandos
     # -------------------------------------------------
-    def _on_tick(self, *_):
-        self.updated.emit()
-
-    def _on_period_finished(self):
-        """Se ejecuta cuando el reloj llega a 0:00."""
-        self.siren.emit()
-        self.updated.emit()
-
-    def _on_countdown_finished(self):
-        """Cuando termina la cuenta regresiva previa, suena la sirena e inicia el partido."""
-        self.siren.emit()
-        self.timer.start()
-        self.updated.emit()
-
+    def apply_commands(self, commands: Iterable[tuple]) -> int:
+        """
+        Aplica un lote validado (core.commands.parse_commands) con una sola
+        emisión de 'updated' y devuelve la versión del estado resultante.
+        """
+        self.engine.apply_commands(commands)
+        return self.snapshots.version
@@ -0,0 +1,323 @@
+"""
+Journal append-only del partido en vivo, con recuperación ante caídas.
+
+Cada mutación del MatchEngine se agrega como un registro JSON compacto de
+una línea. Un hilo escritor agrupa los registros pendientes y hace un único
+fsync por lote (group commit), así el hilo de la UI nunca espera al disco.
+Periódicamente se escribe un snapshot atómico y se descartan los segmentos
+anteriores: la recuperación carga el snapshot y re-aplica sólo la cola.
+
+Formato de registro:
+    {"s": seq, "w": epoch_ms, "o": op, "a": [args], "c": [timer_ms, corriendo, countdown_ms, corriendo]}
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+from .storage_manager import DATA_DIR, write_text_atomic
+
+JOURNAL_DIR = DATA_DIR / "journal"
+
+_SNAPSHOT_FILE = "snapshot.json"
+_SEGMENT_PREFIX = "journal."
+_SEGMENT_SUFFIX = ".log"
+
+
+# -------------------------------------------------
+# 🧮 Estado plano del partido (lo que se persiste)
+# -------------------------------------------------
+def _match_config(match: Match) -> List[Dict[str, Any]]:
+    return [match.team_local.to_dict(), match.team_visit.to_dict(), match.game_type.to_dict()]
+
+
+def _empty_state(config: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "config": config,
+        "period": 1,
+        "points_local": 0,
+        "points_visit": 0,
+        "fouls_local": 0,
+        "fouls_visit": 0,
+        "clock": [0, 0, 0, 0],
+    }
+
+
+def _engine_state(engine) -> Dict[str, Any]:
+    match = engine.match
+    state = _empty_state(_match_config(match))
+    state.update(
+        period=match.current_period,
+        points_local=match.points_local,
+        points_visit=match.points_visit,
+        fouls_local=match.fouls_local,
+        fouls_visit=match.fouls_visit,
+        clock=_clock_state(engine),
+    )
+    return state
+
+
+def _clock_state(engine) -> List[int]:
+    return [
+        engine.timer.remaining_ms,
+        int(engine.timer.is_running),
+        engine.countdown.remaining_ms,
+        int(engine.countdown.is_running),
+    ]
+
+
+def _apply(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Re-aplica un registro del journal sobre el estado plano."""
+    op = record["o"]
+    args = record.get("a") or []
+    if op == "configure_match":
+        state.update(_empty_state(args))
+    elif op in ("score_local", "score_visit"):
+        key = "points_" + op.split("_", 1)[1]
+        state[key] = max(0, state[key] + int(args[0]))
+    elif op in ("foul_local", "foul_visit"):
+        key = "fouls_" + op.split("_", 1)[1]
+        state[key] = max(0, state[key] + int(args[0]))
+    elif op == "next_period":
+        state["period"] += 1
+        state["fouls_local"] = 0
+        state["fouls_visit"] = 0
+    # Todas las operaciones guardan el estado de los relojes tras aplicarse
+    if "c" in record:
+        state["clock"] = record["c"]
+
+
+class RecoveredMatch:
+    """Partido reconstruido desde el snapshot + la cola del journal."""
+
+    def __init__(self, state: Dict[str, Any], seq: int, replayed: int, clean: bool):
+        self.state = state
+        self.seq = seq
+        self.replayed = replayed
+        # True si la aplicación se cerró normalmente (no hubo caída)
+        self.clean = clean
+
+    def build_match(self) -> Match:
+        local, visit, game_type = self.state["config"]
+        match = Match(Team.from_dict(local), Team.from_dict(visit), GameType.from_dict(game_type))
+        match.current_period = self.state["period"]
+        match.points_local = self.state["points_local"]
+        match.points_visit = self.state["points_visit"]
+        match.fouls_local = self.state["fouls_local"]
+        match.fouls_visit = self.state["fouls_visit"]
+        return match
+
+    def restore(self, engine) -> None:
+        """
+        Aplica el estado al motor. Los relojes quedan en pausa con el último
+        tiempo registrado: el operador decide cuándo reanudar.
+        """
+        # Una sola publicación, ya con los relojes restaurados
+        with engine.batch():
+            engine.configure_match(self.build_match())
+            timer_ms, _, countdown_ms, _ = self.state["clock"]
+            engine.timer.set_remaining_ms(timer_ms)
+            engine.countdown.set_remaining_ms(countdown_ms)
+
+
+class MatchJournal:
+    """
+    Journal del partido asociado a un MatchEngine.
+    - commit_interval_ms: ventana de agrupamiento antes de cada fsync.
+    - snapshot_every: cantidad de registros entre snapshots.
+    - snapshot_interval_s: con el reloj corriendo, antigüedad máxima del
+      último snapshot (acota el tiempo de reloj perdido ante una caída).
+    """
+
+    def __init__(
+        self,
+        directory: Path = JOURNAL_DIR,
+        commit_interval_ms: int = 20,
+        snapshot_every: int = 500,
+        snapshot_interval_s: float = 5.0,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._commit_interval = commit_interval_ms / 1000
+        self._snapshot_every = snapshot_every
+        self._snapshot_interval_ms = int(snapshot_interval_s * 1000)
+
+        self._engine = None
+        self._seq = _last_seq(self.directory)
+        self._since_snapshot = 0
+        # En ms del planificador del motor (VirtualClock en simulaciones)
+        self._last_snapshot_at = 0
+
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._writer = threading.Thread(target=self._run, name="match-journal", daemon=True)
+        self._writer.start()
+
+    # -------------------------------------------------
+    # 🔌 Conexión con el motor
+    # -------------------------------------------------
+    def attach(self, engine) -> None:
+        """Empieza a registrar las mutaciones del motor (con snapshot inicial)."""
+        self._engine = engine
+        engine.action.connect(self._on_action)
+        engine.timer.tick.connect(self._on_tick)
+        self.snapshot()
+
+    def _on_action(self, op: str, args: tuple) -> None:
+        if op == "configure_match":
+            args = _match_config(args[0])
+        self._seq += 1
+        record = {
+            "s": self._seq,
+            "w": int(time.time() * 1000),
+            "o": op,
+            "a": list(args),
+            "c": _clock_state(self._engine),
+        }
+        self._queue.put(("record", json.dumps(record, ensure_ascii=False, separators=(",", ":"))))
+        self._since_snapshot += 1
+        if op == "configure_match" or self._since_snapshot >= self._snapshot_every:
+            self.snapshot()
+
+    def _on_tick(self, *_):
+        timer = self._engine.timer
+        if timer.is_running and timer.monotonic_ms() - self._last_snapshot_at >= self._snapshot_interval_ms:
+            self.snapshot()
+
+    # -------------------------------------------------
+    # 📸 Snapshots y cierre
+    # -------------------------------------------------
+    def snapshot(self, clean: bool = False) -> None:
+        """Encola un snapshot del estado actual (capturado en este hilo)."""
+        if self._engine is None:
+            return
+        state = _engine_state(self._engine)
+        state["s"] = self._seq
+        state["w"] = int(time.time() * 1000)
+        if clean:
+            state["clean"] = True
+        self._since_snapshot = 0
+        self._last_snapshot_at = self._engine.timer.monotonic_ms()
+        self._queue.put(("snapshot", state))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Espera a que todo lo encolado esté en disco (fsync)."""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait(timeout)
+
+    def close(self) -> None:
+        """Escribe un snapshot final y detiene el hilo escritor."""
+        if self._engine is not None:
+            self._engine.action.disconnect(self._on_action)
+            self._engine.timer.tick.disconnect(self._on_tick)
+            self.snapshot(clean=True)
+            self._engine = None
+        self._queue.put(("close", None))
+        self._writer.join()
+
+    # -------------------------------------------------
+    # ✍️ Hilo escritor (group commit)
+    # -------------------------------------------------
+    def _segment_path(self, first_seq: int) -> Path:
+        return self.directory / f"{_SEGMENT_PREFIX}{first_seq:012d}{_SEGMENT_SUFFIX}"
+
+    def _run(self) -> None:
+        segment = self._segment_path(self._seq + 1).open("a", encoding="utf-8")
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._commit_interval
+            while batch[-1][0] == "record":
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            dirty = False
+            for kind, payload in batch:
+                if kind == "record":
+                    segment.write(payload + "\n")
+                    dirty = True
+                    continue
+                if dirty:
+                    _sync(segment)
+                    dirty = False
+                if kind == "snapshot":
+                    segment = self._write_snapshot(segment, payload)
+                elif kind == "flush":
+                    payload.set()
+                elif kind == "close":
+                    running = False
+            if dirty:
+                _sync(segment)
+        segment.close()
+
+    def _write_snapshot(self, segment, state: Dict[str, Any]):
+        """Persiste el snapshot y rota a un segmento nuevo, borrando los viejos."""
+        write_text_atomic(self.directory / _SNAPSHOT_FILE, json.dumps(state, ensure_ascii=False))
+        segment.close()
+        current = self._segment_path(state["s"] + 1)
+        for path in _segments(self.directory):
+            if path != current:
+                path.unlink(missing_ok=True)
+        return current.open("a", encoding="utf-8")
+
+    # -------------------------------------------------
+    # ♻️ Recuperación
+    # -------------------------------------------------
+    @staticmethod
+    def recover(directory: Path = JOURNAL_DIR) -> Optional[RecoveredMatch]:
+        """Reconstruye el último partido registrado (None si no hay journal)."""
+        directory = Path(directory)
+        snapshot_path = directory / _SNAPSHOT_FILE
+        if not snapshot_path.exists():
+            return None
+        with snapshot_path.open("r", encoding="utf-8") as f:
+            state = json.load(f)
+        seq = state.pop("s", 0)
+        state.pop("w", None)
+        clean = state.pop("clean", False)
+
+        replayed = 0
+        for path in _segments(directory):
+            with path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # última línea truncada por la caída
+                    if record["s"] <= seq:
+                        continue
+                    _apply(state, record)
+                    seq = record["s"]
+                    replayed += 1
+                    clean = False
+        return RecoveredMatch(state, seq, replayed, clean)
+
+
+# -------------------------------------------------
+# 🔧 Utilidades de archivo
+# -------------------------------------------------
+def _segments(directory: Path) -> List[Path]:
+    return sorted(directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"))
+
+
+def _last_seq(directory: Path) -> int:
+    recovered = MatchJournal.recover(directory)
+    return recovered.seq if recovered else 0
+
+
+def _sync(handle) -> None:
+    handle.flush()
+    os.fsync(handle.fileno())
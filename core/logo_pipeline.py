@@ -0,0 +1,179 @@
+"""
+Variantes pre-escaladas de los logos de los equipos.
+
+Los logos de las ligas suelen venir en PNG de varios megas y el navegador
+los decodificaba y achicaba en cada render del display. Al cargar (o
+guardar) los presets, un hilo de fondo genera una copia PNG por tamaño de
+display, nombrada por el hash del contenido:
+
+    data/cache/logos/<hash>-<px>.png
+
+Así un logo que no cambió se reutiliza entre ejecuciones y uno que cambió
+genera variantes nuevas. Desde el hilo de Qt sólo se consulta un dict
+(variant()); mientras la variante no está lista se usa el original y el
+evento 'ready' avisa cuando llega (para refrescar los displays).
+"""
+
+import hashlib
+import io
+import math
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils import logger
+
+from .events import Event
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+LOGO_CACHE_DIR = ROOT_DIR / "data" / "cache" / "logos"
+
+# Lado máximo (px CSS) del logo en cada template de display; cada ventana
+# lo multiplica por su devicePixelRatio. Los templates sin entrada usan el default.
+DISPLAY_LOGO_CSS_PX: Dict[str, int] = {
+    "display/scoreboard_widescreen/index.html": 220,
+}
+DEFAULT_LOGO_PX = 256
+# Densidades de pantalla para las que se generan variantes (1x y HiDPI)
+_PIXEL_RATIOS = (1, 2)
+
+# Formatos vectoriales: el navegador los escala sin costo, no se tocan
+_VECTOR_SUFFIXES = (".svg", ".svgz")
+
+
+def logo_size_for(template_name: str, pixel_ratio: float = 1.0) -> int:
+    """Lado en px físicos del logo de 'template_name' en una pantalla con 'pixel_ratio'."""
+    css_px = DISPLAY_LOGO_CSS_PX.get(template_name)
+    if css_px is None:
+        return DEFAULT_LOGO_PX
+    return math.ceil(css_px * pixel_ratio)
+
+
+def _default_sizes() -> Iterable[int]:
+    sizes = {DEFAULT_LOGO_PX}
+    for css_px in DISPLAY_LOGO_CSS_PX.values():
+        sizes.update(css_px * ratio for ratio in _PIXEL_RATIOS)
+    return sizes
+
+
+class LogoPipeline:
+    """
+    Genera y recuerda las variantes de cada logo.
+    - prepare(logos): encola los logos nuevos o modificados (no bloquea)
+    - variant(logo, px): ruta de la variante lista, o el logo original
+    - wait(): espera a que termine la cola (benchmarks, cierre)
+    - ready(logo): hay variantes nuevas de 'logo'; se emite desde el hilo
+      de fondo, quien refresca tiene que volver al hilo de Qt
+    """
+
+    def __init__(
+        self,
+        root: Path = ROOT_DIR,
+        cache_dir: Path = LOGO_CACHE_DIR,
+        sizes: Iterable[int] = (),
+    ):
+        self._root = root
+        self._cache_dir = cache_dir
+        self._sizes = tuple(sorted(set(sizes) or _default_sizes()))
+        self.ready = Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # logo -> (mtime_ns, ((px, ruta relativa de la variante), ...) de menor a mayor)
+        self._variants: Dict[str, Tuple[int, Tuple[Tuple[int, str], ...]]] = {}
+        self._pending: Dict[str, Future] = {}
+
+    # -------------------------------------------------
+    # 📥 Encolar (hilo de Qt)
+    # -------------------------------------------------
+    def prepare(self, logos: Iterable[str]) -> None:
+        """Encola en el hilo de fondo los logos que todavía no se procesaron."""
+        with self._lock:
+            for logo in logos:
+                if not logo or logo in self._pending or logo.lower().endswith(_VECTOR_SUFFIXES):
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logo-pipeline")
+                self._pending[logo] = self._executor.submit(self._process, logo)
+
+    def variant(self, logo: str, size_px: int) -> str:
+        """La variante más chica que cubre 'size_px', o el logo original."""
+        entry = self._variants.get(logo)
+        if entry is None:
+            return logo
+        for px, relative in entry[1]:
+            if px >= size_px:
+                return relative
+        return logo
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            try:
+                future.result(timeout)
+            except Exception:
+                return False
+        return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------------------------
+    # 🖼️ Procesamiento (hilo de fondo)
+    # -------------------------------------------------
+    def _process(self, logo: str) -> None:
+        changed = False
+        try:
+            changed = self._build_variants(logo)
+        except Exception as exc:  # un logo roto no debe frenar al resto
+            logger.warning(f"No se pudo procesar el logo {logo}: {exc}")
+        finally:
+            with self._lock:
+                self._pending.pop(logo, None)
+        if changed:
+            self.ready.emit(logo)
+
+    def _build_variants(self, logo: str) -> bool:
+        """Genera las variantes que falten; True si cambió lo que devuelve variant()."""
+        path = Path(logo) if Path(logo).is_absolute() else self._root / logo
+        mtime_ns = path.stat().st_mtime_ns
+        entry = self._variants.get(logo)
+        if entry is not None and entry[0] == mtime_ns:
+            return False
+
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=12).hexdigest()
+        image = None
+        variants: List[Tuple[int, str]] = []
+        # De mayor a menor: cada variante se escala a partir de la anterior
+        for px in reversed(self._sizes):
+            target = self._cache_dir / f"{digest}-{px}.png"
+            if not target.exists():
+                if image is None:
+                    from PIL import Image
+
+                    image = Image.open(io.BytesIO(data))
+                    image.load()
+                    if image.mode not in ("RGB", "RGBA"):
+                        image = image.convert("RGBA")
+                if max(image.size) <= px:
+                    # No se agranda: para este tamaño alcanza el original
+                    continue
+                image.thumbnail((px, px), Image.LANCZOS)
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_name(target.name + ".tmp")
+                image.save(tmp, "PNG")
+                os.replace(tmp, target)
+            variants.append((px, PurePosixPath(os.path.relpath(target, self._root)).as_posix()))
+
+        self._variants[logo] = (mtime_ns, tuple(reversed(variants)))
+        return entry is None or entry[1] != self._variants[logo][1]
+
+
+# Un único pipeline para toda la aplicación.
+logo_pipeline = LogoPipeline()
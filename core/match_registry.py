@@ -0,0 +1,142 @@
+"""
+Registro de canchas: varios partidos simultáneos en un mismo proceso.
+
+Cada cancha tiene su propio GameManager (o MatchEngine) y su journal; los
+catálogos de equipos y tipos de juego, el planificador de los relojes y
+los caches de templates (módulos de ui) son compartidos entre todas.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+from .journal import JOURNAL_DIR, MatchJournal
+from .timer import Scheduler
+
+DEFAULT_GAME_TYPE = ("Genérico", 4, "10:00", "02:00", "05:00")
+
+
+def _clamp(index: int, size: int) -> int:
+    return max(0, min(index, size - 1))
+
+
+class Court:
+    """Una cancha: identificador, nombre visible, partido en curso y journal."""
+
+    __slots__ = ("court_id", "name", "manager", "journal")
+
+    def __init__(self, court_id: int, name: str, manager, journal: Optional[MatchJournal]):
+        self.court_id = court_id
+        self.name = name
+        self.manager = manager
+        self.journal = journal
+
+    @property
+    def engine(self):
+        """MatchEngine de la cancha (el manager puede ser el adaptador Qt)."""
+        return getattr(self.manager, "engine", self.manager)
+
+
+class MatchRegistry:
+    """
+    Aloja N canchas independientes.
+    - teams / game_types: catálogos compartidos (las listas no se copian).
+    - manager_factory(match, scheduler): crea el partido de cada cancha;
+      la aplicación usa GameManager, los benchmarks un MatchEngine.
+    - scheduler: planificador común a todos los relojes (None = el de Qt).
+    - journal_root: carpeta de journals; None desactiva el journal.
+    """
+
+    def __init__(
+        self,
+        teams: List[Team],
+        game_types: List[GameType],
+        manager_factory: Callable[[Match, Optional[Scheduler]], object],
+        scheduler: Optional[Scheduler] = None,
+        journal_root: Optional[Path] = JOURNAL_DIR,
+    ):
+        self.teams = teams
+        self.game_types = game_types
+        self.scheduler = scheduler
+        self._manager_factory = manager_factory
+        self._journal_root = Path(journal_root) if journal_root is not None else None
+        self._courts: Dict[int, Court] = {}
+        self._next_id = 1
+
+    # -------------------------------------------------
+    # 🏟️ Alta y baja de canchas
+    # -------------------------------------------------
+    def add_court(self, name: Optional[str] = None) -> Court:
+        """Crea una cancha nueva; si su sesión anterior se cayó, recupera el partido."""
+        court_id = self._next_id
+        self._next_id += 1
+        manager = self._manager_factory(self.build_match(0, 1, 0), self.scheduler)
+        court = Court(court_id, name or f"Cancha {court_id}", manager, None)
+
+        directory = self.journal_dir(court_id)
+        if directory is not None:
+            recovered = MatchJournal.recover(directory)
+            if recovered is not None and not recovered.clean:
+                recovered.restore(court.engine)
+            court.journal = MatchJournal(directory)
+            court.journal.attach(court.engine)
+
+        self._courts[court_id] = court
+        return court
+
+    def remove_court(self, court_id: int) -> None:
+        court = self._courts.pop(court_id, None)
+        if court is None:
+            return
+        court.engine.timer.pause()
+        court.engine.countdown.pause()
+        if court.journal is not None:
+            court.journal.close()
+
+    def journal_dir(self, court_id: int) -> Optional[Path]:
+        """La cancha 1 usa la carpeta histórica; las demás una subcarpeta propia."""
+        if self._journal_root is None:
+            return None
+        if court_id == 1:
+            return self._journal_root
+        return self._journal_root / f"court-{court_id}"
+
+    # -------------------------------------------------
+    # 🔎 Consultas
+    # -------------------------------------------------
+    def get(self, court_id: int) -> Court:
+        return self._courts[court_id]
+
+    def courts(self) -> List[Court]:
+        return list(self._courts.values())
+
+    def __len__(self) -> int:
+        return len(self._courts)
+
+    # -------------------------------------------------
+    # 🔁 Partidos a partir de los presets compartidos
+    # -------------------------------------------------
+    def build_match(self, local_index: int, visit_index: int, game_type_index: int) -> Match:
+        local = self.teams[_clamp(local_index, len(self.teams))]
+        visit = self.teams[_clamp(visit_index, len(self.teams))]
+        if self.game_types:
+            game_type = self.game_types[_clamp(game_type_index, len(self.game_types))]
+        else:
+            game_type = GameType(*DEFAULT_GAME_TYPE)
+        return Match(local, visit, game_type)
+
+    def configure_match(self, court_id: int, local_index: int, visit_index: int, game_type_index: int) -> None:
+        if not self.teams:
+            return
+        self.get(court_id).manager.configure_match(
+            self.build_match(local_index, visit_index, game_type_index)
+        )
+
+    def shutdown(self) -> None:
+        """Cierra los journals de todas las canchas (sesión limpia)."""
+        for court in self._courts.values():
+            if court.journal is not None:
+                court.journal.close()
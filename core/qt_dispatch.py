@@ -0,0 +1,28 @@
+"""
+Ejecutar código en el hilo de Qt desde otros hilos (servidores asyncio).
+
+El partido, los snapshots y las ventanas sólo se tocan desde el hilo de Qt.
+Un servidor que corre en su propio hilo entrega un callable y Qt lo ejecuta
+en su loop mediante una conexión encolada (un evento, sin locks del lado
+del partido).
+"""
+
+from typing import Callable
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+
+class MainThreadDispatcher(QObject):
+    """Hay que crearlo en el hilo de Qt; call_soon() es seguro desde cualquier hilo."""
+
+    _call = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._call.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        self._call.emit(callback)
+
+    def _run(self, callback: Callable[[], None]) -> None:
+        callback()
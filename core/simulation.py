@@ -0,0 +1,89 @@
+"""
+Simulación de partidos completos en tiempo virtual.
+
+Usa un VirtualClock como planificador del MatchEngine: los cuartos, los
+descansos (vía countdown previo) y las sirenas se ejecutan en el orden real
+pero sin esperar tiempo de reloj, así un partido entero tarda milisegundos.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+from .engine import MatchEngine
+from .timer import VirtualClock
+
+
+class SimulationResult:
+    """
+    Resultado de una simulación.
+    - events: lista de (ms_virtuales, nombre, args) en orden de emisión.
+      'siren' se emite desde el manejador de fin de período, por eso aparece
+      justo antes del 'finished' que la originó.
+    """
+
+    def __init__(self, game_type: GameType, events: List[Tuple[int, str, tuple]], virtual_ms: int, periods: int):
+        self.game_type = game_type
+        self.events = events
+        self.virtual_ms = virtual_ms
+        self.periods = periods
+
+    def count(self, name: str) -> int:
+        """Cantidad de eventos con ese nombre."""
+        return sum(1 for _, event, _ in self.events if event == name)
+
+    def names(self) -> List[str]:
+        return [event for _, event, _ in self.events]
+
+
+def _rest_before(period: int, game_type: GameType) -> str:
+    """Descanso previo al período indicado (entretiempo a mitad de partido)."""
+    if period - 1 == game_type.quarters // 2:
+        return game_type.halftime_rest
+    return game_type.rest_between_quarters
+
+
+def simulate_game(
+    game_type: GameType,
+    clock: Optional[VirtualClock] = None,
+    on_manager: Optional[Callable[[MatchEngine], None]] = None,
+) -> SimulationResult:
+    """
+    Juega todos los cuartos de 'game_type' en tiempo virtual.
+    'on_manager' permite engancharse al motor antes de empezar
+    (por ejemplo para sumar puntos o medir el costo de las vistas).
+    """
+    clock = clock or VirtualClock()
+    match = Match(
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+        game_type,
+    )
+    manager = MatchEngine(match, scheduler=clock)
+
+    events: List[Tuple[int, str, tuple]] = []
+
+    def record(name: str):
+        return lambda *args: events.append((clock.now_ms, name, args))
+
+    manager.timer.tick.connect(record("tick"))
+    manager.timer.finished.connect(record("finished"))
+    manager.countdown.finished.connect(record("countdown_finished"))
+    manager.siren.connect(record("siren"))
+    if on_manager is not None:
+        on_manager(manager)
+
+    start_ms = clock.now_ms
+    periods = max(1, int(game_type.quarters))
+    for period in range(1, periods + 1):
+        if period > 1:
+            manager.next_period()
+            manager.set_pregame_countdown(_rest_before(period, game_type))
+            manager.start_pregame()
+        if not manager.countdown.is_running:
+            manager.start_time()
+        clock.run_until_idle()
+
+    return SimulationResult(game_type, events, clock.now_ms - start_ms, match.current_period)
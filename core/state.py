@@ -0,0 +1,232 @@
+"""
+Vistas serializables del estado del partido (sin Qt).
+
+Las usan las ventanas, el servidor de displays remotos y cualquier otro
+consumidor que necesite el mismo diccionario que reciben los templates.
+StateSnapshots los arma una sola vez por versión del partido y los
+comparte entre todos ellos.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+from .timer import DECIS_PER_SECOND, CountdownTimer
+
+
+def format_game_time(timer: CountdownTimer) -> Tuple[str, str]:
+    """Devuelve el tiempo formateado y el estilo ('regular'/'critical') del reloj."""
+
+    remaining_secs = max(0, int(timer.remaining_secs))
+    if remaining_secs >= 60:
+        minutes = remaining_secs // 60
+        secs = remaining_secs % 60
+        return f"{minutes:02d}:{secs:02d}", "regular"
+
+    remaining_decis = max(0, timer.remaining_deciseconds)
+    secs = remaining_decis // DECIS_PER_SECOND
+    decis = remaining_decis % DECIS_PER_SECOND
+    return f":{secs:02d}.{decis}", "critical"
+
+
+def format_remaining_ms(remaining_ms: int) -> Tuple[str, str]:
+    """
+    Como format_game_time pero a partir de milisegundos restantes (p. ej.
+    extrapolados de un descriptor de reloj); mismo formato que clock.js.
+    """
+    remaining_ms = max(0, int(remaining_ms))
+    unit = 1000 if remaining_ms > 60 * 1000 else 100
+    shown = -(-remaining_ms // unit) * unit
+    secs = shown // 1000
+    if secs >= 60:
+        return f"{secs // 60:02d}:{secs % 60:02d}", "regular"
+    decis = shown // 100
+    return f":{decis // 10:02d}.{decis % 10}", "critical"
+
+
+def clock_remaining_ms(clock: Dict[str, object], now_ms: int) -> int:
+    """Milisegundos restantes según un clock_descriptor() en el instante 'now_ms'."""
+    base = int(clock["remaining_decis"]) * 100
+    if not clock["running"]:
+        return base
+    return max(0, base - (now_ms - int(clock["ref_ms"])))
+
+
+def team_view(team: Team) -> Dict[str, str]:
+    return {
+        "name": team.name,
+        "logo": team.logo,
+        "color_primary": team.color_primary,
+        "color_secondary": team.color_secondary,
+    }
+
+
+def game_type_view(game_type: GameType) -> Dict[str, str]:
+    return {
+        "name": game_type.name,
+        "quarters": str(game_type.quarters),
+        "time_per_quarter": game_type.time_per_quarter,
+        "rest_between_quarters": game_type.rest_between_quarters,
+        "halftime_rest": game_type.halftime_rest,
+    }
+
+
+def clock_now_ms(engine) -> int:
+    """
+    Instante actual en la base de tiempo de los descriptores de reloj.
+    Se envía junto a cada publicación ('now_ms') para que el cliente
+    calcule cuánto corrió el reloj desde 'ref_ms' sin sincronizar relojes.
+    """
+    return engine.timer.monotonic_ms()
+
+
+def build_display_state(engine) -> Dict[str, object]:
+    """
+    Estado que consumen los templates del display.
+    'engine' puede ser un MatchEngine o el GameManager que lo envuelve.
+    'time' y 'time_style' sirven para el render inicial; en vivo el reloj
+    se anima en el cliente a partir de 'clock'.
+    """
+    match = engine.match
+    time_value, time_style = format_game_time(engine.timer)
+    return {
+        "time": time_value,
+        "time_style": time_style,
+        "clock": engine.timer.clock_descriptor(),
+        "period": match.current_period,
+        "points_local": match.points_local,
+        "points_visit": match.points_visit,
+        "fouls_local": match.fouls_local,
+        "fouls_visit": match.fouls_visit,
+        "team_local": team_view(match.team_local),
+        "team_visit": team_view(match.team_visit),
+        "game_type": game_type_view(match.game_type),
+    }
+
+
+# -------------------------------------------------
+# 📸 Snapshots versionados
+# -------------------------------------------------
+_STATIC_FIELDS = frozenset(("team_local", "team_visit", "game_type"))
+
+
+class FrozenDict(dict):
+    """dict de sólo lectura: se serializa y se copia como un dict común."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("snapshot de sólo lectura")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class StateSnapshots:
+    """
+    Estado del partido armado una vez por versión y compartido entre
+    consumidores (display, operador, displays remotos).
+    - version: aumenta con cada 'updated' del motor
+    - display_state(): mismo contenido que build_display_state()
+    - operator_state(): display_state() + countdown y presets seleccionados
+    Las vistas de equipos y tipo de juego se reutilizan hasta que cambian
+    esos campos del partido (Match.changed_since), y los índices de los
+    presets son dicts por valor (nada de list.index en cada refresco).
+    Hay que conectarlo al motor antes que cualquier consumidor de 'updated'.
+    """
+
+    def __init__(self, engine, teams: Sequence[Team] = (), game_types: Sequence[GameType] = ()):
+        self._engine = engine
+        self.version = 0
+        self._display: Optional[FrozenDict] = None
+        self._operator: Optional[FrozenDict] = None
+        self._static_match: Optional[Match] = None
+        self._static_version = 0
+        self._static: Dict[str, object] = {}
+        self._team_index: Dict[Team, int] = {}
+        self._game_type_index: Dict[GameType, int] = {}
+        self.set_presets(teams, game_types)
+        engine.updated.connect(self.invalidate)
+
+    def set_presets(self, teams: Sequence[Team], game_types: Sequence[GameType]) -> None:
+        # Ante presets repetidos gana el primero, como con list.index
+        self._team_index = {}
+        for index, team in enumerate(teams):
+            self._team_index.setdefault(team, index)
+        self._game_type_index = {}
+        for index, game_type in enumerate(game_types):
+            self._game_type_index.setdefault(game_type, index)
+        self._preset_views = (
+            tuple(FrozenDict(team_view(team)) for team in teams),
+            tuple(FrozenDict(game_type_view(game_type)) for game_type in game_types),
+        )
+        self._operator = None
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._display = None
+        self._operator = None
+
+    def preset_views(self) -> Tuple[Tuple[FrozenDict, ...], Tuple[FrozenDict, ...]]:
+        """Vistas de todos los equipos y tipos de juego (para los selectores del operador)."""
+        return self._preset_views
+
+    def team_index(self, team: Team) -> int:
+        return self._team_index.get(team, 0)
+
+    def game_type_index(self, game_type: GameType) -> int:
+        return self._game_type_index.get(game_type, 0)
+
+    def _static_views(self) -> Dict[str, object]:
+        match = self._engine.match
+        if match is not self._static_match or match.changed_since(self._static_version) & _STATIC_FIELDS:
+            self._static_match = match
+            self._static_version = match.version
+            self._static = {
+                "team_local": FrozenDict(team_view(match.team_local)),
+                "team_visit": FrozenDict(team_view(match.team_visit)),
+                "game_type": FrozenDict(game_type_view(match.game_type)),
+            }
+        return self._static
+
+    def display_state(self) -> FrozenDict:
+        if self._display is None:
+            engine = self._engine
+            match = engine.match
+            time_value, time_style = format_game_time(engine.timer)
+            self._display = FrozenDict(
+                time=time_value,
+                time_style=time_style,
+                clock=FrozenDict(engine.timer.clock_descriptor()),
+                period=match.current_period,
+                points_local=match.points_local,
+                points_visit=match.points_visit,
+                fouls_local=match.fouls_local,
+                fouls_visit=match.fouls_visit,
+                **self._static_views(),
+            )
+        return self._display
+
+    def operator_state(self) -> FrozenDict:
+        if self._operator is None:
+            engine = self._engine
+            match = engine.match
+            self._operator = FrozenDict(
+                self.display_state(),
+                countdown=engine.countdown.remaining_mmss,
+                countdown_clock=FrozenDict(engine.countdown.clock_descriptor()),
+                selected=FrozenDict(
+                    local=self.team_index(match.team_local),
+                    visit=self.team_index(match.team_visit),
+                    game_type=self.game_type_index(match.game_type),
+                ),
+            )
+        return self._operator
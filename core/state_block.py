@@ -0,0 +1,279 @@
+"""
+Estado del partido en un bloque de memoria compartida (sin Qt).
+
+Para software externo (gráficas, estadísticas) que necesita leer puntos,
+reloj y faltas a alta frecuencia sin capturar la pantalla ni hacer una
+ida y vuelta por IPC: el escritor (la aplicación) vuelca el Match y los
+CountdownTimer de una cancha en un registro de tamaño fijo y cualquier
+proceso local lo lee con struct, sin locks.
+
+Layout v1 (little-endian, BLOCK_SIZE bytes):
+
+    0    "BBPS", versión de layout (u32), tamaño del bloque (u32), 0 (u32)
+    16   seq (u64): seqlock, impar mientras se escribe; publicaciones = seq // 2
+    24   registro (_RECORD, ver StateRecord): versión del Match, instante de
+         publicación, período, puntos, faltas, reloj y countdown (restante en
+         ms al instante ref_ns, monotónico del sistema), nombres y colores
+
+El lector copia el registro y vuelve a leer 'seq': si cambió o era impar
+reintenta, así nunca ve un registro a medio escribir. El reloj no se
+republica en cada décima: como en los displays, se publica un descriptor
+(corriendo, restante, instante de referencia) y el lector lo extrapola con
+time.monotonic_ns(), el mismo reloj que usa la aplicación (QtScheduler).
+
+    reader = StateBlockReader("bbp-state-1")
+    record = reader.read()
+    record.points_local, record.clock_ms(), record.clock_text()
+
+Uso (volcado en JSON a 10 Hz):
+    python -m core.state_block bbp-state-1 --hz 10
+"""
+
+import argparse
+import json
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+from .state import format_remaining_ms
+
+MAGIC = b"BBPS"
+LAYOUT_VERSION = 1
+BLOCK_SIZE = 256
+NAME_BYTES = 32
+COLOR_BYTES = 8
+
+_HEADER = struct.Struct("<4sIII")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = _HEADER.size
+_RECORD_OFFSET = _SEQ_OFFSET + _SEQ.size
+_RECORD = struct.Struct(
+    "<Qq"        # match_version, published_ns
+    "IIIIII"     # period, quarters, points_local, points_visit, fouls_local, fouls_visit
+    "??xx"       # clock_running, countdown_running
+    "Iq"         # clock_remaining_ms, clock_ref_ns
+    "Iq"         # countdown_remaining_ms, countdown_ref_ns
+    "I"          # quarter_ms
+    f"{NAME_BYTES}s{NAME_BYTES}s{NAME_BYTES}s"    # team_local, team_visit, game_type
+    f"{COLOR_BYTES}s{COLOR_BYTES}s{COLOR_BYTES}s{COLOR_BYTES}s"  # colores local/visita
+)
+assert _RECORD_OFFSET + _RECORD.size <= BLOCK_SIZE
+
+# Reintentos de lectura antes de suponer que el escritor murió a mitad de una escritura
+_MAX_RETRIES = 100_000
+_NS_PER_MS = 1_000_000
+
+
+def _text(value: str, size: int) -> bytes:
+    data = value.encode("utf-8")[:size]
+    # Sin cortar un carácter multibyte a la mitad
+    return data.decode("utf-8", "ignore").encode("utf-8")
+
+
+class StateRecord(NamedTuple):
+    match_version: int
+    published_ns: int
+    period: int
+    quarters: int
+    points_local: int
+    points_visit: int
+    fouls_local: int
+    fouls_visit: int
+    clock_running: bool
+    countdown_running: bool
+    clock_remaining_ms: int
+    clock_ref_ns: int
+    countdown_remaining_ms: int
+    countdown_ref_ns: int
+    quarter_ms: int
+    team_local: str
+    team_visit: str
+    game_type: str
+    color_local: str
+    color_local_secondary: str
+    color_visit: str
+    color_visit_secondary: str
+
+    def clock_ms(self, now_ns: Optional[int] = None) -> int:
+        """Milisegundos restantes del reloj de juego, extrapolados a 'now_ns'."""
+        return _extrapolate(self.clock_remaining_ms, self.clock_ref_ns, self.clock_running, now_ns)
+
+    def countdown_ms(self, now_ns: Optional[int] = None) -> int:
+        """Milisegundos restantes del countdown previo, extrapolados a 'now_ns'."""
+        return _extrapolate(self.countdown_remaining_ms, self.countdown_ref_ns, self.countdown_running, now_ns)
+
+    def clock_text(self, now_ns: Optional[int] = None) -> str:
+        """El reloj como lo muestra el display ('MM:SS' o ':SS.d')."""
+        return format_remaining_ms(self.clock_ms(now_ns))[0]
+
+
+def _extrapolate(remaining_ms: int, ref_ns: int, running: bool, now_ns: Optional[int]) -> int:
+    if not running:
+        return remaining_ms
+    now_ns = time.monotonic_ns() if now_ns is None else now_ns
+    return max(0, remaining_ms - (now_ns - ref_ns) // _NS_PER_MS)
+
+
+def _clock_fields(timer) -> tuple:
+    clock = timer.clock_descriptor()
+    return (
+        bool(clock["running"]),
+        int(clock["remaining_decis"]) * 100,
+        int(clock["ref_ms"]) * _NS_PER_MS,
+    )
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.version_info < (3, 13):
+        # Sin esto el resource_tracker borraría el bloque del escritor al salir
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class StateBlockWriter:
+    """
+    Crea el bloque y lo actualiza con el estado de un MatchEngine (o del
+    GameManager que lo envuelve).
+    - track(engine): publica ahora y en cada 'updated'
+    - publish(engine): publica una vez
+    """
+
+    def __init__(self, name: str):
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=BLOCK_SIZE)
+        except FileExistsError:
+            # Bloque de una ejecución anterior que no se cerró bien
+            stale = _attach(name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=BLOCK_SIZE)
+        self.name = self._shm.name
+        self._seq = 0
+        _HEADER.pack_into(self._shm.buf, 0, MAGIC, LAYOUT_VERSION, BLOCK_SIZE, 0)
+        _SEQ.pack_into(self._shm.buf, _SEQ_OFFSET, 0)
+
+    @property
+    def publications(self) -> int:
+        return self._seq // 2
+
+    def track(self, engine) -> None:
+        engine.updated.connect(lambda: self.publish(engine))
+        self.publish(engine)
+
+    def publish(self, engine) -> None:
+        match = engine.match
+        game_type = match.game_type
+        team_local, team_visit = match.team_local, match.team_visit
+        record = (
+            match.version,
+            time.monotonic_ns(),
+            match.current_period,
+            int(game_type.quarters),
+            match.points_local,
+            match.points_visit,
+            match.fouls_local,
+            match.fouls_visit,
+        )
+        clock_running, clock_ms, clock_ref_ns = _clock_fields(engine.timer)
+        countdown_running, countdown_ms, countdown_ref_ns = _clock_fields(engine.countdown)
+        record += (
+            clock_running,
+            countdown_running,
+            clock_ms,
+            clock_ref_ns,
+            countdown_ms,
+            countdown_ref_ns,
+            game_type.time_per_quarter_secs * 1000,
+            _text(team_local.name, NAME_BYTES),
+            _text(team_visit.name, NAME_BYTES),
+            _text(game_type.name, NAME_BYTES),
+            _text(team_local.color_primary, COLOR_BYTES),
+            _text(team_local.color_secondary, COLOR_BYTES),
+            _text(team_visit.color_primary, COLOR_BYTES),
+            _text(team_visit.color_secondary, COLOR_BYTES),
+        )
+        buf = self._shm.buf
+        _SEQ.pack_into(buf, _SEQ_OFFSET, self._seq + 1)
+        _RECORD.pack_into(buf, _RECORD_OFFSET, *record)
+        self._seq += 2
+        _SEQ.pack_into(buf, _SEQ_OFFSET, self._seq)
+
+    def close(self) -> None:
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class StateBlockReader:
+    """
+    Lee el bloque de otro proceso, sin locks.
+    - version(): publicaciones hasta ahora (barato: sirve para saber si hubo cambios)
+    - read(): el último StateRecord consistente (None si no se publicó nada);
+      mientras no haya publicaciones nuevas devuelve el mismo objeto sin decodificar
+    """
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        magic, version, size, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION or size != BLOCK_SIZE:
+            self._shm.close()
+            raise ValueError(f"'{name}' no es un bloque de estado v{LAYOUT_VERSION}")
+        self.retries = 0
+        self._seq = 0
+        self._record: Optional[StateRecord] = None
+
+    def version(self) -> int:
+        return _SEQ.unpack_from(self._shm.buf, _SEQ_OFFSET)[0] // 2
+
+    def read(self) -> Optional[StateRecord]:
+        buf = self._shm.buf
+        for _ in range(_MAX_RETRIES):
+            seq = _SEQ.unpack_from(buf, _SEQ_OFFSET)[0]
+            if seq == self._seq:
+                return self._record
+            if not seq & 1:
+                values = _RECORD.unpack_from(buf, _RECORD_OFFSET)
+                if _SEQ.unpack_from(buf, _SEQ_OFFSET)[0] == seq:
+                    break
+            self.retries += 1
+        else:
+            raise RuntimeError("El bloque de estado quedó a medio escribir (¿el escritor terminó?)")
+        self._seq = seq
+        self._record = StateRecord(
+            *values[:15],
+            *(value.rstrip(b"\0").decode("utf-8") for value in values[15:]),
+        )
+        return self._record
+
+    def close(self) -> None:
+        self._shm.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Muestra el bloque de estado de una cancha como líneas JSON.")
+    parser.add_argument("name", help="nombre del bloque (state_block_name-<cancha> en data/config.json)")
+    parser.add_argument("--hz", type=float, default=10)
+    args = parser.parse_args(argv)
+
+    reader = StateBlockReader(args.name)
+    try:
+        while True:
+            record = reader.read()
+            if record is not None:
+                print(json.dumps({**record._asdict(), "clock": record.clock_text()}, ensure_ascii=False), flush=True)
+            time.sleep(1 / args.hz)
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
+from typing import Dict, Optional
+
+from utils import logger
 
 # Directorio de datos del proyecto
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -13,21 +19,99 @@ CONFIG_FILE = DATA_DIR / "config.json"
 # -------------------------------------------------
 # 🔧 Utilidades internas
 # -------------------------------------------------
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """
+    Escribe 'text' en un temporal del mismo directorio, hace fsync y lo
+    renombra sobre 'path': una caída nunca deja el archivo a medio escribir.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 def _read_json(path: Path, default):
     """Lee un archivo JSON, devolviendo 'default' si no existe."""
     if not path.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(default, f, ensure_ascii=False, indent=2)
+        write_text_atomic(path, _dumps(default))
         return default
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+class _WriteBehind:
+    """
+    Persistencia diferida en un hilo de fondo.
+    Los guardados sobre el mismo archivo dentro de la ventana 'delay_s' se
+    combinan (sólo se escribe el último) y cada escritura es atómica.
+    """
+
+    def __init__(self, delay_s: float = 0.25):
+        self._delay = delay_s
+        self._pending: Dict[Path, str] = {}
+        self._writing = False
+        self._flush_requested = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, path: Path, obj) -> None:
+        # Se serializa en el hilo que guarda: el worker escribe una foto fija
+        text = _dumps(obj)
+        with self._cond:
+            self._pending[path] = text
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="storage-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Bloquea hasta que no queden escrituras pendientes."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and not self._writing, timeout)
+            self._flush_requested = False
+            return done
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._pending))
+                # Ventana de agrupamiento (se corta si alguien pide flush)
+                self._cond.wait_for(lambda: self._flush_requested, self._delay)
+                batch, self._pending = self._pending, {}
+                self._writing = True
+            for path, text in batch.items():
+                try:
+                    write_text_atomic(path, text)
+                except OSError as exc:
+                    logger.error(f"No se pudo guardar {path}: {exc}")
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+_writer = _WriteBehind()
+
+
 def _write_json(path: Path, obj):
-    """Guarda un objeto Python como JSON formateado."""
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    """Encola un objeto Python para guardarlo como JSON formateado."""
+    _writer.submit(path, obj)
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Espera a que terminen los guardados pendientes (usar al cerrar)."""
+    return _writer.flush(timeout)
+
+
+atexit.register(flush)
 
 
 # -------------------------------------------------
@@ -39,8 +123,11 @@ def load_teams():
 
 
 def save_teams(items):
-    """Guarda los equipos en teams.json."""
+    """Guarda los equipos en teams.json y prepara las variantes de sus logos."""
+    from .logo_pipeline import logo_pipeline
+
     _write_json(TEAMS_FILE, items)
+    logo_pipeline.prepare(item.get("logo", "") for item in items)
 
 
 # -------------------------------------------------
@@ -65,7 +152,29 @@ def load_config():
         "last_selected_local": "",
         "last_selected_visit": "",
         "last_selected_game_type": "",
-        "pre_game_countdown": "00:00"
+        "pre_game_countdown": "00:00",
+        # Puerto del servidor de displays remotos en la LAN (0 = desactivado)
+        "remote_display_port": 0,
+        # Cantidad de canchas simultáneas (un operador y un display por cancha)
+        "courts": 1,
+        # Métricas de rendimiento (panel oculto con Ctrl+Shift+M; export al cerrar)
+        "metrics": False,
+        # Displays con el backend nativo (QPainter) en lugar de WebEngine al arrancar
+        "native_display": False,
+        # Frames RGBA para overlays: "" (desactivado), "shm" (anillo en memoria
+        # compartida <frame_output_name>-<cancha>) o la ruta de un FIFO ("{court}" = cancha)
+        "frame_output": "",
+        "frame_output_name": "bbp-frames",
+        "frame_output_size": "1920x1080",
+        "frame_output_fps": 60,
+        # Bloque de estado en memoria compartida (<state_block_name>-<cancha>) para software externo
+        "state_block": False,
+        "state_block_name": "bbp-state",
+        # API HTTP de control para tablets (0 = desactivada) y token ("Authorization: Bearer ...").
+        # Sin token sólo escucha en 127.0.0.1; "" en el host = según haya token o no
+        "control_api_port": 0,
+        "control_api_token": "",
+        "control_api_host": ""
     }
     return _read_json(CONFIG_FILE, default)
 
@@ -1,58 +1,380 @@
-from PySide6.QtCore import QObject, QTimer, Signal
+import asyncio
+import heapq
+import itertools
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+from utils import metrics
+from utils.timefmt import mmss_to_secs, secs_to_mmss
+
+from .events import Event
 
 
 DECIS_PER_SECOND = 10
+CENTIS_PER_SECOND = 100
+
+_NS_PER_MS = 1_000_000
+_NS_PER_DECI = 100_000_000
+_NS_PER_SECOND = 1_000_000_000
 
 
-def _mmss_to_secs(mmss: str) -> int:
+# -------------------------------------------------
+# ⏱️ Relojes y planificadores inyectables
+# -------------------------------------------------
+class ScheduledTimer(ABC):
     """
-    Convierte 'MM:SS' a segundos (int).
-    Lanza ValueError si el formato no es válido.
+    Temporizador de un solo disparo entregado por un Scheduler.
+    Un nuevo start() reemplaza al disparo pendiente.
     """
-    mmss = (mmss or "").strip()
-    if ":" not in mmss:
-        raise ValueError(f"Formato inválido (esperado MM:SS): {mmss!r}")
-    m, s = mmss.split(":")
-    m_i, s_i = int(m), int(s)
-    if m_i < 0 or s_i < 0 or s_i > 59:
-        raise ValueError(f"Valores fuera de rango en MM:SS: {mmss!r}")
-    return m_i * 60 + s_i
+
+    @abstractmethod
+    def start(self, delay_ms: int, precise: bool = False) -> None:
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    def is_active(self) -> bool:
+        ...
 
 
-def _secs_to_mmss(secs: int) -> str:
+class Scheduler(ABC):
     """
-    Convierte segundos (int) a formato 'MM:SS'.
-    No permite negativos (clampa en 0).
+    Fuente de tiempo monotónico + fábrica de temporizadores.
+    CountdownTimer y GameManager sólo hablan con esta interfaz, así pueden
+    correr sobre el event loop de Qt o sobre un reloj virtual.
     """
-    secs = max(0, int(secs))
-    m = secs // 60
-    s = secs % 60
-    return f"{m:02d}:{s:02d}"
 
+    @abstractmethod
+    def monotonic_ns(self) -> int:
+        ...
+
+    @abstractmethod
+    def create_timer(self, callback: Callable[[], None]) -> ScheduledTimer:
+        ...
+
+
+class _QtScheduledTimer(ScheduledTimer):
+    def __init__(self, callback: Callable[[], None]):
+        # Import diferido: el motor sólo carga Qt si se usa este planificador
+        from PySide6.QtCore import Qt, QTimer
+
+        self._precise_type = Qt.TimerType.PreciseTimer
+        self._coarse_type = Qt.TimerType.CoarseTimer
+        self._qtimer = QTimer()
+        self._qtimer.setSingleShot(True)
+        self._qtimer.timeout.connect(callback)
+
+    def start(self, delay_ms: int, precise: bool = False) -> None:
+        timer_type = self._precise_type if precise else self._coarse_type
+        if self._qtimer.timerType() != timer_type:
+            self._qtimer.setTimerType(timer_type)
+        self._qtimer.start(max(0, int(delay_ms)))
+
+    def stop(self) -> None:
+        self._qtimer.stop()
+
+    def is_active(self) -> bool:
+        return self._qtimer.isActive()
+
+
+class QtScheduler(Scheduler):
+    """Planificador de tiempo real sobre QTimer y time.monotonic_ns()."""
+
+    def monotonic_ns(self) -> int:
+        return time.monotonic_ns()
+
+    def create_timer(self, callback: Callable[[], None]) -> ScheduledTimer:
+        return _QtScheduledTimer(callback)
+
+
+class _AsyncioScheduledTimer(ScheduledTimer):
+    def __init__(self, loop: asyncio.AbstractEventLoop, callback: Callable[[], None]):
+        self._loop = loop
+        self._callback = callback
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self, delay_ms: int, precise: bool = False) -> None:
+        self.stop()
+        self._handle = self._loop.call_later(max(0, int(delay_ms)) / 1000, self._fire)
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def is_active(self) -> bool:
+        return self._handle is not None
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._callback()
 
-class CountdownTimer(QObject):
+
+class AsyncioScheduler(Scheduler):
+    """Planificador de tiempo real para servicios sin Qt (loop de asyncio)."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._loop = loop or asyncio.get_running_loop()
+
+    def monotonic_ns(self) -> int:
+        return time.monotonic_ns()
+
+    def create_timer(self, callback: Callable[[], None]) -> ScheduledTimer:
+        return _AsyncioScheduledTimer(self._loop, callback)
+
+
+class _VirtualTimer(ScheduledTimer):
+    def __init__(self, clock: "VirtualClock", callback: Callable[[], None]):
+        self._clock = clock
+        self._callback = callback
+        self._generation = 0
+        self._active = False
+
+    def start(self, delay_ms: int, precise: bool = False) -> None:
+        self._generation += 1
+        self._active = True
+        due_ns = self._clock.monotonic_ns() + max(0, int(delay_ms)) * _NS_PER_MS
+        self._clock._push(due_ns, self, self._generation)
+
+    def stop(self) -> None:
+        self._generation += 1
+        self._active = False
+
+    def is_active(self) -> bool:
+        return self._active
+
+    def _fire(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._active = False
+        self._callback()
+
+
+class VirtualClock(Scheduler):
     """
-    Temporizador de cuenta regresiva con soporte para décimas de segundo.
-    Señales:
-      - tick(int remaining_secs, str remaining_mmss)
-      - finished()
+    Reloj virtual determinista: el tiempo sólo avanza con advance()/run_*().
+    Los disparos se ejecutan en orden de deadline (y de alta ante empates),
+    con el reloj posicionado exactamente en cada deadline.
+    """
+
+    def __init__(self, start_ns: int = 0):
+        self._now_ns = start_ns
+        self._queue: list = []
+        self._seq = itertools.count()
+
+    def monotonic_ns(self) -> int:
+        return self._now_ns
+
+    def create_timer(self, callback: Callable[[], None]) -> ScheduledTimer:
+        return _VirtualTimer(self, callback)
+
+    @property
+    def now_ms(self) -> int:
+        return self._now_ns // _NS_PER_MS
+
+    def _push(self, due_ns: int, timer: _VirtualTimer, generation: int) -> None:
+        heapq.heappush(self._queue, (due_ns, next(self._seq), timer, generation))
+
+    def _run_next(self, limit_ns: Optional[int]) -> bool:
+        while self._queue:
+            due_ns, _, timer, generation = self._queue[0]
+            if limit_ns is not None and due_ns > limit_ns:
+                return False
+            heapq.heappop(self._queue)
+            if generation != timer._generation:
+                continue  # disparo cancelado o reprogramado
+            self._now_ns = max(self._now_ns, due_ns)
+            timer._fire(generation)
+            return True
+        return False
+
+    def advance(self, ms: int) -> None:
+        """Avanza el reloj 'ms' milisegundos ejecutando los disparos vencidos."""
+        target_ns = self._now_ns + max(0, int(ms)) * _NS_PER_MS
+        while self._run_next(target_ns):
+            pass
+        self._now_ns = target_ns
+
+    def run_until_idle(self, max_ms: Optional[int] = None) -> None:
+        """Ejecuta disparos hasta vaciar la cola (o hasta 'max_ms' virtuales)."""
+        limit_ns = None if max_ms is None else self._now_ns + int(max_ms) * _NS_PER_MS
+        while self._run_next(limit_ns):
+            pass
+
+
+class _WheelTimer(ScheduledTimer):
+    __slots__ = ("_wheel", "_callback", "_generation", "_active")
+
+    def __init__(self, wheel: "TimingWheel", callback: Callable[[], None]):
+        self._wheel = wheel
+        self._callback = callback
+        self._generation = 0
+        self._active = False
+
+    def start(self, delay_ms: int, precise: bool = False) -> None:
+        self._generation += 1
+        self._active = True
+        self._wheel._add(self, max(0, int(delay_ms)), precise)
+
+    def stop(self) -> None:
+        self._generation += 1
+        self._active = False
+
+    def is_active(self) -> bool:
+        return self._active
+
+    def _fire(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._active = False
+        self._callback()
+
+
+class TimingWheel(Scheduler):
+    """
+    Planificador central: todos sus temporizadores comparten un único timer
+    del planificador 'base'.
+    Los vencimientos se redondean hacia arriba al próximo tick de 'tick_ms'
+    (alineado al reloj monotónico, no al momento del alta), así que los
+    relojes que vencen en el mismo tick se disparan juntos en un solo
+    despertar del event loop y cambian en pantalla al mismo tiempo.
+    El timer base sólo se arma para el próximo tick con algo pendiente: sin
+    relojes corriendo no hay despertares.
     """
 
-    _LONG_INTERVAL_MS = 1000
-    _SHORT_INTERVAL_MS = 100
-    _CRITICAL_THRESHOLD_DECIS = 60 * DECIS_PER_SECOND
+    def __init__(self, base: Optional[Scheduler] = None, tick_ms: int = 10):
+        self._base = base or QtScheduler()
+        self._tick_ns = max(1, int(tick_ms)) * _NS_PER_MS
+        # tick absoluto -> [(timer, generación, preciso)]
+        self._buckets: Dict[int, list] = {}
+        self._ticks: list = []  # heap con los ticks que tienen bucket
+        self._armed_tick: Optional[int] = None
+        self._dispatching_tick: Optional[int] = None
+        self._driver = self._base.create_timer(self._on_wakeup)
+        self._wakeups = 0
+        self._fired = 0
+
+    def monotonic_ns(self) -> int:
+        return self._base.monotonic_ns()
+
+    def create_timer(self, callback: Callable[[], None]) -> ScheduledTimer:
+        return _WheelTimer(self, callback)
+
+    def stats(self) -> Dict[str, int]:
+        """Despertares del timer base y disparos entregados desde el inicio."""
+        return {
+            "wakeups": self._wakeups,
+            "fired": self._fired,
+            "pending_ticks": len(self._ticks),
+        }
+
+    def _add(self, timer: _WheelTimer, delay_ms: int, precise: bool) -> None:
+        due_ns = self._base.monotonic_ns() + delay_ms * _NS_PER_MS
+        tick = -(-due_ns // self._tick_ns)
+        if self._dispatching_tick is not None and tick <= self._dispatching_tick:
+            # Re-programado desde un callback: va al tick siguiente
+            tick = self._dispatching_tick + 1
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = []
+            heapq.heappush(self._ticks, tick)
+        bucket.append((timer, timer._generation, precise))
+        if self._dispatching_tick is None and (self._armed_tick is None or tick < self._armed_tick):
+            self._arm()
+
+    def _arm(self) -> None:
+        # Descartar ticks cuyos temporizadores fueron todos cancelados
+        while self._ticks:
+            bucket = self._buckets[self._ticks[0]]
+            if any(generation == timer._generation for timer, generation, _ in bucket):
+                break
+            del self._buckets[heapq.heappop(self._ticks)]
+        if not self._ticks:
+            self._driver.stop()
+            self._armed_tick = None
+            return
+
+        tick = self._ticks[0]
+        precise = any(
+            precise for timer, generation, precise in self._buckets[tick] if generation == timer._generation
+        )
+        wait_ns = tick * self._tick_ns - self._base.monotonic_ns()
+        self._driver.start(max(0, -(-wait_ns // _NS_PER_MS)), precise)
+        self._armed_tick = tick
+
+    def _on_wakeup(self) -> None:
+        self._wakeups += 1
+        self._armed_tick = None
+        now_tick = self._base.monotonic_ns() // self._tick_ns
+        self._dispatching_tick = now_tick
+        try:
+            while self._ticks and self._ticks[0] <= now_tick:
+                for timer, generation, _ in self._buckets.pop(heapq.heappop(self._ticks)):
+                    if generation == timer._generation:
+                        self._fired += 1
+                        timer._fire(generation)
+        finally:
+            self._dispatching_tick = None
+        self._arm()
+
 
-    tick = Signal(int, str)
-    finished = Signal()
+_default_scheduler: Optional[Scheduler] = None
 
-    def __init__(self, initial_mmss: str = "10:00", parent=None):
-        super().__init__(parent)
-        self._remaining_decis = _mmss_to_secs(initial_mmss) * DECIS_PER_SECOND
-        self._running = False
 
-        self._qtimer = QTimer(self)
-        self._qtimer.setInterval(self._LONG_INTERVAL_MS)
-        self._qtimer.timeout.connect(self._on_timeout)
+def default_scheduler() -> Scheduler:
+    """
+    Planificador de tiempo real compartido: un TimingWheel sobre QtScheduler,
+    así todos los CountdownTimer de la aplicación usan un solo QTimer.
+    Fuera de una aplicación Qt conviene pasar un AsyncioScheduler o un
+    VirtualClock explícitamente (o un TimingWheel sobre ellos).
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = TimingWheel(QtScheduler())
+    return _default_scheduler
+
+
+class CountdownTimer:
+    """
+    Temporizador de cuenta regresiva con soporte para décimas de segundo
+    (u opcionalmente centésimas).
+
+    El tiempo restante se calcula siempre contra un deadline del reloj
+    monotónico, por lo que un timeout que llega tarde no se acumula como
+    deriva: el próximo tick simplemente muestra el valor correcto.
+    Eventos (core.events.Event, misma API que las señales Qt):
+      - tick(int remaining_secs, str remaining_mmss)
+      - finished()
+    """
+
+    _CRITICAL_THRESHOLD_MS = 60 * 1000
+    _PRECISE_THRESHOLD_MS = 60 * 1000
+
+    def __init__(
+        self,
+        initial_mmss: str = "10:00",
+        resolution: int = DECIS_PER_SECOND,
+        scheduler: Optional[Scheduler] = None,
+    ):
+        self.tick = Event()
+        self.finished = Event()
+        if resolution not in (DECIS_PER_SECOND, CENTIS_PER_SECOND):
+            raise ValueError(f"Resolución no soportada: {resolution!r}")
+        self._resolution = resolution
+        self._scheduler = scheduler or default_scheduler()
+        self._remaining_ns = mmss_to_secs(initial_mmss) * _NS_PER_SECOND
+        self._deadline_ns: int | None = None
+        # Instante del último start/ajuste con el reloj corriendo
+        self._anchor_ns = 0
+        # Instante en que debería llegar el próximo timeout (para medir atraso)
+        self._due_ns = 0
+        self._last_display_ms = self._display_ms(self._remaining_ns)
+
+        self._timer = self._scheduler.create_timer(self._on_timeout)
 
         # emitir un primer tick para inicializar vistas
         self.tick.emit(self.remaining_secs, self.remaining_mmss)
@@ -60,49 +382,106 @@ class CountdownTimer(QObject):
     # -----------------------
     # Propiedades de lectura
     # -----------------------
+    @property
+    def is_running(self) -> bool:
+        return self._deadline_ns is not None
+
+    @property
+    def remaining_ms(self) -> int:
+        """Milisegundos restantes exactos (sin cuantizar)."""
+
+        return -(-self._current_remaining_ns() // _NS_PER_MS)
+
     @property
     def remaining_secs(self) -> int:
-        return self._remaining_decis // DECIS_PER_SECOND
+        return self._display_ms(self._current_remaining_ns()) // 1000
 
     @property
     def remaining_mmss(self) -> str:
-        return _secs_to_mmss(self.remaining_secs)
+        return secs_to_mmss(self.remaining_secs)
 
     @property
     def remaining_deciseconds(self) -> int:
         """Total de décimas de segundo restantes."""
 
-        return self._remaining_decis
+        return self._display_ms(self._current_remaining_ns()) // 100
+
+    @property
+    def remaining_centiseconds(self) -> int:
+        """Total de centésimas de segundo restantes (según la resolución)."""
+
+        return self._display_ms(self._current_remaining_ns()) // 10
+
+    def monotonic_ms(self) -> int:
+        """Milisegundos del reloj monotónico del planificador (base de clock_descriptor)."""
+
+        return self._scheduler.monotonic_ns() // _NS_PER_MS
+
+    def clock_descriptor(self) -> Dict[str, object]:
+        """
+        Descripción del reloj para que las vistas lo animen por su cuenta:
+          - running: si está corriendo
+          - remaining_decis: décimas restantes en el instante 'ref_ms'
+          - ref_ms: instante (monotonic_ms) en que quedaban exactamente
+            'remaining_decis' décimas; 0 si está en pausa
+        Sólo cambia al iniciar, pausar, ajustar, resetear o terminar, así
+        que alcanza con publicarla en esos momentos.
+        """
+        if self._deadline_ns is None:
+            return {
+                "running": False,
+                "remaining_decis": -(-self._remaining_ns // _NS_PER_DECI),
+                "ref_ms": 0,
+            }
+        # Anclado a un múltiplo exacto de décima antes del deadline: el valor
+        # es estable mientras el reloj corre.
+        remaining_decis = -(-(self._deadline_ns - self._anchor_ns) // _NS_PER_DECI)
+        return {
+            "running": True,
+            "remaining_decis": remaining_decis,
+            "ref_ms": (self._deadline_ns - remaining_decis * _NS_PER_DECI) // _NS_PER_MS,
+        }
 
     # -----------------------
     # Control de tiempo
     # -----------------------
     def set_from_mmss(self, mmss: str):
         """Fija el tiempo restante a partir de 'MM:SS' y emite tick inmediato."""
-        self._remaining_decis = _mmss_to_secs(mmss) * DECIS_PER_SECOND
-        self._update_timer_interval()
-        self.tick.emit(self.remaining_secs, self.remaining_mmss)
+        self._set_remaining_ns(mmss_to_secs(mmss) * _NS_PER_SECOND)
+        self._emit_tick()
+
+    def set_remaining_ms(self, remaining_ms: int) -> None:
+        """Fija el tiempo restante en milisegundos (p. ej. al recuperar un partido)."""
+        self._set_remaining_ns(max(0, int(remaining_ms)) * _NS_PER_MS)
+        self._emit_tick()
 
     def start(self):
         """Inicia la cuenta regresiva (si hay tiempo restante)."""
-        if self._remaining_decis <= 0:
+        if self._remaining_ns <= 0:
             return
-        if not self._running:
-            self._running = True
-            self._update_timer_interval()
-            self._qtimer.start()
+        if self._deadline_ns is None:
+            self._anchor_ns = self._scheduler.monotonic_ns()
+            self._deadline_ns = self._anchor_ns + self._remaining_ns
+            self._schedule_next()
 
     def pause(self):
         """Pausa la cuenta regresiva."""
-        if self._running:
-            self._running = False
-            self._qtimer.stop()
+        if self._deadline_ns is not None:
+            self._remaining_ns = self._current_remaining_ns()
+            self._deadline_ns = None
+            self._timer.stop()
 
     def reset(self, mmss: str):
         """Resetea el temporizador al valor indicado y queda en pausa."""
         self.pause()
         self.set_from_mmss(mmss)
 
+    def reset_secs(self, secs: int) -> None:
+        """Como reset(), con segundos ya parseados (p. ej. GameType.time_per_quarter_secs)."""
+        self.pause()
+        self._set_remaining_ns(max(0, int(secs)) * _NS_PER_SECOND)
+        self._emit_tick()
+
     def adjust_seconds(self, delta_secs: int) -> None:
         """Ajusta el tiempo restante sumando o restando segundos."""
 
@@ -114,50 +493,74 @@ class CountdownTimer(QObject):
         if not delta:
             return
 
-        self._remaining_decis = max(0, self._remaining_decis + delta * DECIS_PER_SECOND)
-        if self._remaining_decis == 0 and self._running:
+        remaining = max(0, self._current_remaining_ns() + delta * _NS_PER_SECOND)
+        if remaining == 0 and self.is_running:
             # Si se agotó el tiempo mientras estaba corriendo, detenemos el reloj
             self.pause()
-
-        self._update_timer_interval()
-        self.tick.emit(self.remaining_secs, self.remaining_mmss)
+        self._set_remaining_ns(remaining)
+        self._emit_tick()
 
     # -----------------------
     # Interno
     # -----------------------
-    def _update_timer_interval(self) -> None:
-        """Ajusta el intervalo del QTimer según el tiempo restante."""
+    def _current_remaining_ns(self) -> int:
+        if self._deadline_ns is None:
+            return self._remaining_ns
+        return max(0, self._deadline_ns - self._scheduler.monotonic_ns())
 
-        if self._remaining_decis > self._CRITICAL_THRESHOLD_DECIS:
-            interval = self._LONG_INTERVAL_MS
-        else:
-            interval = self._SHORT_INTERVAL_MS
-        if self._qtimer.interval() != interval:
-            self._qtimer.setInterval(interval)
+    def _set_remaining_ns(self, remaining_ns: int) -> None:
+        self._remaining_ns = remaining_ns
+        if self._deadline_ns is not None:
+            self._anchor_ns = self._scheduler.monotonic_ns()
+            self._deadline_ns = self._anchor_ns + remaining_ns
+            self._schedule_next()
 
-    def _on_timeout(self):
-        if self._remaining_decis <= 0:
-            self.pause()
-            self.finished.emit()
-            return
+    def _unit_ms(self, remaining_ns: int) -> int:
+        """Resolución visible: segundos enteros fuera del último minuto."""
+
+        if remaining_ns > self._CRITICAL_THRESHOLD_MS * _NS_PER_MS:
+            return 1000
+        return 1000 // self._resolution
+
+    def _display_ms(self, remaining_ns: int) -> int:
+        """Redondea hacia arriba a la unidad visible (como un reloj de juego)."""
 
-        if self._remaining_decis > self._CRITICAL_THRESHOLD_DECIS:
-            step = DECIS_PER_SECOND
-        else:
-            step = 1
+        unit_ns = self._unit_ms(remaining_ns) * _NS_PER_MS
+        return -(-remaining_ns // unit_ns) * unit_ns // _NS_PER_MS
 
-        self._remaining_decis = max(0, self._remaining_decis - step)
+    def _emit_tick(self) -> None:
+        self._last_display_ms = self._display_ms(self._current_remaining_ns())
         self.tick.emit(self.remaining_secs, self.remaining_mmss)
 
-        if self._remaining_decis <= 0:
-            # asegurar estado consistente y notificar fin
-            self.pause()
-            self.finished.emit()
-        else:
-            self._update_timer_interval()
+    def _schedule_next(self) -> None:
+        """Programa el próximo timeout justo en el siguiente cambio visible."""
 
+        remaining_ns = self._current_remaining_ns()
+        display_ms = self._display_ms(remaining_ns)
+        next_display_ms = display_ms - self._unit_ms(remaining_ns)
+        wait_ns = remaining_ns - max(0, next_display_ms) * _NS_PER_MS
+        wait_ms = max(0, -(-wait_ns // _NS_PER_MS))
 
-# Helpers públicos
-mmss_to_secs = _mmss_to_secs
-secs_to_mmss = _secs_to_mmss
+        self._due_ns = self._scheduler.monotonic_ns() + wait_ms * _NS_PER_MS
+        self._timer.start(wait_ms, precise=display_ms <= self._PRECISE_THRESHOLD_MS)
+
+    def _on_timeout(self):
+        if self._deadline_ns is None:
+            return
+
+        if metrics.enabled:
+            late_ns = self._scheduler.monotonic_ns() - self._due_ns
+            metrics.observe("timer_lateness_ms", max(0, late_ns) / _NS_PER_MS)
+
+        remaining_ns = self._current_remaining_ns()
+        if remaining_ns <= 0:
+            # asegurar estado consistente y notificar fin
+            self._deadline_ns = None
+            self._remaining_ns = 0
+            self._emit_tick()
+            self.finished.emit()
+            return
 
+        if self._display_ms(remaining_ns) != self._last_display_ms:
+            self._emit_tick()
+        self._schedule_next()
@@ -1,15 +1,26 @@
 from PySide6.QtWidgets import QApplication
 from core.controller import AppController
+from ui.scheme_handler import install_scheme_handler, register_scheme
+from ui.template_renderer import renderer
 import sys
 
 
 def main():
     """Punto de entrada principal de la aplicación BasketBoard Pro."""
+    # El esquema bbp:// tiene que declararse antes de crear la QApplication
+    register_scheme()
     app = QApplication(sys.argv)
     app.setApplicationName("BasketBoard Pro")
 
+    # Assets (CSS, JS, logos) servidos desde memoria por bbp://
+    install_scheme_handler()
+
+    # Precompilar los templates en segundo plano mientras se arma la UI
+    renderer.warm_up()
+
     # Instancia del controlador principal (maneja la lógica y las ventanas)
     controller = AppController()
+    app.aboutToQuit.connect(controller.shutdown)
     controller.show()
 
     # Ejecutar el loop de la aplicación Qt
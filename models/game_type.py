@@ -1,9 +1,26 @@
+from utils.timefmt import mmss_to_secs
+
+
 class GameType:
     """
     Representa un tipo de juego preconfigurado.
     Define la estructura temporal del partido: cantidad de cuartos,
     duración de cada cuarto, descansos entre ellos y entretiempo.
+    Es inmutable y se compara por valor. Los tiempos 'MM:SS' se validan y
+    se convierten a segundos una sola vez, al crearlo (*_secs).
     """
+
+    __slots__ = (
+        "name",
+        "quarters",
+        "time_per_quarter",
+        "rest_between_quarters",
+        "halftime_rest",
+        "time_per_quarter_secs",
+        "rest_between_quarters_secs",
+        "halftime_rest_secs",
+    )
+
     def __init__(
         self,
         name: str,
@@ -12,11 +29,34 @@ class GameType:
         rest_between_quarters: str,
         halftime_rest: str
     ):
-        self.name = name
-        self.quarters = quarters
-        self.time_per_quarter = time_per_quarter
-        self.rest_between_quarters = rest_between_quarters
-        self.halftime_rest = halftime_rest
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "quarters", quarters)
+        object.__setattr__(self, "time_per_quarter", time_per_quarter)
+        object.__setattr__(self, "rest_between_quarters", rest_between_quarters)
+        object.__setattr__(self, "halftime_rest", halftime_rest)
+        object.__setattr__(self, "time_per_quarter_secs", mmss_to_secs(time_per_quarter))
+        object.__setattr__(self, "rest_between_quarters_secs", mmss_to_secs(rest_between_quarters))
+        object.__setattr__(self, "halftime_rest_secs", mmss_to_secs(halftime_rest))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GameType es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("GameType es inmutable")
+
+    def _key(self) -> tuple:
+        return (self.name, self.quarters, self.time_per_quarter, self.rest_between_quarters, self.halftime_rest)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameType):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return "GameType({!r}, {!r}, {!r}, {!r}, {!r})".format(*self._key())
 
     def to_dict(self) -> dict:
         return {
@@ -36,4 +76,3 @@ class GameType:
             rest_between_quarters=d.get("rest_between_quarters", "02:00"),
             halftime_rest=d.get("halftime_rest", "05:00"),
         )
-
@@ -1,10 +1,36 @@
+from typing import Dict, FrozenSet
+
+# Campos cuyo cambio cuenta como una nueva versión del partido
+_TRACKED_FIELDS = frozenset((
+    "team_local",
+    "team_visit",
+    "game_type",
+    "current_period",
+    "points_local",
+    "points_visit",
+    "fouls_local",
+    "fouls_visit",
+))
+_UNSET = object()
+
+
 class Match:
     """
     Representa un partido de básquet en curso o a disputar.
     Contiene la referencia a los equipos, el tipo de juego y el estado actual.
+
+    Cada asignación que cambia un valor incrementa 'version' y recuerda en
+    qué versión cambió ese campo, así los consumidores preguntan qué cambió
+    desde la última versión que vieron (changed_since) en lugar de
+    reconstruir todo. Las asignaciones que no cambian el valor no cuentan.
     """
 
+    __slots__ = tuple(sorted(_TRACKED_FIELDS)) + ("version", "_field_versions")
+
     def __init__(self, team_local, team_visit, game_type):
+        object.__setattr__(self, "version", 0)
+        object.__setattr__(self, "_field_versions", {})
+
         # --- Datos base ---
         self.team_local = team_local
         self.team_visit = team_visit
@@ -17,6 +43,35 @@ class Match:
         self.fouls_local = 0
         self.fouls_visit = 0
 
+        # Un partido recién creado arranca en la versión 0, sin cambios
+        object.__setattr__(self, "version", 0)
+        self._field_versions.clear()
+
+    def __setattr__(self, name, value):
+        if name in _TRACKED_FIELDS:
+            if getattr(self, name, _UNSET) == value:
+                return
+            object.__setattr__(self, name, value)
+            version = self.version + 1
+            object.__setattr__(self, "version", version)
+            self._field_versions[name] = version
+            return
+        object.__setattr__(self, name, value)
+
+    # -------------------------------------------------
+    # 🔎 Detección de cambios
+    # -------------------------------------------------
+    def changed_since(self, version: int) -> FrozenSet[str]:
+        """Campos modificados después de 'version'."""
+        if version >= self.version:
+            return frozenset()
+        return frozenset(name for name, changed in self._field_versions.items() if changed > version)
+
+    @property
+    def field_versions(self) -> Dict[str, int]:
+        """Versión en la que cambió cada campo por última vez (copia)."""
+        return dict(self._field_versions)
+
     # -------------------------------------------------
     # 📦 Métodos auxiliares
     # -------------------------------------------------
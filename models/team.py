@@ -4,12 +4,37 @@ class Team:
     - name: nombre del club/equipo
     - logo: ruta al archivo de imagen (PNG/JPG/SVG)
     - color_primary / color_secondary: colores hex (#rrggbb)
+    Es inmutable y se compara por valor: un equipo recuperado del journal
+    es igual (y tiene el mismo hash) que el preset del que salió.
     """
+
+    __slots__ = ("name", "logo", "color_primary", "color_secondary")
+
     def __init__(self, name: str, logo: str, color_primary: str, color_secondary: str):
-        self.name = name
-        self.logo = logo
-        self.color_primary = color_primary
-        self.color_secondary = color_secondary
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "logo", logo)
+        object.__setattr__(self, "color_primary", color_primary)
+        object.__setattr__(self, "color_secondary", color_secondary)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Team es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Team es inmutable")
+
+    def _key(self) -> tuple:
+        return (self.name, self.logo, self.color_primary, self.color_secondary)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Team):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"Team({self.name!r}, {self.logo!r}, {self.color_primary!r}, {self.color_secondary!r})"
 
     def to_dict(self) -> dict:
         return {
@@ -27,4 +52,3 @@ class Team:
             color_primary=d.get("color_primary", "#000000"),
             color_secondary=d.get("color_secondary", "#FFFFFF"),
         )
-
@@ -0,0 +1,2 @@
+# Paquete de servicios de red locales (asyncio, sin dependencias externas).
+# Replica el tablero hacia displays remotos de la LAN.
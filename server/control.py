@@ -0,0 +1,248 @@
+"""
+API HTTP/JSON de control para tablets en la LAN (asyncio, hilo propio).
+
+Los planilleros y el oficial de mesa mandan comandos (core.commands) desde
+otros dispositivos:
+
+    POST /commands                 {"op": "score_local", "args": [2]}
+    POST /courts/2/commands        {"commands": [{"op": "score_local", "args": [2]},
+                                                 {"op": "foul_visit"}]}
+    GET  /state, /courts/2/state   {"version": ..., "state": {...}}
+
+El lote se valida en el hilo del servidor; si es válido se aplica entero
+en el hilo de Qt con una sola publicación del estado y la respuesta trae
+la versión nueva ({"version": 42, "applied": 2}). Los pedidos que llegan
+mientras el hilo de Qt está ocupado comparten un único salto al hilo de
+Qt (y uno de vuelta), igual que las difusiones de server.fanout. Las
+conexiones son keep-alive: un cliente manda muchos comandos por el mismo
+socket sin pagar el handshake de TCP cada vez.
+
+Con un token configurado, cada pedido tiene que traer
+"Authorization: Bearer <token>". Sin token el servidor sólo escucha en
+127.0.0.1: no arranca en una interfaz de la LAN sin autenticación.
+"""
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.commands import CommandError, parse_commands
+from utils import logger, metrics
+
+from .http import BadRequest, Request, read_request, write_response
+from .loop_thread import LoopThread
+
+_JSON = "application/json; charset=utf-8"
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _resolve_all(results: List[Tuple[asyncio.Future, object, Optional[BaseException]]]) -> None:
+    for future, result, error in results:
+        # El cliente pudo haberse desconectado mientras tanto
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class ControlServer:
+    """
+    Recibe comandos por HTTP y los aplica en el GameManager de cada cancha.
+    'dispatch' ejecuta un callable en el hilo de Qt
+    (core.qt_dispatch.MainThreadDispatcher.call_soon).
+
+    Sin 'host' escucha en toda la LAN si hay token y sólo en 127.0.0.1 si
+    no lo hay; un host que no es loopback sin token es un ValueError.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Callable[[], None]], None],
+        host: Optional[str] = None,
+        port: int = 8770,
+        token: str = "",
+    ):
+        if host is None:
+            host = "0.0.0.0" if token else "127.0.0.1"
+        elif not token and not _is_loopback(host):
+            raise ValueError(f"La API de control en {host} necesita un token (control_api_token)")
+        self.host = host
+        self.port = port
+        self._dispatch = dispatch
+        self._token = token
+        self._managers: Dict[int, object] = {}
+
+        # stop() bloquea el hilo de Qt: un pedido que espera a _drain no
+        # terminaría nunca, así que al cerrar se cancelan los pendientes.
+        self._thread = LoopThread(
+            self._handle_connection, "control-api", backlog=256, on_close=self._cancel_pending
+        )
+
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[Callable[[], object], asyncio.Future]] = []
+        self._drain_scheduled = False
+
+        self._requests = 0
+        self._batches = 0
+        self._commands = 0
+        self._rejected = 0
+        self._hops = 0
+
+    # -------------------------------------------------
+    # ▶️ Ciclo de vida (llamado desde el hilo de Qt)
+    # -------------------------------------------------
+    def add_court(self, court_id: int, manager) -> None:
+        self._managers[court_id] = manager
+
+    def start(self) -> int:
+        """Arranca el servidor (ver server.loop_thread) y devuelve el puerto en uso."""
+        self.port = self._thread.start(self.host, self.port)
+        return self.port
+
+    def stop(self) -> None:
+        self._thread.stop()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": self._thread.connections,
+            "requests": self._requests,
+            "batches": self._batches,
+            "commands": self._commands,
+            "rejected": self._rejected,
+            "qt_hops": self._hops,
+        }
+
+    # -------------------------------------------------
+    # 🔀 Salto al hilo de Qt
+    # -------------------------------------------------
+    async def _call_in_qt(self, job: Callable[[], object]) -> object:
+        future = self._thread.loop.create_future()
+        with self._lock:
+            self._pending.append((job, future))
+            schedule = not self._drain_scheduled
+            self._drain_scheduled = True
+        if schedule:
+            self._dispatch(self._drain)
+        return await future
+
+    def _drain(self) -> None:
+        """En el hilo de Qt: ejecuta todo lo encolado y devuelve los resultados de una vez."""
+        with self._lock:
+            jobs, self._pending = self._pending, []
+            self._drain_scheduled = False
+        # Vacío si stop() ya canceló lo pendiente (el loop puede estar cerrado)
+        if not jobs:
+            return
+        self._hops += 1
+        results = []
+        for job, future in jobs:
+            try:
+                results.append((future, job(), None))
+            except Exception as exc:  # un lote que falla no debe frenar a los demás
+                results.append((future, None, exc))
+        self._thread.loop.call_soon_threadsafe(_resolve_all, results)
+
+    # -------------------------------------------------
+    # 🔁 Loop de asyncio (hilo propio)
+    # -------------------------------------------------
+    def _cancel_pending(self) -> None:
+        with self._lock:
+            jobs, self._pending = self._pending, []
+        for _job, future in jobs:
+            future.cancel()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except BadRequest as exc:
+                    self._write_json(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+                self._requests += 1
+                try:
+                    status, payload = await self._route(request)
+                except Exception as exc:  # el lote falló en el hilo de Qt
+                    self._rejected += 1
+                    logger.error(f"API de control: error al atender {request.method} {request.path}: {exc!r}")
+                    status, payload = 500, {"error": str(exc) or type(exc).__name__}
+                self._write_json(writer, status, payload, keep_alive=request.keep_alive)
+                await writer.drain()
+                if not request.keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write_json(writer: asyncio.StreamWriter, status: int, payload: Dict[str, object], keep_alive: bool) -> None:
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        write_response(writer, status, body, _JSON, {"Cache-Control": "no-store"}, keep_alive=keep_alive)
+
+    # -------------------------------------------------
+    # 🧭 Rutas
+    # -------------------------------------------------
+    def _authorized(self, request: Request) -> bool:
+        if not self._token:
+            return True
+        header = request.headers.get("authorization", "")
+        scheme, _, token = header.partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(token.strip(), self._token)
+
+    def _resolve_path(self, path: str) -> Tuple[Optional[int], str]:
+        """'/courts/2/commands' -> (2, 'commands'); '/state' -> (1, 'state')."""
+        parts = [part for part in path.split("/") if part]
+        if len(parts) == 1:
+            return 1, parts[0]
+        if len(parts) == 3 and parts[0] == "courts" and parts[1].isdigit():
+            return int(parts[1]), parts[2]
+        return None, ""
+
+    async def _route(self, request: Request) -> Tuple[int, Dict[str, object]]:
+        if not self._authorized(request):
+            return 401, {"error": "Token inválido"}
+        court_id, action = self._resolve_path(request.path)
+        manager = self._managers.get(court_id) if court_id is not None else None
+        if manager is None or action not in ("commands", "state"):
+            return 404, {"error": "Ruta inexistente"}
+
+        if action == "state":
+            if request.method != "GET":
+                return 405, {"error": "Usar GET"}
+            version, state = await self._call_in_qt(
+                lambda: (manager.snapshots.version, manager.snapshots.display_state())
+            )
+            # FrozenDict: se serializa acá, fuera del hilo de Qt
+            return 200, {"version": version, "state": state}
+
+        if request.method != "POST":
+            return 405, {"error": "Usar POST"}
+        try:
+            commands = parse_commands(json.loads(request.body or b"null"))
+        except ValueError as exc:  # JSON inválido o CommandError
+            self._rejected += 1
+            message = str(exc) if isinstance(exc, CommandError) else "JSON inválido"
+            return 400, {"error": message}
+        version = await self._call_in_qt(lambda: manager.apply_commands(commands))
+        self._batches += 1
+        self._commands += len(commands)
+        metrics.count("control_batches")
+        metrics.count("control_commands", len(commands))
+        return 200, {"version": version, "applied": len(commands)}
@@ -0,0 +1,257 @@
+"""
+Servidor de displays remotos para la LAN (asyncio + Server-Sent Events).
+
+Los navegadores abren la misma página de display que usa la aplicación
+(templates de ui/templates/display) y reciben el estado por /events. El
+servidor corre en su propio hilo con su propio loop de asyncio
+(server.loop_thread): desde el hilo de Qt sólo se llama a publish(), que
+guarda el último estado y agenda una difusión sin serializar ni escribir
+sockets.
+
+Cada cliente tiene un buzón de un solo frame: si todavía no terminó de
+enviar el anterior, el frame pendiente se reemplaza por el más nuevo
+(los clientes lentos saltean frames viejos en lugar de acumular atraso).
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import PurePosixPath
+from typing import Callable, Dict, Optional, Set
+
+from ui.asset_cache import asset_cache
+from ui.template_renderer import renderer
+from utils import metrics
+
+from .http import BadRequest, Request, read_request, write_response
+from .loop_thread import LoopThread
+
+DEFAULT_TEMPLATE = "display/scoreboard_widescreen/index.html"
+
+# Sólo estos directorios se publican como assets
+_ASSET_PREFIXES = ("ui/static/", "ui/templates/display/", "data/logos/")
+_PING_INTERVAL_S = 15.0
+_WRITE_BUFFER_HIGH = 16 * 1024
+
+
+class _SseClient:
+    __slots__ = ("writer", "transport", "pending", "wake", "sent", "dropped")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.transport = writer.transport
+        self.pending: Optional[bytes] = None
+        self.wake = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, frame: bytes) -> None:
+        # Camino rápido: el socket tiene lugar y no hay nada en espera
+        if self.pending is None and self.transport.get_write_buffer_size() < _WRITE_BUFFER_HIGH:
+            self.transport.write(frame)
+            self.sent += 1
+            return
+        if self.pending is not None:
+            self.dropped += 1
+        self.pending = frame
+        self.wake.set()
+
+
+class FanoutServer:
+    """
+    Difunde el estado del display a muchos navegadores.
+    Rutas:
+      - GET /?template=<nombre>   página del display (p. ej. scoreboard_dark)
+      - GET /events               stream SSE con el último estado
+      - GET /ui/..., /data/logos/...  assets de los templates
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        default_template: str = DEFAULT_TEMPLATE,
+        clock_ms: Optional[Callable[[], int]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.default_template = default_template
+        # Base de tiempo de los descriptores de reloj (se envía como 'now_ms')
+        self._clock_ms = clock_ms or (lambda: time.monotonic_ns() // 1_000_000)
+
+        self._thread = LoopThread(self._handle_connection, "display-fanout", backlog=1024)
+
+        self._lock = threading.Lock()
+        self._latest_state: Optional[Dict[str, object]] = None
+        # Cuenta publicaciones: junto con el template identifica el HTML (cache del renderer)
+        self._state_version = 0
+        self._broadcast_scheduled = False
+        self._latest_data: Optional[str] = None
+        self._frame_id = 0
+
+        self._clients: Set[_SseClient] = set()
+        self._templates = {name for name in renderer.template_names() if name.startswith("display/")}
+        self._frames_published = 0
+        self._dropped_closed = 0
+
+    # -------------------------------------------------
+    # ▶️ Ciclo de vida (llamado desde el hilo de Qt)
+    # -------------------------------------------------
+    def start(self) -> int:
+        """Arranca el servidor (ver server.loop_thread) y devuelve el puerto en uso."""
+        self.port = self._thread.start(self.host, self.port)
+        return self.port
+
+    def stop(self) -> None:
+        self._thread.stop()
+
+    def publish(self, state: Dict[str, object]) -> None:
+        """Publica un estado nuevo. Seguro desde cualquier hilo y O(1)."""
+        with self._lock:
+            self._latest_state = state
+            self._state_version += 1
+            loop = self._thread.loop
+            if self._broadcast_scheduled or loop is None:
+                return
+            self._broadcast_scheduled = True
+        loop.call_soon_threadsafe(self._broadcast)
+
+    def stats(self) -> Dict[str, int]:
+        clients = list(self._clients)
+        return {
+            "clients": len(clients),
+            "frames_published": self._frames_published,
+            "frames_sent": sum(client.sent for client in clients),
+            "frames_dropped": sum(client.dropped for client in clients) + self._dropped_closed,
+        }
+
+    # -------------------------------------------------
+    # 🔁 Loop de asyncio (hilo propio)
+    # -------------------------------------------------
+    def _broadcast(self) -> None:
+        with self._lock:
+            state = self._latest_state
+            self._broadcast_scheduled = False
+        if state is None:
+            return
+        self._frame_id += 1
+        self._frames_published += 1
+        self._latest_data = json.dumps(state, separators=(",", ":"))
+        frame = self._build_frame()
+        metrics.count("sse_frames")
+        metrics.count("sse_bytes", len(frame) * len(self._clients))
+        for client in self._clients:
+            client.offer(frame)
+
+    def _build_frame(self) -> bytes:
+        # 'now_ms' se agrega al serializar: al cliente le importa cuándo se
+        # envió el frame, no cuándo se generó el estado.
+        body = self._latest_data[:-1]
+        data = body + ("," if len(body) > 1 else "") + f'"now_ms":{self._clock_ms()}}}'
+        return f"id: {self._frame_id}\ndata: {data}\n\n".encode("utf-8")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except BadRequest as exc:
+                    write_response(writer, exc.status, str(exc).encode("utf-8"), keep_alive=False)
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+                if request.method != "GET":
+                    write_response(writer, 405, b"Method Not Allowed", keep_alive=request.keep_alive)
+                elif request.path == "/events":
+                    await self._stream_events(writer)
+                    return
+                elif request.path in ("/", "/index.html"):
+                    self._serve_page(request, writer)
+                else:
+                    self._serve_asset(request, writer)
+                await writer.drain()
+                if not request.keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+
+    # -------------------------------------------------
+    # 📄 Página, assets y stream
+    # -------------------------------------------------
+    def _resolve_template(self, name: Optional[str]) -> Optional[str]:
+        if not name:
+            return self.default_template
+        candidate = name if name.endswith(".html") else f"display/{name}/index.html"
+        return candidate if candidate in self._templates else None
+
+    def _serve_page(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        template_name = self._resolve_template(request.query_value("template"))
+        if template_name is None:
+            write_response(writer, 404, b"Template inexistente", keep_alive=request.keep_alive)
+            return
+        with self._lock:
+            state, version = self._latest_state, self._state_version
+        if state is None:
+            write_response(writer, 503, b"Sin estado publicado", keep_alive=request.keep_alive)
+            return
+        context = {
+            "state": state,
+            "static_url": "ui/static",
+            "template_url": PurePosixPath("ui/templates", template_name).parent.as_posix(),
+            "events_url": "events",
+        }
+        html = renderer.render(template_name, context, cache_key=(id(self), version)).encode("utf-8")
+        write_response(writer, 200, html, "text/html; charset=utf-8",
+                       {"Cache-Control": "no-store"}, keep_alive=request.keep_alive)
+
+    def _serve_asset(self, request: Request, writer: asyncio.StreamWriter) -> None:
+        relative = request.path.lstrip("/")
+        # Mismo cache en memoria que el esquema bbp:// de las vistas Qt; acá
+        # se revalida por mtime porque este hilo no tiene file watcher.
+        asset = asset_cache.get(relative, revalidate=True) if relative.startswith(_ASSET_PREFIXES) else None
+        if asset is None:
+            write_response(writer, 404, b"Not Found", keep_alive=request.keep_alive)
+            return
+        headers = {"ETag": asset.etag}
+        if request.headers.get("if-none-match") == asset.etag:
+            write_response(writer, 304, b"", asset.content_type, headers, keep_alive=request.keep_alive)
+            return
+        write_response(writer, 200, asset.body, asset.content_type, headers, keep_alive=request.keep_alive)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        writer.transport.set_write_buffer_limits(high=_WRITE_BUFFER_HIGH)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-store\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+            b"retry: 1000\n\n"
+        )
+        client = _SseClient(writer)
+        self._clients.add(client)
+        if self._latest_data is not None:
+            client.offer(self._build_frame())
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(client.wake.wait(), _PING_INTERVAL_S)
+                except asyncio.TimeoutError:
+                    writer.write(b": ping\n\n")
+                    await writer.drain()
+                    continue
+                client.wake.clear()
+                # La espera sólo frena a este cliente; mientras tanto su
+                # frame pendiente se reemplaza por el más reciente.
+                await writer.drain()
+                frame, client.pending = client.pending, None
+                if frame is None:
+                    continue
+                writer.write(frame)
+                client.sent += 1
+        finally:
+            self._clients.discard(client)
+            self._dropped_closed += client.dropped
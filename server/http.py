@@ -0,0 +1,117 @@
+"""
+HTTP/1.1 mínimo sobre asyncio (sin dependencias externas).
+
+Alcanza para los servicios locales del tablero: request line, headers,
+cuerpo por Content-Length y conexiones keep-alive.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+STATUS_TEXT = {
+    200: "OK",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class BadRequest(Exception):
+    """Request HTTP mal formado; se responde 400 y se cierra la conexión."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "version", "headers", "body")
+
+    def __init__(self, method: str, path: str, query: Dict[str, List[str]], version: str,
+                 headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    def query_value(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Lee un request completo; None si el cliente cerró la conexión."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial:
+            return None
+        raise BadRequest("Request incompleto")
+    except asyncio.LimitOverrunError:
+        raise BadRequest("Headers demasiado grandes", 413)
+    if len(head) > MAX_HEADER_BYTES:
+        raise BadRequest("Headers demasiado grandes", 413)
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise BadRequest("Request line inválida")
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise BadRequest("Content-Length inválido")
+    if length < 0 or length > MAX_BODY_BYTES:
+        raise BadRequest("Cuerpo demasiado grande", 413)
+    body = await reader.readexactly(length) if length else b""
+
+    url = urlsplit(target)
+    return Request(method.upper(), unquote(url.path), parse_qs(url.query), version, headers, body)
+
+
+def write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    body: bytes = b"",
+    content_type: str = "text/plain; charset=utf-8",
+    headers: Optional[Dict[str, str]] = None,
+    keep_alive: bool = True,
+) -> None:
+    """Escribe status, headers y cuerpo; quien llama hace 'await writer.drain()'."""
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}"]
+    all_headers = {
+        "Content-Type": content_type,
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+    }
+    if headers:
+        all_headers.update(headers)
+    lines.extend(f"{name}: {value}" for name, value in all_headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
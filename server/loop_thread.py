@@ -0,0 +1,134 @@
+"""
+Hilo propio con un loop de asyncio y un servidor TCP escuchando en él.
+
+Es el ciclo de vida común de los servicios de red (server.fanout,
+server.control): el hilo de Qt sólo llama a start() y stop(); todo lo demás
+corre en el loop. Cada conexión se atiende en una tarea registrada, así que
+al cerrar se cancelan todas y la espera tiene un límite: un cliente colgado
+no puede trabar el cierre de la aplicación.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Optional, Set
+
+from utils import logger
+
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+# Espera máxima al cerrar: las conexiones en curso se cancelan, no se esperan
+SHUTDOWN_TIMEOUT = 2.0
+
+
+class LoopThread:
+    """
+    Corre 'handler' para cada conexión en un loop de asyncio en un hilo daemon.
+    'on_close' (opcional) se ejecuta en el loop al cerrar, después de dejar
+    de aceptar conexiones y antes de cancelar las que siguen abiertas.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        name: str,
+        backlog: int = 100,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handler = handler
+        self._backlog = backlog
+        self._on_close = on_close
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._start_error: Optional[BaseException] = None
+        self._port = 0
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def connections(self) -> int:
+        return len(self._tasks)
+
+    # -------------------------------------------------
+    # ▶️ Ciclo de vida (llamado desde el hilo de Qt)
+    # -------------------------------------------------
+    def start(self, host: str, port: int) -> int:
+        """Arranca el loop en un hilo propio y devuelve el puerto en uso.
+
+        Si no se puede escuchar (p. ej. puerto ocupado) relanza el OSError
+        acá, en el hilo que llamó.
+        """
+        if self._thread is not None:
+            return self._port
+        self._started.clear()
+        self._start_error = None
+        self._thread = threading.Thread(target=self._run, args=(host, port), name=self.name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._start_error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._start_error
+        return self._port
+
+    def stop(self) -> None:
+        if self.loop is None or self._thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        try:
+            future.result(SHUTDOWN_TIMEOUT * 3)
+        except Exception as exc:  # el loop igual se detiene
+            logger.warning(f"{self.name}: cierre incompleto ({exc!r})")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self._thread = None
+        self.loop = None
+
+    # -------------------------------------------------
+    # 🔁 Loop de asyncio (hilo propio)
+    # -------------------------------------------------
+    def _run(self, host: str, port: int) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._serve, host, port, backlog=self._backlog)
+            )
+        except OSError as exc:
+            loop.close()
+            self._start_error = exc
+            self._started.set()
+            return
+        self._port = self._server.sockets[0].getsockname()[1]
+        self.loop = loop
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            await self._handler(reader, writer)
+        except asyncio.CancelledError:
+            # Cancelada por _shutdown: la tarea termina sin error (asyncio la loguearía)
+            pass
+        finally:
+            self._tasks.discard(task)
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        if self._on_close is not None:
+            self._on_close()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+        try:
+            await asyncio.wait_for(self._server.wait_closed(), SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.name}: quedaron conexiones sin cerrar")
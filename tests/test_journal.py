@@ -0,0 +1,52 @@
+from core.engine import MatchEngine
+from core.journal import MatchJournal
+from core.timer import VirtualClock
+from models.game_type import GameType
+from models.match import Match
+from models.team import Team
+
+
+def _engine(clock: VirtualClock) -> MatchEngine:
+    match = Match(
+        Team("Local", "", "#ff0000", "#ffffff"),
+        Team("Visitante", "", "#0000ff", "#ffffff"),
+        GameType("FIBA", 4, "10:00", "02:00", "05:00"),
+    )
+    return MatchEngine(match, scheduler=clock)
+
+
+def test_periodic_snapshot_follows_the_engine_clock(tmp_path):
+    clock = VirtualClock()
+    engine = _engine(clock)
+    journal = MatchJournal(tmp_path, snapshot_interval_s=5.0)
+    journal.attach(engine)
+    snapshots = []
+    original = journal.snapshot
+    journal.snapshot = lambda clean=False: (snapshots.append(clock.now_ms), original(clean))
+
+    engine.start_time()
+    clock.advance(12_000)
+    journal.close()
+
+    assert snapshots[:2] == [5000, 10000]
+
+
+def test_restore_publishes_once(tmp_path):
+    clock = VirtualClock()
+    engine = _engine(clock)
+    journal = MatchJournal(tmp_path)
+    journal.attach(engine)
+    engine.score_local(3)
+    engine.foul_visit()
+    engine.adjust_time(-30)
+    journal.close()
+
+    recovered = MatchJournal.recover(tmp_path)
+    restored = _engine(VirtualClock())
+    updates = []
+    restored.updated.connect(lambda: updates.append(restored.match.points_local))
+    recovered.restore(restored)
+
+    assert updates == [3]
+    assert restored.match.fouls_visit == 1
+    assert restored.timer.remaining_secs == 9 * 60 + 30
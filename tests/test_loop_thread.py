@@ -0,0 +1,60 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from server.loop_thread import SHUTDOWN_TIMEOUT, LoopThread
+
+
+async def _echo_forever(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            writer.write(line)
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def test_stop_cancels_idle_connections():
+    server = LoopThread(_echo_forever, "test-loop")
+    port = server.start("127.0.0.1", 0)
+    client = socket.create_connection(("127.0.0.1", port))
+    client.sendall(b"hola\n")
+    assert client.recv(16) == b"hola\n"
+    assert server.connections == 1
+
+    started = time.monotonic()
+    server.stop()
+
+    assert time.monotonic() - started < SHUTDOWN_TIMEOUT
+    assert server.loop is None
+    assert client.recv(16) == b""
+    client.close()
+
+
+def test_on_close_runs_in_the_loop_before_cancelling():
+    seen = []
+    server = LoopThread(_echo_forever, "test-loop", on_close=lambda: seen.append(server.connections))
+    port = server.start("127.0.0.1", 0)
+    client = socket.create_connection(("127.0.0.1", port))
+    client.sendall(b"x\n")
+    client.recv(16)
+
+    server.stop()
+    client.close()
+
+    assert seen == [1]
+
+
+def test_port_in_use_raises_in_the_caller():
+    first = LoopThread(_echo_forever, "test-loop")
+    port = first.start("127.0.0.1", 0)
+    try:
+        with pytest.raises(OSError):
+            LoopThread(_echo_forever, "test-loop").start("127.0.0.1", port)
+    finally:
+        first.stop()
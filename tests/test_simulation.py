@@ -0,0 +1,61 @@
+import pytest
+
+from core.simulation import simulate_game
+from core.timer import Scheduler, ScheduledTimer, VirtualClock
+from models.game_type import GameType
+
+# Dos cuartos de 2 s con 1 s de entretiempo: el partido completo dura 5 s virtuales
+_MINI = GameType("Mini", 2, "00:02", "00:01", "00:01")
+
+
+def test_simulated_game_runs_in_order():
+    result = simulate_game(_MINI)
+
+    assert result.periods == 2
+    assert result.virtual_ms == 5000
+    assert [(ms, name) for ms, name, _ in result.events if name != "tick"] == [
+        (2000, "siren"),
+        (2000, "finished"),
+        (3000, "siren"),
+        (3000, "countdown_finished"),
+        (5000, "siren"),
+        (5000, "finished"),
+    ]
+
+
+def test_simulated_ticks_precede_each_siren():
+    result = simulate_game(_MINI)
+    times = [ms for ms, _, _ in result.events]
+    assert times == sorted(times)
+
+    names = result.names()
+    first_siren = names.index("siren")
+    assert names[:first_siren] and set(names[:first_siren]) == {"tick"}
+    # 10 décimas por segundo en cada cuarto de 2 s
+    assert result.count("tick") >= 2 * 20
+
+
+def test_simulation_accepts_a_shared_clock():
+    clock = VirtualClock()
+    clock.advance(1000)
+    result = simulate_game(_MINI, clock=clock)
+    assert clock.now_ms == 6000
+    assert result.virtual_ms == 5000
+
+
+def test_incomplete_scheduler_fails_on_creation():
+    class NoTimers(Scheduler):
+        def monotonic_ns(self) -> int:
+            return 0
+
+    class NoStop(ScheduledTimer):
+        def start(self, delay_ms: int, precise: bool = False) -> None:
+            pass
+
+        def is_active(self) -> bool:
+            return False
+
+    with pytest.raises(TypeError):
+        NoTimers()
+    with pytest.raises(TypeError):
+        NoStop()
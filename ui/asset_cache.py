@@ -0,0 +1,143 @@
+"""In-memory copy of the static files the web views load (CSS, JS, logos)."""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Only files below these folders (relative to the project root) are served
+ASSET_PREFIXES: Tuple[str, ...] = ("ui/static/", "ui/templates/", "data/logos/", "data/cache/logos/")
+
+
+class Asset:
+    """One cached file: body, MIME type and a content-hash ETag."""
+
+    __slots__ = ("body", "content_type", "etag", "mtime_ns")
+
+    def __init__(self, body: bytes, content_type: str, mtime_ns: int) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        self.mtime_ns = mtime_ns
+
+
+def _content_type(path: Path) -> str:
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+class AssetCache:
+    """Serves asset bytes from memory, keyed by project-relative path.
+
+    ``preload`` reads every file below the asset folders once at startup;
+    after that ``get`` never touches the disk unless asked to revalidate.
+    Whoever watches the files (see ``ui.scheme_handler``) calls
+    ``invalidate`` when one changes and the next ``get`` reloads it.
+    """
+
+    def __init__(self, root: Path = _ROOT_DIR, prefixes: Tuple[str, ...] = ASSET_PREFIXES) -> None:
+        self._root = root
+        self._prefixes = prefixes
+        self._assets: Dict[str, Asset] = {}
+        self._lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def is_allowed(self, relative: str) -> bool:
+        return ".." not in PurePosixPath(relative).parts and relative.startswith(self._prefixes)
+
+    def get(self, relative: str, revalidate: bool = False) -> Optional[Asset]:
+        """Cached asset for ``relative`` (``None`` if missing or not allowed).
+
+        With ``revalidate`` the file's mtime is checked first, for callers
+        that have no file watcher (e.g. the LAN fan-out thread).
+        """
+
+        if not self.is_allowed(relative):
+            return None
+        with self._lock:
+            asset = self._assets.get(relative)
+        if asset is not None and not revalidate:
+            self._hits += 1
+            return asset
+
+        path = self._root / relative
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            if asset is not None and asset.mtime_ns == mtime_ns:
+                self._hits += 1
+                return asset
+            asset = Asset(path.read_bytes(), _content_type(path), mtime_ns)
+        except OSError:
+            self.invalidate(relative)
+            return None
+        self._misses += 1
+        with self._lock:
+            self._assets[relative] = asset
+        return asset
+
+    def invalidate(self, relative: Optional[str] = None) -> None:
+        """Forget one asset, every asset below a folder, or (``None``) all."""
+
+        with self._lock:
+            if relative is None:
+                self._assets.clear()
+                return
+            self._assets.pop(relative, None)
+            folder = relative.rstrip("/") + "/"
+            for key in [key for key in self._assets if key.startswith(folder)]:
+                del self._assets[key]
+
+    def directories(self) -> List[Path]:
+        """Existing folders below the asset prefixes (for file watchers)."""
+
+        folders: List[Path] = []
+        for prefix in self._prefixes:
+            base = self._root / prefix
+            if base.is_dir():
+                folders.append(base)
+                folders.extend(path for path in sorted(base.rglob("*")) if path.is_dir())
+        return folders
+
+    def preload(self, background: bool = True) -> None:
+        """Read every asset into memory, by default on a daemon thread."""
+
+        def _load() -> None:
+            for folder in self.directories():
+                for path in folder.iterdir():
+                    # Skip sidecar files such as "logo.png:Zone.Identifier"
+                    if path.is_file() and ":" not in path.name:
+                        self.get(path.relative_to(self._root).as_posix())
+
+        if not background:
+            _load()
+            return
+        if self._preload_thread is not None and self._preload_thread.is_alive():
+            return
+        self._preload_thread = threading.Thread(target=_load, name="asset-preload", daemon=True)
+        self._preload_thread.start()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "assets": len(self._assets),
+                "bytes": sum(len(asset.body) for asset in self._assets.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# One cache shared by the Qt views and the LAN fan-out server.
+asset_cache = AssetCache()
@@ -0,0 +1,293 @@
+"""Offscreen scoreboard frames (RGBA, fixed frame rate) for broadcast overlays."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QImage, QPainter, QRegion
+
+from core.state import clock_remaining_ms, format_remaining_ms
+from utils import logger, metrics
+from utils.frame_ring import FrameRingWriter
+
+from .native_display import ScoreboardPainter
+
+# Straight (non-premultiplied) alpha, byte order R G B A: ffmpeg's "rgba"
+FRAME_FORMAT = QImage.Format.Format_RGBA8888
+DEFAULT_FRAME_SIZE = (1920, 1080)
+DEFAULT_FRAME_FPS = 60
+_TIMING_WINDOW = 600
+
+
+def _summary(values: Deque[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        "avg": round(sum(ordered) / len(ordered), 3),
+        "p50": round(ordered[len(ordered) // 2], 3),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class RingOutput:
+    """Publishes frames into a shared-memory ring (``utils.frame_ring``).
+
+    A new raster is copied once into the next free slot; frames without
+    changes only republish the current slot, so at 60 fps an idle
+    scoreboard costs a header write per frame. Readers map the slots
+    directly and never copy through a pipe.
+    """
+
+    def __init__(self, name: str, width: int, height: int, fps: int) -> None:
+        self._ring = FrameRingWriter(name, width, height, fps)
+        self.name = self._ring.name
+
+    def publish(self, image: Optional[QImage], timestamp_ns: int) -> None:
+        if image is None:
+            self._ring.publish(0, timestamp_ns, rasterized=False)
+            return
+        slot = self._ring.next_slot()
+        view = self._ring.slot_buffer(slot)
+        view[:] = image.constBits()
+        view.release()
+        self._ring.publish(slot, timestamp_ns, rasterized=True)
+
+    def stats(self) -> Dict[str, object]:
+        return {"output": "shm", "name": self.name}
+
+    def close(self) -> None:
+        self._ring.close()
+
+
+class PipeOutput:
+    """Writes every frame, raw, to a FIFO or file from a writer thread.
+
+    The GUI thread never blocks on the encoder: ``publish`` only swaps the
+    latest frame bytes (a new object per raster, shared by the frames that
+    repeat it) and a daemon thread writes them. If the encoder falls behind,
+    frames are dropped and counted instead of queueing up. When the reader
+    closes a FIFO, the thread reopens it and waits for the next one.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._frame: Optional[bytes] = None
+        self._published = 0
+        self._written = 0
+        self._dropped = 0
+        self._write_ms: Deque[float] = deque(maxlen=_TIMING_WINDOW)
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="frame-pipe", daemon=True)
+        self._thread.start()
+
+    def publish(self, image: Optional[QImage], timestamp_ns: int) -> None:
+        with self._cond:
+            if image is not None:
+                self._frame = bytes(image.constBits())
+            self._published += 1
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+            except OSError as exc:
+                logger.warning(f"No se pudo abrir la salida de frames {self.path}: {exc}")
+                return
+            try:
+                self._write_frames(fd)
+            except OSError:
+                # The encoder closed the pipe: wait for the next reader
+                time.sleep(0.5)
+            finally:
+                os.close(fd)
+
+    def _write_frames(self, fd: int) -> None:
+        sent = self._published
+        while True:
+            with self._cond:
+                while self._published == sent and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                self._dropped += self._published - sent - 1
+                sent = self._published
+                frame = self._frame
+            if frame is None:
+                continue
+            start_ns = time.perf_counter_ns()
+            view = memoryview(frame)
+            while view:
+                view = view[os.write(fd, view):]
+            self._write_ms.append((time.perf_counter_ns() - start_ns) / 1_000_000)
+            self._written += 1
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "output": "pipe",
+            "path": self.path,
+            "written": self._written,
+            "dropped": self._dropped,
+            "write_ms": _summary(self._write_ms),
+        }
+
+    def close(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+
+class FrameSink(QObject):
+    """Renders the native scoreboard offscreen at a fixed frame rate.
+
+    Every tick publishes one frame, stamped with its ideal presentation time
+    on the monotonic clock, but the image is only re-rasterized when the
+    state snapshot or the shown clock text changed, and then only in the
+    regions that changed (same logic as ``NativeScoreboard``). The
+    background is transparent so the frames can be keyed over video as is.
+    Ticks are scheduled against absolute deadlines; a tick that arrives more
+    than a frame late skips the frames it missed instead of drifting.
+    """
+
+    def __init__(self, manager, output, width: int, height: int, fps: int = DEFAULT_FRAME_FPS,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._manager = manager
+        self._output = output
+        self.fps = fps
+        self.size = (width, height)
+        self._period_ns = 1_000_000_000 // fps
+        self._scene = ScoreboardPainter(background=None)
+        self._scene.layout(width, height)
+        self._image = QImage(width, height, FRAME_FORMAT)
+        self._image.fill(Qt.GlobalColor.transparent)
+        self._state: Dict[str, object] = {}
+        self._clock: Tuple[str, str] = ("", "regular")
+        # Regions to repaint on the next frame regardless of the state
+        self._dirty = QRegion()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self._start_ns = 0
+        self._frame_index = 0
+
+        self.frames = 0
+        self.rasters = 0
+        self.missed = 0
+        self._raster_ms: Deque[float] = deque(maxlen=_TIMING_WINDOW)
+        self._lateness_ms: Deque[float] = deque(maxlen=_TIMING_WINDOW)
+
+    def start(self) -> None:
+        self._start_ns = time.monotonic_ns()
+        self._frame_index = 0
+        self._tick()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._output.close()
+        logger.info(f"Salida de frames detenida: {self.stats()}")
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+    def _tick(self) -> None:
+        now_ns = time.monotonic_ns()
+        due_ns = self._start_ns + self._frame_index * self._period_ns
+        lateness_ns = now_ns - due_ns
+        if lateness_ns >= self._period_ns:
+            skipped = lateness_ns // self._period_ns
+            self.missed += skipped
+            self._frame_index += skipped
+            due_ns += skipped * self._period_ns
+            lateness_ns -= skipped * self._period_ns
+        self._lateness_ms.append(lateness_ns / 1_000_000)
+
+        image = self._rasterize()
+        self._output.publish(image, due_ns)
+        self.frames += 1
+        if metrics.enabled:
+            metrics.count("frames_out")
+            metrics.observe("frame_lateness_ms", lateness_ns / 1_000_000)
+
+        self._frame_index += 1
+        next_ns = self._start_ns + self._frame_index * self._period_ns
+        self._timer.start(max(0, -(-(next_ns - time.monotonic_ns()) // 1_000_000)))
+
+    def _rasterize(self) -> Optional[QImage]:
+        """Repaint what changed since the last frame (``None`` if nothing did)."""
+
+        state = self._manager.snapshots.display_state()
+        dirty, self._dirty = self._dirty, QRegion()
+        if state is not self._state:
+            dirty = dirty.united(self._scene.changed_region(self._state, state))
+            self._state = state
+        clock = state.get("clock")
+        if clock:
+            shown = format_remaining_ms(clock_remaining_ms(clock, self._manager.timer.monotonic_ms()))
+            if shown != self._clock:
+                self._clock = shown
+                dirty = dirty.united(self._scene.rects["clock"])
+        if dirty.isEmpty():
+            return None
+
+        start_ns = time.perf_counter_ns()
+        painter = QPainter(self._image)
+        self._scene.paint(painter, dirty, state, *self._clock)
+        painter.end()
+        raster_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        self._raster_ms.append(raster_ms)
+        self.rasters += 1
+        if metrics.enabled:
+            metrics.observe("frame_raster_ms", raster_ms)
+        return self._image
+
+    def reload_logos(self) -> None:
+        self._dirty = self._dirty.united(self._scene.reload_logos())
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "fps": self.fps,
+            "size": "x".join(map(str, self.size)),
+            "frames": self.frames,
+            "rasters": self.rasters,
+            "missed": self.missed,
+            "raster_ms": _summary(self._raster_ms),
+            "lateness_ms": _summary(self._lateness_ms),
+            **self._output.stats(),
+        }
+
+
+def frame_sink_from_config(manager, config: Dict[str, object], court_id: int) -> Optional[FrameSink]:
+    """FrameSink for one court as configured in ``data/config.json``.
+
+    ``frame_output`` is ``"shm"`` for the shared-memory ring (named
+    ``<frame_output_name>-<court>``) or the path of a FIFO/file for raw
+    frames, where ``{court}`` is replaced by the court number.
+    """
+
+    target = str(config.get("frame_output") or "")
+    if not target:
+        return None
+    try:
+        width, height = (int(value) for value in str(config.get("frame_output_size") or "").lower().split("x"))
+    except ValueError:
+        width, height = DEFAULT_FRAME_SIZE
+    fps = int(config.get("frame_output_fps") or DEFAULT_FRAME_FPS)
+
+    if target == "shm":
+        output = RingOutput(f"{config.get('frame_output_name') or 'bbp-frames'}-{court_id}", width, height, fps)
+        logger.info(f"Frames {width}x{height}@{fps} en memoria compartida: {output.name}")
+    else:
+        output = PipeOutput(target.replace("{court}", str(court_id)))
+        logger.info(f"Frames {width}x{height}@{fps} rgba crudos en {output.path}")
+    return FrameSink(manager, output, width, height, fps)
@@ -0,0 +1,129 @@
+"""Hidden operator panel showing the ``utils.metrics`` counters live."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QVBoxLayout, QWidget
+
+from utils import metrics
+
+
+class EventLoopLagProbe(QObject):
+    """Measures how late a fixed-interval timer fires on the GUI thread.
+
+    Any handler that blocks the event loop (a slow render, a synchronous
+    write) shows up as lag in the ``event_loop_lag_ms`` histogram. The
+    probe only runs while metrics are enabled.
+    """
+
+    def __init__(self, interval_ms: int = 100, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._interval_ns = interval_ms * 1_000_000
+        self._expected_ns = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self) -> None:
+        self._expected_ns = time.monotonic_ns() + self._interval_ns
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _on_timeout(self) -> None:
+        now_ns = time.monotonic_ns()
+        metrics.observe("event_loop_lag_ms", max(0, now_ns - self._expected_ns) / 1_000_000)
+        self._expected_ns = now_ns + self._interval_ns
+
+
+class MetricsPanel(QWidget):
+    """Tool window with the metrics snapshot, refreshed once per second.
+
+    Shared by every operator window and opened with Ctrl+Shift+M; nothing
+    is measured until the operator turns metrics on (or ``"metrics": true``
+    is set in config.json).
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent, Qt.WindowType.Tool)
+        self.setWindowTitle("BasketBoard Pro — Métricas")
+        self.resize(520, 640)
+
+        self._probe = EventLoopLagProbe(parent=self)
+
+        self._text = QPlainTextEdit(self)
+        self._text.setReadOnly(True)
+        self._text.setFont(QFont("monospace"))
+
+        self._toggle = QPushButton(self)
+        self._toggle.clicked.connect(lambda: self.set_enabled(not metrics.enabled))
+        reset = QPushButton("Reiniciar", self)
+        reset.clicked.connect(self._on_reset)
+        export = QPushButton("Exportar JSON", self)
+        export.clicked.connect(self._on_export)
+        self._status = QLabel(self)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self._toggle)
+        buttons.addWidget(reset)
+        buttons.addWidget(export)
+        buttons.addStretch(1)
+        layout = QVBoxLayout(self)
+        layout.addLayout(buttons)
+        layout.addWidget(self._text)
+        layout.addWidget(self._status)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self.set_enabled(metrics.enabled)
+
+    def set_enabled(self, enabled: bool) -> None:
+        metrics.enable(enabled)
+        if enabled:
+            self._probe.start()
+        else:
+            self._probe.stop()
+        self._toggle.setText("Desactivar" if enabled else "Activar")
+        self.refresh()
+
+    def toggle_visible(self) -> None:
+        if self.isVisible():
+            self.hide()
+            return
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def refresh(self) -> None:
+        if self.isVisible():
+            self._text.setPlainText(json.dumps(metrics.snapshot(), indent=2))
+
+    def showEvent(self, event) -> None:  # noqa: N802 - Qt override
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self.refresh()
+
+    def hideEvent(self, event) -> None:  # noqa: N802 - Qt override
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def _on_reset(self) -> None:
+        metrics.reset()
+        self.refresh()
+
+    def _on_export(self) -> None:
+        try:
+            path = metrics.export()
+        except OSError as exc:
+            self._status.setText(f"No se pudo exportar: {exc}")
+            return
+        self._status.setText(f"Exportado a {path}")
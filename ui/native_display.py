@@ -0,0 +1,295 @@
+"""QPainter scoreboard: the display without a Chromium renderer process."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QPainter, QPaintEvent, QPixmap, QRegion, QResizeEvent
+from PySide6.QtWidgets import QWidget
+
+from core.logo_pipeline import ROOT_DIR, logo_pipeline
+from core.state import clock_remaining_ms, format_remaining_ms
+from utils import metrics
+
+# Pseudo template name offered next to the HTML display templates
+NATIVE_TEMPLATE = "native/scoreboard"
+NATIVE_TEMPLATE_LABEL = "Nativo (sin navegador)"
+
+_BACKGROUND = QColor("#0b0f1a")
+_PANEL = QColor("#151b2b")
+_TEXT = QColor("#f5f7fb")
+_MUTED = QColor("#8a93a8")
+_CLOCK_REGULAR = QColor("#f5f7fb")
+_CLOCK_CRITICAL = QColor("#ff4d4f")
+
+# State keys and the regions that show them
+_FIELD_REGIONS: Dict[str, Tuple[str, ...]] = {
+    "points_local": ("score_local",),
+    "points_visit": ("score_visit",),
+    "fouls_local": ("fouls_local",),
+    "fouls_visit": ("fouls_visit",),
+    "period": ("period",),
+}
+# Keys that change colours, names or logos: repaint everything
+_LAYOUT_FIELDS = ("team_local", "team_visit", "game_type")
+
+
+def _font(pixel_size: int, bold: bool = False, monospace: bool = False) -> QFont:
+    font = QFont()
+    if monospace:
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setFamily("DejaVu Sans Mono")
+    font.setPixelSize(max(8, pixel_size))
+    font.setBold(bold)
+    return font
+
+
+class ScoreboardPainter:
+    """Layout and drawing of the native scoreboard, independent of the target.
+
+    ``NativeScoreboard`` paints it on a widget and ``ui.frame_sink`` into
+    offscreen images. ``layout`` computes the regions for a size;
+    ``paint`` draws the regions that intersect ``dirty``. With no
+    ``background`` the untouched pixels stay transparent (overlays).
+    """
+
+    def __init__(self, background: Optional[QColor] = _BACKGROUND) -> None:
+        self.background = background
+        self.bounds = QRect()
+        self.rects: Dict[str, QRect] = {}
+        self._fonts: Dict[str, QFont] = {}
+        self._logos: Dict[Tuple[str, str], Optional[QPixmap]] = {}
+
+    def layout(self, w: int, h: int) -> None:
+        self.bounds = QRect(0, 0, w, h)
+        side = int(w * 0.32)
+        center_x, center_w = side, w - 2 * side
+        row = int(h * 0.68)
+
+        def rect(x: float, y: float, width: float, height: float) -> QRect:
+            return QRect(int(x), int(y), int(width), int(height))
+
+        self.rects = {
+            "band_local": rect(0, 0, side, h * 0.03),
+            "band_visit": rect(w - side, 0, side, h * 0.03),
+            "logo_local": rect(0, h * 0.05, side * 0.3, h * 0.14),
+            "logo_visit": rect(w - side * 0.3, h * 0.05, side * 0.3, h * 0.14),
+            "name_local": rect(side * 0.3, h * 0.05, side * 0.7, h * 0.14),
+            "name_visit": rect(w - side, h * 0.05, side * 0.7, h * 0.14),
+            "score_local": rect(0, h * 0.2, side, h * 0.44),
+            "score_visit": rect(w - side, h * 0.2, side, h * 0.44),
+            "clock_label": rect(center_x, h * 0.05, center_w, h * 0.08),
+            "clock": rect(center_x, h * 0.14, center_w, h * 0.32),
+            "period": rect(center_x, h * 0.48, center_w, h * 0.12),
+            "fouls_local": rect(0, row, w / 3, h - row),
+            "fouls_visit": rect(w / 3, row, w / 3, h - row),
+            "game_type": rect(2 * w / 3, row, w - 2 * w / 3, h - row),
+        }
+        self._fonts = {
+            "name": _font(int(h * 0.06), bold=True),
+            "score": _font(int(h * 0.36), bold=True, monospace=True),
+            "label": _font(int(h * 0.04)),
+            "clock": _font(int(h * 0.26), bold=True, monospace=True),
+            "period": _font(int(h * 0.07), bold=True),
+            "detail": _font(int(h * 0.09), bold=True, monospace=True),
+            "detail_small": _font(int(h * 0.045), bold=True),
+        }
+        self._logos.clear()
+
+    def changed_region(self, previous: Dict[str, object], state: Dict[str, object]) -> QRegion:
+        """Region to repaint when the state goes from ``previous`` to ``state``."""
+
+        if not previous or any(previous.get(key) != state.get(key) for key in _LAYOUT_FIELDS):
+            self._logos.clear()
+            return QRegion(self.bounds)
+        region = QRegion()
+        for key, names in _FIELD_REGIONS.items():
+            if previous.get(key) != state.get(key):
+                for name in names:
+                    region = region.united(self.rects.get(name, QRect()))
+        return region
+
+    def reload_logos(self) -> QRegion:
+        """Drop the scaled logos (a pre-scaled variant is ready); returns the region to repaint."""
+
+        self._logos.clear()
+        return QRegion(self.rects.get("logo_local", QRect())).united(self.rects.get("logo_visit", QRect()))
+
+    def _logo(self, side: str, team: Dict[str, str]) -> Optional[QPixmap]:
+        """Team logo scaled once per layout (the pipeline already shrank it)."""
+
+        key = (side, team.get("logo") or "")
+        if key not in self._logos:
+            rect = self.rects[f"logo_{side}"]
+            pixmap = None
+            if key[1]:
+                path = Path(logo_pipeline.variant(key[1], max(rect.width(), rect.height())))
+                source = QPixmap(str(path if path.is_absolute() else ROOT_DIR / path))
+                if not source.isNull():
+                    pixmap = source.scaled(rect.size(), Qt.AspectRatioMode.KeepAspectRatio,
+                                           Qt.TransformationMode.SmoothTransformation)
+            self._logos[key] = pixmap
+        return self._logos[key]
+
+    def paint(self, painter: QPainter, dirty: QRegion, state: Dict[str, object],
+              clock_text: str, clock_style: str) -> None:
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        # Widgets already clip to the paint event; offscreen images do not
+        painter.setClipRegion(dirty)
+        if self.background is not None:
+            painter.fillRect(dirty.boundingRect(), self.background)
+        else:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(dirty.boundingRect(), Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        if not state or not self.rects:
+            return
+        rects = self.rects
+        fonts = self._fonts
+
+        def visible(name: str) -> bool:
+            return dirty.intersects(rects[name])
+
+        def text(name: str, value: object, font: str, color: QColor,
+                 align=Qt.AlignmentFlag.AlignCenter) -> None:
+            if visible(name):
+                painter.setFont(fonts[font])
+                painter.setPen(color)
+                painter.drawText(rects[name], int(align), str(value))
+
+        for side in ("local", "visit"):
+            team = state[f"team_{side}"]
+            if visible(f"band_{side}"):
+                painter.fillRect(rects[f"band_{side}"], QColor(team["color_primary"]))
+            if visible(f"logo_{side}"):
+                logo = self._logo(side, team)
+                if logo is not None:
+                    target = rects[f"logo_{side}"]
+                    x = target.x() + (target.width() - logo.width()) // 2
+                    y = target.y() + (target.height() - logo.height()) // 2
+                    painter.drawPixmap(x, y, logo)
+            text(f"name_{side}", team["name"], "name", _TEXT)
+            text(f"score_{side}", state[f"points_{side}"], "score", QColor(team["color_primary"]).lighter(130))
+
+        text("clock_label", "TIEMPO", "label", _MUTED)
+        clock_color = _CLOCK_CRITICAL if clock_style == "critical" else _CLOCK_REGULAR
+        text("clock", clock_text or state.get("time", ""), "clock", clock_color)
+        text("period", f"Período {state['period']}", "period", _MUTED)
+
+        for name, label, value in (
+            ("fouls_local", "Faltas local", state["fouls_local"]),
+            ("fouls_visit", "Faltas visita", state["fouls_visit"]),
+        ):
+            if visible(name):
+                rect = rects[name].adjusted(12, 12, -12, -12)
+                painter.fillRect(rect, _PANEL)
+                top, bottom = rect.adjusted(0, 0, 0, -rect.height() // 2), rect.adjusted(0, rect.height() // 3, 0, 0)
+                painter.setFont(fonts["label"])
+                painter.setPen(_MUTED)
+                painter.drawText(top, int(Qt.AlignmentFlag.AlignCenter), label)
+                painter.setFont(fonts["detail"])
+                painter.setPen(_TEXT)
+                painter.drawText(bottom, int(Qt.AlignmentFlag.AlignCenter), str(value))
+
+        if visible("game_type"):
+            game_type = state["game_type"]
+            rect = rects["game_type"].adjusted(12, 12, -12, -12)
+            painter.fillRect(rect, _PANEL)
+            painter.setFont(fonts["detail_small"])
+            painter.setPen(_TEXT)
+            painter.drawText(rect, int(Qt.AlignmentFlag.AlignCenter) | int(Qt.TextFlag.TextWordWrap),
+                             f"{game_type['name']}\n{game_type['time_per_quarter']} por período")
+
+
+def clock_refresh_ms(clock: Dict[str, object], remaining_ms: int) -> Optional[int]:
+    """Milliseconds until the shown clock value changes (``None`` if stopped)."""
+
+    if not clock["running"] or remaining_ms <= 0:
+        return None
+    unit = 1000 if remaining_ms > 60 * 1000 else 100
+    shown = -(-remaining_ms // unit) * unit
+    return max(1, remaining_ms - (shown - unit))
+
+
+class NativeScoreboard(QWidget):
+    """Paints the display state dict with QPainter, one region per value.
+
+    ``set_state`` takes the same dict the HTML templates receive and only
+    invalidates the rectangles whose value changed (a basket repaints one
+    score, not the window). The clock is extrapolated locally from the
+    ``clock`` descriptor, like ``ui/static/clock.js``: a precise single-shot
+    timer wakes up at the next visible change and repaints only the clock.
+    """
+
+    def __init__(self, now_ms: Callable[[], int], parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self._now_ms = now_ms
+        self._state: Dict[str, object] = {}
+        self._clock_text = ""
+        self._clock_style = "regular"
+        self._scene = ScoreboardPainter()
+
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setSingleShot(True)
+        self._clock_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._clock_timer.timeout.connect(self._update_clock)
+
+        self.paints = 0
+
+    @property
+    def _rects(self) -> Dict[str, QRect]:
+        return self._scene.rects
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    def set_state(self, state: Dict[str, object]) -> None:
+        previous = self._state
+        self._state = state
+        dirty = self._scene.changed_region(previous, state)
+        if not dirty.isEmpty():
+            self.update(dirty)
+        if previous.get("clock") != state.get("clock"):
+            self._update_clock()
+
+    def reload_logos(self) -> None:
+        self.update(self._scene.reload_logos())
+
+    def _update_clock(self) -> None:
+        clock = self._state.get("clock")
+        if not clock:
+            return
+        remaining = clock_remaining_ms(clock, self._now_ms())
+        text, style = format_remaining_ms(remaining)
+        if (text, style) != (self._clock_text, self._clock_style):
+            self._clock_text, self._clock_style = text, style
+            self.update(self._rects.get("clock", QRect()))
+        refresh = clock_refresh_ms(clock, remaining)
+        if refresh is not None:
+            self._clock_timer.start(refresh)
+        else:
+            self._clock_timer.stop()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def resizeEvent(self, event: QResizeEvent) -> None:  # noqa: N802 - Qt override
+        super().resizeEvent(event)
+        self._scene.layout(self.width(), self.height())
+
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802 - Qt override
+        start_ns = time.perf_counter_ns() if metrics.enabled else 0
+        self.paints += 1
+        painter = QPainter(self)
+        self._scene.paint(painter, event.region(), self._state, self._clock_text, self._clock_style)
+        painter.end()
+        if start_ns:
+            metrics.count("native_paints")
+            metrics.observe("native_paint_ms", (time.perf_counter_ns() - start_ns) / 1_000_000)
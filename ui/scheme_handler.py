@@ -0,0 +1,109 @@
+"""``bbp://`` URL scheme: web views load their assets from ``ui.asset_cache``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QFileSystemWatcher, QIODevice, QObject, QUrl
+from PySide6.QtWebEngineCore import (
+    QWebEngineProfile,
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+from ui.asset_cache import AssetCache, asset_cache
+
+SCHEME = b"bbp"
+SCHEME_BASE_URL = QUrl("bbp://app/")
+FILE_BASE_URL = QUrl.fromLocalFile(str(asset_cache.root) + "/")
+
+_handler: Optional["AssetSchemeHandler"] = None
+
+
+def register_scheme() -> None:
+    """Declare the scheme to Chromium; must run before QApplication exists."""
+
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    # LocalAccessAllowed keeps qrc:///qtwebchannel/qwebchannel.js loadable
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def install_scheme_handler(profile: Optional[QWebEngineProfile] = None) -> "AssetSchemeHandler":
+    """Serve ``bbp://`` from the shared cache and start preloading it."""
+
+    global _handler
+    if _handler is None:
+        _handler = AssetSchemeHandler(asset_cache)
+        (profile or QWebEngineProfile.defaultProfile()).installUrlSchemeHandler(SCHEME, _handler)
+        asset_cache.preload()
+    return _handler
+
+
+def base_url() -> QUrl:
+    """Base URL for ``setHtml``: ``bbp://app/`` once installed, else the project folder."""
+
+    return SCHEME_BASE_URL if _handler is not None else FILE_BASE_URL
+
+
+class AssetSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Answers every ``bbp://app/<path>`` request from memory.
+
+    Chromium does not keep an HTTP cache for custom schemes, so there is no
+    conditional request to answer with a 304; the ETags computed by the
+    cache are used by the LAN fan-out server instead. A
+    ``QFileSystemWatcher`` over the asset folders drops changed files from
+    the cache, and the next request reads them again.
+    """
+
+    def __init__(self, cache: AssetCache, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._cache = cache
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watch_folders()
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:  # noqa: N802 - Qt override
+        relative = job.requestUrl().path().lstrip("/")
+        asset = self._cache.get(relative)
+        if asset is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        buffer = QBuffer(job)
+        buffer.setData(QByteArray(asset.body))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(asset.content_type.encode("ascii"), buffer)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+    def _relative(self, path: str) -> str:
+        return Path(path).resolve().relative_to(self._cache.root).as_posix()
+
+    def _watch_folders(self) -> None:
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        paths = []
+        for folder in self._cache.directories():
+            paths.append(folder)
+            paths.extend(child for child in folder.iterdir() if child.is_file())
+        missing = [str(path) for path in paths if str(path) not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _on_directory_changed(self, directory: str) -> None:
+        # Added, removed or atomically replaced files
+        self._cache.invalidate(self._relative(directory))
+        self._watch_folders()
+
+    def _on_file_changed(self, path: str) -> None:
+        self._cache.invalidate(self._relative(path))
+        if Path(path).exists() and path not in self._watcher.files():
+            self._watcher.addPath(path)
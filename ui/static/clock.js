@@ -0,0 +1,99 @@
+(function () {
+    // Reloj extrapolado en el navegador. Python publica un descriptor
+    // { running, remaining_decis, ref_ms } sólo cuando el reloj arranca, se
+    // pausa o se ajusta, junto con 'now_ms' (su reloj al enviar). Con eso la
+    // página calcula el tiempo restante en cada frame sin más mensajes.
+    const CRITICAL_MS = 60 * 1000;
+
+    // Redondea hacia arriba a la unidad visible, igual que CountdownTimer.
+    function displayMs(remainingMs) {
+        const unit = remainingMs > CRITICAL_MS ? 1000 : 100;
+        return Math.ceil(remainingMs / unit) * unit;
+    }
+
+    function pad(value) {
+        return String(value).padStart(2, '0');
+    }
+
+    // Mismo formato que core.state.format_game_time.
+    function formatGameTime(remainingMs) {
+        const shown = displayMs(Math.max(0, remainingMs));
+        const secs = Math.floor(shown / 1000);
+        if (secs >= 60) {
+            return { text: `${pad(Math.floor(secs / 60))}:${pad(secs % 60)}`, critical: false };
+        }
+        const decis = Math.floor(shown / 100);
+        return { text: `:${pad(Math.floor(decis / 10))}.${decis % 10}`, critical: true };
+    }
+
+    // Mismo formato que CountdownTimer.remaining_mmss.
+    function formatMMSS(remainingMs) {
+        const secs = Math.floor(displayMs(Math.max(0, remainingMs)) / 1000);
+        return { text: `${pad(Math.floor(secs / 60))}:${pad(secs % 60)}`, critical: false };
+    }
+
+    function sameDescriptor(a, b) {
+        return Boolean(a && b)
+            && a.running === b.running
+            && a.remaining_decis === b.remaining_decis
+            && a.ref_ms === b.ref_ms;
+    }
+
+    // format(remainingMs) -> { text, critical }; render(view) sólo se llama
+    // cuando cambia el texto visible.
+    function createClock(format, render) {
+        let descriptor = null;
+        // performance.now() - reloj de Python. Cada mensaje llega con algo de
+        // demora, así que el mínimo observado es la mejor estimación.
+        let offset = Infinity;
+        let lastText = null;
+        let frame = null;
+
+        function remainingMs() {
+            if (!descriptor) {
+                return 0;
+            }
+            const base = descriptor.remaining_decis * 100;
+            if (!descriptor.running || !Number.isFinite(offset)) {
+                return base;
+            }
+            const serverNow = performance.now() - offset;
+            return Math.max(0, base - (serverNow - descriptor.ref_ms));
+        }
+
+        function draw() {
+            frame = null;
+            const remaining = remainingMs();
+            const view = format(remaining);
+            if (view.text !== lastText) {
+                lastText = view.text;
+                render(view);
+            }
+            if (descriptor && descriptor.running && remaining > 0) {
+                frame = requestAnimationFrame(draw);
+            }
+        }
+
+        return {
+            sync(next, nowMs) {
+                if (!next) {
+                    return;
+                }
+                if (typeof nowMs === 'number') {
+                    offset = Math.min(offset, performance.now() - nowMs);
+                }
+                if (sameDescriptor(descriptor, next)) {
+                    return;
+                }
+                descriptor = next;
+                if (frame !== null) {
+                    cancelAnimationFrame(frame);
+                }
+                draw();
+            },
+            remainingMs,
+        };
+    }
+
+    window.BasketBoardClock = { createClock, formatGameTime, formatMMSS };
+})();
@@ -0,0 +1,46 @@
+(function () {
+    // Buffer de comandos del operador. Cada botón o atajo encola un comando
+    // (mismos nombres que core.commands) y una vez por frame se mandan todos
+    // juntos con OperatorBridge.applyCommands: una ráfaga de teclas es un
+    // solo mensaje por el WebChannel, una sola actualización del estado y un
+    // solo refresco de las pantallas.
+    // Igual que core.commands.MAX_COMMANDS: un lote más largo se rechaza entero
+    const MAX_BATCH = 64;
+
+    function createCommandBuffer(bridge) {
+        let pending = [];
+        let scheduled = false;
+
+        function flush() {
+            scheduled = false;
+            if (!pending.length) {
+                return;
+            }
+            const queued = pending;
+            pending = [];
+            for (let i = 0; i < queued.length; i += MAX_BATCH) {
+                bridge.applyCommands(JSON.stringify(queued.slice(i, i + MAX_BATCH)));
+            }
+        }
+
+        return {
+            push(op, args = []) {
+                pending.push({ op, args });
+                if (!scheduled) {
+                    scheduled = true;
+                    // Sin frames en una pestaña oculta: se manda en la próxima vuelta del loop
+                    if (document.hidden) {
+                        window.setTimeout(flush, 0);
+                    } else {
+                        window.requestAnimationFrame(flush);
+                    }
+                }
+            },
+            // Para llamadas directas al bridge que tienen que ir después de
+            // lo encolado (p. ej. configurar el countdown o el partido).
+            flush,
+        };
+    }
+
+    window.BasketBoardCommands = { createCommandBuffer };
+})();
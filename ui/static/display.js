@@ -0,0 +1,125 @@
+(function () {
+    const eventsUrl = document.currentScript && document.currentScript.getAttribute('data-events-url');
+
+    // Capa de binding para los templates del display: el HTML se renderiza una
+    // sola vez y cada actualización sólo toca los nodos marcados con data-field.
+    const fields = Array.from(document.querySelectorAll('[data-field]')).map((el) => ({
+        el,
+        path: el.getAttribute('data-field').split('.'),
+    }));
+    const criticalNodes = Array.from(document.querySelectorAll('[data-critical-class]'));
+    const regularNodes = Array.from(document.querySelectorAll('[data-regular-class]'));
+    const timeNodes = fields.filter(({ path }) => path.length === 1 && path[0] === 'time').map(({ el }) => el);
+    const clock = window.BasketBoardClock
+        ? window.BasketBoardClock.createClock(window.BasketBoardClock.formatGameTime, renderTime)
+        : null;
+
+    function readField(state, path) {
+        let value = state;
+        for (const key of path) {
+            if (value === null || typeof value === 'undefined') {
+                return undefined;
+            }
+            value = value[key];
+        }
+        return value;
+    }
+
+    function setTimeStyle(isCritical) {
+        criticalNodes.forEach((el) => {
+            el.classList.toggle(el.getAttribute('data-critical-class'), isCritical);
+        });
+        regularNodes.forEach((el) => {
+            el.classList.toggle(el.getAttribute('data-regular-class'), !isCritical);
+        });
+    }
+
+    function renderTime(view) {
+        timeNodes.forEach((el) => {
+            el.textContent = view.text;
+        });
+        setTimeStyle(view.critical);
+    }
+
+    function applyState(state) {
+        if (!state) {
+            return;
+        }
+        // Con descriptor de reloj el tiempo lo dibuja el reloj local.
+        const localClock = Boolean(clock && state.clock);
+        fields.forEach(({ el, path }) => {
+            if (localClock && path.length === 1 && path[0] === 'time') {
+                return;
+            }
+            const value = readField(state, path);
+            if (value === null || typeof value === 'undefined') {
+                return;
+            }
+            const text = String(value);
+            if (el.textContent !== text) {
+                el.textContent = text;
+            }
+        });
+
+        if (localClock) {
+            clock.sync(state.clock, state.now_ms);
+        } else {
+            setTimeStyle(state.time_style === 'critical');
+        }
+    }
+
+    window.BasketBoardDisplay = { applyState };
+
+    if (eventsUrl) {
+        connectEventSource(eventsUrl);
+        return;
+    }
+
+    if (typeof qt === 'undefined' || !qt.webChannelTransport) {
+        console.error('Qt WebChannel no está disponible.');
+        return;
+    }
+
+    new QWebChannel(qt.webChannelTransport, (channel) => {
+        const bridge = channel.objects.DisplayBridge;
+        if (!bridge) {
+            console.error('No se encontró DisplayBridge.');
+            return;
+        }
+        bridge.stateUpdated.connect((payload) => {
+            try {
+                applyState(JSON.parse(payload));
+            } catch (error) {
+                console.error('No se pudo actualizar el estado', error);
+            }
+        });
+        bridge.requestInitialState();
+    });
+
+    // Display remoto (navegador en la LAN): el estado llega por Server-Sent
+    // Events. Equipos y tipo de juego están en el HTML renderizado, así que si
+    // cambian se recarga la página para obtener el nuevo layout.
+    function connectEventSource(url) {
+        const layoutKeys = ['team_local', 'team_visit', 'game_type'];
+        let layout = null;
+        const source = new EventSource(url);
+        source.onmessage = (event) => {
+            let state;
+            try {
+                state = JSON.parse(event.data);
+            } catch (error) {
+                console.error('No se pudo actualizar el estado', error);
+                return;
+            }
+            const current = JSON.stringify(layoutKeys.map((key) => state[key]));
+            if (layout === null) {
+                layout = current;
+            } else if (layout !== current) {
+                source.close();
+                window.location.reload();
+                return;
+            }
+            applyState(state);
+        };
+    }
+})();
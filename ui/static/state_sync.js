@@ -0,0 +1,36 @@
+(function () {
+    // Estado del operador por versiones. OperatorBridge publica
+    // { version, full, state, now_ms }: un snapshot completo o un parche con
+    // sólo los campos que cambiaron. Los parches se aplican en orden; si
+    // falta uno se pide un snapshot completo y se descartan los parches
+    // hasta que llegue.
+    function createStateSync(bridge, onState) {
+        let current = null;
+        let version = 0;
+        let awaitingSnapshot = false;
+        return {
+            apply(message) {
+                if (!message) {
+                    return;
+                }
+                if (message.full) {
+                    current = message.state;
+                    awaitingSnapshot = false;
+                } else if (current && message.version === version + 1) {
+                    current = Object.assign({}, current, message.state);
+                } else {
+                    // Se perdió un parche: pedimos un snapshot completo una sola vez.
+                    if (!awaitingSnapshot) {
+                        awaitingSnapshot = true;
+                        bridge.requestInitialState();
+                    }
+                    return;
+                }
+                version = message.version;
+                onState(current, message.now_ms);
+            },
+        };
+    }
+
+    window.BasketBoardStateSync = { createStateSync };
+})();
@@ -0,0 +1,181 @@
+"""Cached index of the HTML templates available for each UI section."""
+
+from __future__ import annotations
+
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, Signal
+
+from ui.template_renderer import renderer
+
+TEMPLATES_ROOT = Path(__file__).resolve().parent / "templates"
+SECTIONS = ("display", "operator")
+
+
+def _template_label(template_path: str) -> str:
+    path = Path(template_path)
+    if path.stem.lower() == "index" and path.parent != Path("."):
+        raw = path.parent.name
+    else:
+        raw = path.stem
+    stem = raw.replace("_", " ").replace("-", " ")
+    return stem.title()
+
+
+def _template_assets_url(template_name: str) -> str:
+    """Return the URL path where the template assets live."""
+
+    path = PurePosixPath(template_name)
+    directory = path.parent
+    if str(directory) in {".", ""}:
+        return "ui/templates"
+    return (PurePosixPath("ui/templates") / directory).as_posix()
+
+
+class TemplateInfo:
+    """Metadata cached for one template (``<section>/<name>/index.html``)."""
+
+    __slots__ = ("name", "label", "assets_url", "directory")
+
+    def __init__(self, name: str, directory: Path) -> None:
+        self.name = name
+        self.label = _template_label(name)
+        self.assets_url = _template_assets_url(name)
+        self.directory = directory
+
+
+class TemplateRegistry(QObject):
+    """Scans the template folders once and keeps them in sync via a watcher.
+
+    Lookups never touch the disk. ``QFileSystemWatcher`` reports new or
+    removed template folders (``templatesChanged`` with the section name) and
+    edits inside an existing template (``templateModified`` with its name), so
+    only the affected section or template is rescanned.
+    """
+
+    templatesChanged = Signal(str)
+    templateModified = Signal(str)
+
+    def __init__(self, root: Path = TEMPLATES_ROOT, sections: Tuple[str, ...] = SECTIONS) -> None:
+        super().__init__()
+        self._root = root
+        self._sections = sections
+        self._templates: Dict[str, Tuple[str, ...]] = {}
+        self._info: Dict[str, TemplateInfo] = {}
+        self._options: Dict[str, List[Dict[str, str]]] = {}
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+        for section in sections:
+            self._scan_section(section)
+
+    # ------------------------------------------------------------------
+    # Lookups (memory only)
+    # ------------------------------------------------------------------
+    def templates(self, section: str) -> Tuple[str, ...]:
+        return self._templates.get(section, ())
+
+    def options(self, section: str) -> List[Dict[str, str]]:
+        """``{"value", "label"}`` entries for the template pickers."""
+
+        return self._options.get(section, [])
+
+    def info(self, template_name: str) -> Optional[TemplateInfo]:
+        return self._info.get(template_name)
+
+    def label(self, template_name: str) -> str:
+        info = self._info.get(template_name)
+        return info.label if info else _template_label(template_name)
+
+    def assets_url(self, template_name: str) -> str:
+        info = self._info.get(template_name)
+        return info.assets_url if info else _template_assets_url(template_name)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+    def _section_dir(self, section: str) -> Path:
+        return self._root / section
+
+    def _watch(self, *paths: Path) -> None:
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        missing = [str(path) for path in paths if path.exists() and str(path) not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _scan_section(self, section: str) -> bool:
+        """Rescan one section; return True if its template list changed."""
+
+        base_dir = self._section_dir(section)
+        names: List[str] = []
+        if base_dir.exists():
+            self._watch(base_dir)
+            for path in sorted(base_dir.glob("*/index.html")):
+                if not path.is_file():
+                    continue
+                name = path.relative_to(self._root).as_posix()
+                names.append(name)
+                if name not in self._info:
+                    self._info[name] = TemplateInfo(name, path.parent)
+                self._watch(path.parent, *(child for child in path.parent.iterdir() if child.is_file()))
+
+        previous = self._templates.get(section)
+        current = tuple(names)
+        for stale in set(previous or ()) - set(current):
+            self._info.pop(stale, None)
+        self._templates[section] = current
+        self._options[section] = [
+            {"value": name, "label": self._info[name].label} for name in current
+        ]
+        return previous is not None and previous != current
+
+    def _template_for_path(self, path: Path) -> Optional[str]:
+        for name, info in self._info.items():
+            if path == info.directory or info.directory in path.parents:
+                return name
+        return None
+
+    # ------------------------------------------------------------------
+    # Watcher callbacks
+    # ------------------------------------------------------------------
+    def _on_directory_changed(self, directory: str) -> None:
+        path = Path(directory)
+        for section in self._sections:
+            if path == self._section_dir(section):
+                if self._scan_section(section):
+                    self.templatesChanged.emit(section)
+                return
+
+        name = self._template_for_path(path)
+        if name is None:
+            return
+        section = PurePosixPath(name).parts[0]
+        if self._scan_section(section):
+            self.templatesChanged.emit(section)
+        if name in self._info:
+            self.templateModified.emit(name)
+
+    def _on_file_changed(self, file_path: str) -> None:
+        path = Path(file_path)
+        # Editors often replace files atomically, which drops the watch.
+        self._watch(path)
+        name = self._template_for_path(path)
+        if name is not None:
+            self.templateModified.emit(name)
+
+
+_registry: Optional[TemplateRegistry] = None
+
+
+def template_registry() -> TemplateRegistry:
+    """Shared registry, created lazily once the Qt application exists."""
+
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry()
+        # Connected first so compiled copies are gone before any view re-renders.
+        _registry.templateModified.connect(renderer.invalidate)
+    return _registry
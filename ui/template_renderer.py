@@ -2,32 +2,151 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from utils import metrics
 
 
 _UI_DIR = Path(__file__).resolve().parent
 _TEMPLATES_DIR = _UI_DIR / "templates"
+_BYTECODE_CACHE_DIR = _UI_DIR.parent / "data" / "cache" / "jinja"
+
+
+def _fingerprint(context: Dict[str, Any]) -> str:
+    """Stable digest of a render context, used as the output cache key."""
+
+    payload = json.dumps(context, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 class TemplateRenderer:
-    """Wrapper around Jinja2 to render UI templates."""
+    """Wrapper around Jinja2 to render UI templates.
+
+    Compiled templates are persisted in an on-disk bytecode cache, so a new
+    process skips parsing, and kept in memory once loaded. Rendered output is
+    memoized in a small LRU keyed by template name and either a caller key
+    (e.g. snapshot version plus layout key, so a hit is a dict lookup) or a
+    fingerprint of the context; ``invalidate`` drops both when a template
+    changes on disk. Work started before an invalidation never stores its
+    result afterwards, so a pre-edit template cannot come back.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        bytecode_cache_dir: Optional[Path] = _BYTECODE_CACHE_DIR,
+        output_cache_size: int = 64,
+    ) -> None:
         loader = FileSystemLoader(str(_TEMPLATES_DIR))
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+            except OSError:
+                bytecode_cache = None
         self._env = Environment(
             loader=loader,
             autoescape=select_autoescape(["html", "xml"]),
             enable_async=False,
+            bytecode_cache=bytecode_cache,
+            # Changes are pushed through invalidate() instead of a stat per lookup.
+            auto_reload=False,
+            # self._templates is the only in-memory cache, guarded by the
+            # invalidation generation (Jinja's own cache could be refilled
+            # with a pre-edit template by a concurrent warm-up).
+            cache_size=0,
         )
+        self._templates: Dict[str, Template] = {}
+        self._output: "OrderedDict[Tuple[str, Hashable], str]" = OrderedDict()
+        self._output_cache_size = output_cache_size
+        self._lock = threading.Lock()
+        # Bumped by invalidate(); results computed under an older value are dropped
+        self._generation = 0
+        self._warm_up_thread: Optional[threading.Thread] = None
 
-    def render(self, template_name: str, context: Dict[str, Any]) -> str:
+    def _get_template(self, template_name: str) -> Template:
+        with self._lock:
+            template = self._templates.get(template_name)
+            generation = self._generation
+        if template is not None:
+            return template
+        # Compiled outside the lock: warm-up must not block renders
         template = self._env.get_template(template_name)
-        return template.render(**context)
+        with self._lock:
+            if generation == self._generation:
+                template = self._templates.setdefault(template_name, template)
+        return template
+
+    def render(self, template_name: str, context: Dict[str, Any], cache_key: Optional[Hashable] = None) -> str:
+        """Render ``template_name``; ``cache_key`` must identify ``context`` completely."""
+
+        key = (template_name, _fingerprint(context) if cache_key is None else cache_key)
+        with self._lock:
+            html = self._output.get(key)
+            generation = self._generation
+            if html is not None:
+                self._output.move_to_end(key)
+                metrics.count("render_cache_hits")
+                return html
+
+        html = self._get_template(template_name).render(**context)
+        metrics.count("renders")
+
+        with self._lock:
+            if generation == self._generation:
+                self._output[key] = html
+                if len(self._output) > self._output_cache_size:
+                    self._output.popitem(last=False)
+        return html
+
+    def invalidate(self, template_name: Optional[str] = None) -> None:
+        """Forget compiled and rendered copies of a template (or of all)."""
+
+        with self._lock:
+            self._generation += 1
+            if template_name is None:
+                self._templates.clear()
+                self._output.clear()
+            else:
+                self._templates.pop(template_name, None)
+                for key in [key for key in self._output if key[0] == template_name]:
+                    del self._output[key]
+
+    # ------------------------------------------------------------------
+    # Startup warm-up
+    # ------------------------------------------------------------------
+    def template_names(self) -> Iterable[str]:
+        """Every ``<section>/<name>/index.html`` below the templates folder."""
+
+        return self._env.list_templates(filter_func=lambda name: name.endswith("/index.html"))
+
+    def warm_up(self, template_names: Optional[Iterable[str]] = None, background: bool = True) -> None:
+        """Compile templates ahead of time, by default on a daemon thread."""
+
+        names = list(template_names) if template_names is not None else list(self.template_names())
+
+        def _compile() -> None:
+            for name in names:
+                try:
+                    self._get_template(name)
+                except Exception:  # a broken template must not kill startup
+                    continue
+
+        if not background:
+            _compile()
+            return
+        if self._warm_up_thread is not None and self._warm_up_thread.is_alive():
+            return
+        self._warm_up_thread = threading.Thread(target=_compile, name="template-warm-up", daemon=True)
+        self._warm_up_thread.start()
 
 
 # A shared renderer instance is enough for the whole application.
 renderer = TemplateRenderer()
-
@@ -53,25 +53,36 @@
         });
     }
 
-    function updateState(state) {
+    // El reloj se anima localmente a partir del descriptor que publica Python.
+    function renderTimer(view) {
+        document.querySelectorAll('[data-field="timer"]').forEach((el) => {
+            el.textContent = view.text;
+            el.classList.toggle('timer-display--critical', view.critical);
+            el.classList.toggle('timer-display--regular', !view.critical);
+        });
+    }
+
+    function renderCountdown(view) {
+        setText('[data-field="countdown"]', `Cuenta previa: ${view.text}`);
+    }
+
+    const gameClock = window.BasketBoardClock.createClock(window.BasketBoardClock.formatGameTime, renderTimer);
+    const countdownClock = window.BasketBoardClock.createClock(window.BasketBoardClock.formatMMSS, renderCountdown);
+
+    function updateState(state, nowMs) {
         if (!state) {
             return;
         }
         setText('[data-field="local-score"]', state.points_local);
         setText('[data-field="visit-score"]', state.points_visit);
         setText('[data-field="period"]', `Período ${state.period}`);
-        setText('[data-field="countdown"]', `Cuenta previa: ${state.countdown}`);
+        countdownClock.sync(state.countdown_clock, nowMs);
         setText('[data-field="fouls-local"]', state.fouls_local);
         setText('[data-field="fouls-visit"]', state.fouls_visit);
         setText('[data-field="local-name"]', state.team_local.name);
         setText('[data-field="visit-name"]', state.team_visit.name);
 
-        document.querySelectorAll('[data-field="timer"]').forEach((el) => {
-            el.textContent = state.time;
-            const isCritical = state.time_style === 'critical';
-            el.classList.toggle('timer-display--critical', isCritical);
-            el.classList.toggle('timer-display--regular', !isCritical);
-        });
+        gameClock.sync(state.clock, nowMs);
 
         const countdownInput = document.getElementById('countdown-input');
         if (countdownInput && document.activeElement !== countdownInput) {
@@ -104,24 +115,25 @@
         }
     }
 
-    function triggerAction(bridge, action, value) {
+    function triggerAction(bridge, commands, action, value) {
         switch (action) {
             case 'start-pause':
-                bridge.startPause();
+                commands.push('start_pause');
                 break;
             case 'reset-time':
-                bridge.resetTime();
+                commands.push('reset_time');
                 break;
             case 'next-period':
-                bridge.nextPeriod();
+                commands.push('next_period');
                 break;
             case 'start-countdown':
-                bridge.startPregame();
+                commands.push('start_pregame');
                 showToast('Countdown iniciado');
                 break;
             case 'set-countdown': {
                 const input = document.getElementById('countdown-input');
                 const countdownValue = input ? input.value : '';
+                commands.flush();
                 const success = bridge.setPregameCountdown(countdownValue ?? '');
                 if (!success) {
                     showToast('Formato de tiempo inválido. Usa MM:SS', 'error');
@@ -131,23 +143,23 @@
                 break;
             }
             case 'score-local':
-                bridge.scoreLocal(parseIntOr(value, 0));
+                commands.push('score_local', [parseIntOr(value, 0)]);
                 break;
             case 'score-visit':
-                bridge.scoreVisit(parseIntOr(value, 0));
+                commands.push('score_visit', [parseIntOr(value, 0)]);
                 break;
             case 'foul-local':
-                bridge.foulLocal(parseIntOr(value, 0));
+                commands.push('foul_local', [parseIntOr(value, 0)]);
                 break;
             case 'foul-visit':
-                bridge.foulVisit(parseIntOr(value, 0));
+                commands.push('foul_visit', [parseIntOr(value, 0)]);
                 break;
             default:
                 break;
         }
     }
 
-    function registerButtonActions(bridge) {
+    function registerButtonActions(bridge, commands) {
         document
             .querySelectorAll('[data-action]')
             .forEach((btn) => {
@@ -158,7 +170,7 @@
                     }
                     const valueAttr = btn.getAttribute('data-value');
                     const value = valueAttr !== null ? parseIntOr(valueAttr, 0) : undefined;
-                    triggerAction(bridge, action, value);
+                    triggerAction(bridge, commands, action, value);
                 });
             });
     }
@@ -191,7 +203,7 @@
         });
     }
 
-    function setupKeyboardShortcuts(bridge) {
+    function setupKeyboardShortcuts(bridge, commands) {
         document.addEventListener('keydown', (event) => {
             if (event.repeat) {
                 return;
@@ -205,7 +217,7 @@
                 return;
             }
             event.preventDefault();
-            triggerAction(bridge, shortcut.action, shortcut.value);
+            triggerAction(bridge, commands, shortcut.action, shortcut.value);
         });
         applyShortcutHints(KEYBOARD_SHORTCUTS);
     }
@@ -239,10 +251,10 @@
         }
     }
 
-    function attachBridge(bridge) {
+    function attachBridge(bridge, commands) {
         setupTabs();
-        registerButtonActions(bridge);
-        setupKeyboardShortcuts(bridge);
+        registerButtonActions(bridge, commands);
+        setupKeyboardShortcuts(bridge, commands);
 
         const form = document.getElementById('match-form');
         if (form) {
@@ -251,6 +263,7 @@
                 const local = parseIntOr(document.getElementById('local-team')?.value, 0);
                 const visit = parseIntOr(document.getElementById('visit-team')?.value, 0);
                 const gameType = parseIntOr(document.getElementById('game-type')?.value, 0);
+                commands.flush();
                 bridge.createMatch(local, visit, gameType);
                 showToast('Configuración aplicada');
             });
@@ -288,11 +301,13 @@
             console.error('No se encontró OperatorBridge.');
             return;
         }
-        attachBridge(bridge);
+        // Botones y atajos se mandan en lote, una vez por frame
+        const commands = window.BasketBoardCommands.createCommandBuffer(bridge);
+        attachBridge(bridge, commands);
+        const stateSync = window.BasketBoardStateSync.createStateSync(bridge, updateState);
         bridge.stateUpdated.connect((payload) => {
             try {
-                const state = JSON.parse(payload);
-                updateState(state);
+                stateSync.apply(JSON.parse(payload));
             } catch (error) {
                 console.error('No se pudo actualizar el estado', error);
             }
@@ -0,0 +1,86 @@
+"""Frame-rate capped coalescing of ``GameManager.updated`` into view refreshes."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from core.game_manager import GameManager
+from utils import metrics
+
+
+class _View:
+    __slots__ = ("refresh", "is_busy", "dirty", "refreshes", "skipped")
+
+    def __init__(self, refresh: Callable[[], None], is_busy: Optional[Callable[[], bool]]) -> None:
+        self.refresh = refresh
+        self.is_busy = is_busy
+        self.dirty = False
+        self.refreshes = 0
+        self.skipped = 0
+
+
+class UpdateScheduler(QObject):
+    """Merges bursts of ``updated`` emits into at most one refresh per frame.
+
+    Every emit only marks the registered views dirty. A single-shot timer
+    fires on the next event-loop turn (or when the frame budget allows) and
+    refreshes each dirty view once. Views that report themselves busy, e.g.
+    while their page is still loading, are skipped; they publish the latest
+    state themselves once the load finishes.
+    """
+
+    def __init__(self, manager: GameManager, max_fps: int = 60) -> None:
+        super().__init__()
+        self._frame_interval_ns = int(1_000_000_000 / max(1, max_fps))
+        self._last_frame_ns = 0
+        self._views: List[_View] = []
+
+        self._emits = 0
+        self._frames = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_frame)
+        manager.updated.connect(self._on_updated)
+
+    def register(self, refresh: Callable[[], None], is_busy: Optional[Callable[[], bool]] = None) -> None:
+        self._views.append(_View(refresh, is_busy))
+
+    def _on_updated(self) -> None:
+        self._emits += 1
+        for view in self._views:
+            view.dirty = True
+        if self._timer.isActive():
+            return
+        wait_ns = self._last_frame_ns + self._frame_interval_ns - time.monotonic_ns()
+        self._timer.start(max(0, -(-wait_ns // 1_000_000)))
+
+    def _on_frame(self) -> None:
+        self._last_frame_ns = time.monotonic_ns()
+        self._frames += 1
+        metrics.count("frames")
+        for view in self._views:
+            if not view.dirty:
+                continue
+            view.dirty = False
+            if view.is_busy is not None and view.is_busy():
+                view.skipped += 1
+                continue
+            view.refreshes += 1
+            metrics.count("view_refreshes")
+            view.refresh()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since startup: emits received, frames run, emits merged."""
+
+        return {
+            "emits": self._emits,
+            "frames": self._frames,
+            "merged": self._emits - self._frames,
+            "refreshes": sum(view.refreshes for view in self._views),
+            "skipped_busy": sum(view.skipped for view in self._views),
+        }
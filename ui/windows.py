@@ -3,106 +3,86 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path, PurePosixPath
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import QObject, QUrl, Signal, Slot
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
 from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
+from core.commands import parse_commands
 from core.game_manager import GameManager
-from core.timer import CountdownTimer, DECIS_PER_SECOND
+from core.logo_pipeline import logo_pipeline, logo_size_for
+from core.state import FrozenDict, clock_now_ms
 from models.game_type import GameType
 from models.team import Team
+from ui.metrics_panel import MetricsPanel
+from ui.native_display import NATIVE_TEMPLATE, NATIVE_TEMPLATE_LABEL, NativeScoreboard
+from ui.scheme_handler import base_url
+from ui.template_registry import template_registry
 from ui.template_renderer import renderer
+from ui.update_scheduler import UpdateScheduler
+from utils import logger, metrics
 
-ROOT_DIR = Path(__file__).resolve().parent.parent
-BASE_URL = QUrl.fromLocalFile(str(ROOT_DIR) + "/")
-TEMPLATES_ROOT = Path(__file__).resolve().parent / "templates"
 
+def available_display_templates() -> Tuple[str, ...]:
+    """HTML display templates plus the native QPainter scoreboard."""
 
-def _template_dir(section: str) -> Path:
-    return TEMPLATES_ROOT / section
+    return template_registry().templates("display") + (NATIVE_TEMPLATE,)
 
 
-def _list_templates(section: str) -> List[str]:
-    """Return relative template paths available for a section."""
+def _window_title(role: str, court_name: Optional[str]) -> str:
+    title = f"BasketBoard Pro — {role}"
+    return f"{title} · {court_name}" if court_name else title
 
-    base_dir = _template_dir(section)
-    if not base_dir.exists():
-        return []
-    templates: List[str] = []
-    for path in sorted(base_dir.glob("*/index.html")):
-        if path.is_file():
-            templates.append(path.relative_to(TEMPLATES_ROOT).as_posix())
-    return templates
 
+class DisplayBridge(QObject):
+    """Bridge that pushes live state to the display binding layer."""
 
-def _template_label(template_path: str) -> str:
-    path = Path(template_path)
-    if path.stem.lower() == "index" and path.parent != Path("."):
-        raw = path.parent.name
-    else:
-        raw = path.stem
-    stem = raw.replace("_", " ").replace("-", " ")
-    return stem.title()
-
-
-def _template_assets_url(template_name: str) -> str:
-    """Return the URL path where the template assets live."""
-
-    path = PurePosixPath(template_name)
-    directory = path.parent
-    if str(directory) in {".", ""}:
-        return "ui/templates"
-    return (PurePosixPath("ui/templates") / directory).as_posix()
-
-
-def _format_game_time(timer: CountdownTimer) -> Tuple[str, str]:
-    """Return formatted time string and style for the main game clock."""
-
-    remaining_secs = max(0, int(timer.remaining_secs))
-    if remaining_secs >= 60:
-        minutes = remaining_secs // 60
-        secs = remaining_secs % 60
-        return f"{minutes:02d}:{secs:02d}", "regular"
+    stateUpdated = Signal(str)
 
-    remaining_decis = max(0, timer.remaining_deciseconds)
-    secs = remaining_decis // DECIS_PER_SECOND
-    decis = remaining_decis % DECIS_PER_SECOND
-    return f":{secs:02d}.{decis}", "critical"
+    def __init__(self, window: "DisplayWindow") -> None:
+        super().__init__()
+        self._window = window
 
+    @Slot()
+    def requestInitialState(self) -> None:
+        self.push_state(self._window.last_state)
 
-def _team_view(team: Team) -> Dict[str, str]:
-    return {
-        "name": team.name,
-        "logo": team.logo,
-        "color_primary": team.color_primary,
-        "color_secondary": team.color_secondary,
-    }
+    def push_state(self, state: Optional[Dict[str, object]]) -> None:
+        if not state:
+            return
+        payload = json.dumps(dict(state, now_ms=clock_now_ms(self._window.manager)))
+        metrics.count("bridge_messages")
+        metrics.count("bridge_bytes", len(payload))
+        self.stateUpdated.emit(payload)
 
 
-def _game_type_view(game_type: GameType) -> Dict[str, str]:
-    return {
-        "name": game_type.name,
-        "quarters": str(game_type.quarters),
-        "time_per_quarter": game_type.time_per_quarter,
-        "rest_between_quarters": game_type.rest_between_quarters,
-        "halftime_rest": game_type.halftime_rest,
-    }
+class DisplayWindow(QWidget):
+    """Public scoreboard, rendered by WebEngine or natively with QPainter.
 
+    With an HTML template the page is rendered once per layout (template,
+    teams and game type); score, fouls, period and clock updates are pushed
+    through ``DisplayBridge`` to the ``data-field`` bindings in
+    ``ui/static/display.js``. The clock is only pushed when it starts, stops
+    or is adjusted; the page animates it from the ``clock`` descriptor (see
+    ``ui/static/clock.js``).
 
-class DisplayWindow(QWidget):
-    """Public scoreboard rendered through a QWebEngineView."""
+    Selecting ``NATIVE_TEMPLATE`` swaps the web view for a
+    ``NativeScoreboard`` and deletes the view, so the display no longer keeps
+    a Chromium renderer process alive.
+    """
 
     def __init__(
         self,
         manager: GameManager,
         template_name: Optional[str] = None,
+        updates: Optional[UpdateScheduler] = None,
+        court_name: Optional[str] = None,
     ) -> None:
         super().__init__()
-        self.setWindowTitle("BasketBoard Pro — Display")
+        self.setWindowTitle(_window_title("Display", court_name))
         self.manager = manager
         available = self.available_templates
         if not available:
@@ -115,39 +95,124 @@ class DisplayWindow(QWidget):
         else:
             self.template_name = available[0]
 
-        self.manager.updated.connect(self.refresh)
+        if updates is not None:
+            updates.register(self.refresh, self._is_loading)
+        else:
+            self.manager.updated.connect(self.refresh)
+        template_registry().templateModified.connect(self._on_template_modified)
 
-        self.view = QWebEngineView(self)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.view)
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.view: Optional[QWebEngineView] = None
+        self.native: Optional[NativeScoreboard] = None
+
+        self._page_ready = False
+        self._layout_key: Optional[Tuple[object, ...]] = None
+        self.last_state: Optional[Dict[str, object]] = None
 
         self.refresh()
 
-    def _build_context(self) -> Dict[str, object]:
-        match = self.manager.match
-        time_value, time_style = _format_game_time(self.manager.timer)
-        state = {
-            "time": time_value,
-            "time_style": time_style,
-            "period": match.current_period,
-            "points_local": match.points_local,
-            "points_visit": match.points_visit,
-            "fouls_local": match.fouls_local,
-            "fouls_visit": match.fouls_visit,
-            "team_local": _team_view(match.team_local),
-            "team_visit": _team_view(match.team_visit),
-            "game_type": _game_type_view(match.game_type),
-        }
+    # ------------------------------------------------------------------
+    # Backends
+    # ------------------------------------------------------------------
+    @property
+    def is_native(self) -> bool:
+        return self.template_name == NATIVE_TEMPLATE
+
+    def _ensure_backend(self) -> None:
+        if self.is_native and self.native is None:
+            self._drop_web_view()
+            self.native = NativeScoreboard(lambda: clock_now_ms(self.manager), self)
+            self._layout.addWidget(self.native)
+        elif not self.is_native and self.view is None:
+            if self.native is not None:
+                self.native.deleteLater()
+                self.native = None
+            self.view = QWebEngineView(self)
+            self._layout.addWidget(self.view)
+            self._channel = QWebChannel(self.view.page())
+            self._bridge = DisplayBridge(self)
+            self._channel.registerObject("DisplayBridge", self._bridge)
+            self.view.page().setWebChannel(self._channel)
+            self.view.loadFinished.connect(self._on_load_finished)
+            self._page_ready = False
+            self._layout_key = None
+
+    def _drop_web_view(self) -> None:
+        if self.view is None:
+            return
+        self._layout.removeWidget(self.view)
+        self.view.deleteLater()
+        self._channel.deleteLater()
+        self.view = None
+        self._page_ready = False
+        self._layout_key = None
+
+    # ------------------------------------------------------------------
+    # WebEngine rendering
+    # ------------------------------------------------------------------
+    def _build_state(self) -> Dict[str, object]:
+        return self.manager.snapshots.display_state()
+
+    def _logo_variants(self, state: Dict[str, object]) -> Tuple[str, str]:
+        """Pre-scaled logos sized for this template on this screen (original until ready)."""
+
+        size_px = logo_size_for(self.template_name, self.devicePixelRatioF())
+        return (
+            logo_pipeline.variant(state["team_local"]["logo"], size_px),
+            logo_pipeline.variant(state["team_visit"]["logo"], size_px),
+        )
+
+    def _build_context(self, state: Dict[str, object]) -> Dict[str, object]:
+        logo_local, logo_visit = self._logo_variants(state)
+        state = dict(state)
+        state["team_local"] = dict(state["team_local"], logo=logo_local)
+        state["team_visit"] = dict(state["team_visit"], logo=logo_visit)
         return {
             "state": state,
             "static_url": "ui/static",
-            "template_url": _template_assets_url(self.template_name),
+            "template_url": template_registry().assets_url(self.template_name),
         }
 
+    def _build_layout_key(self, state: Dict[str, object]) -> Tuple[object, ...]:
+        """Values baked into the rendered HTML; a change forces a full render."""
+
+        return (
+            self.template_name,
+            tuple(state["team_local"].items()),
+            tuple(state["team_visit"].items()),
+            tuple(state["game_type"].items()),
+            # A variant that became ready since the last render
+            self._logo_variants(state),
+        )
+
+    def _render_template(self, state: Dict[str, object]) -> None:
+        self._page_ready = False
+        self._layout_key = self._build_layout_key(state)
+        # Snapshot version + layout key identify the context: a cache hit skips fingerprinting it
+        snapshots = self.manager.snapshots
+        cache_key = (id(snapshots), snapshots.version, self._layout_key)
+        html = renderer.render(self.template_name, self._build_context(state), cache_key)
+        metrics.count("set_html")
+        self.view.setHtml(html, base_url())
+
+    def _on_load_finished(self, _success: bool) -> None:
+        self._page_ready = True
+        self.refresh()
+
+    def _is_loading(self) -> bool:
+        return self.view is not None and not self._page_ready
+
     def refresh(self) -> None:
-        html = renderer.render(self.template_name, self._build_context())
-        self.view.setHtml(html, BASE_URL)
+        state = self._build_state()
+        self.last_state = state
+        self._ensure_backend()
+        if self.native is not None:
+            self.native.set_state(state)
+        elif self._build_layout_key(state) != self._layout_key:
+            self._render_template(state)
+        elif self._page_ready:
+            self._bridge.push_state(state)
 
     def set_template(self, template_name: str) -> None:
         if template_name not in self.available_templates:
@@ -155,23 +220,46 @@ class DisplayWindow(QWidget):
         self.template_name = template_name
         self.refresh()
 
+    def _on_template_modified(self, template_name: str) -> None:
+        if template_name == self.template_name:
+            self._layout_key = None
+            self.refresh()
+
+    def reload_logos(self) -> None:
+        """A pre-scaled logo variant is ready: show it without waiting for the next update."""
+
+        if self.native is not None:
+            self.native.reload_logos()
+        else:
+            self.refresh()
+
     def beep(self) -> None:
         QApplication.beep()
         self.refresh()
 
     @property
-    def available_templates(self) -> List[str]:
-        return _list_templates("display")
+    def available_templates(self) -> Sequence[str]:
+        return available_display_templates()
 
 
 class OperatorBridge(QObject):
-    """Bridge exposed to JavaScript via Qt WebChannel."""
+    """Bridge exposed to JavaScript via Qt WebChannel.
+
+    State is published as versioned messages
+    ``{"version", "full", "state", "now_ms"}``. A full snapshot carries every
+    key; otherwise ``state`` only holds the keys that changed since the
+    previous message. Clients that detect a version gap ask for a new snapshot
+    through ``requestInitialState`` (``ui/static/state_sync.js``). ``now_ms`` is the clock reference used to
+    extrapolate the ``clock`` and ``countdown_clock`` descriptors.
+    """
 
     stateUpdated = Signal(str)
 
     def __init__(self, window: "OperatorWindow") -> None:
         super().__init__()
         self._window = window
+        self._version = 0
+        self._sent_state: Optional[Dict[str, object]] = None
 
     # ------------------------------------------------------------------
     # Requests from JavaScript to Python
@@ -220,6 +308,22 @@ class OperatorBridge(QObject):
     def foulVisit(self, delta: int) -> None:
         self._window.manager.foul_visit(delta)
 
+    @Slot(str)
+    def applyCommands(self, payload: str) -> None:
+        """Apply a JSON batch of ``core.commands`` atomically, with one state publication.
+
+        The page buffers button presses and shortcuts and flushes them once per
+        animation frame (``ui/static/commands.js``), so a burst of keys costs a
+        single WebChannel message, ``updated`` emit and refresh.
+        """
+
+        try:
+            commands = parse_commands(json.loads(payload))
+        except ValueError as exc:  # malformed JSON or core.commands.CommandError
+            logger.warning(f"Lote de comandos rechazado: {exc}")
+            return
+        self._window.manager.apply_commands(commands)
+
     @Slot(int, int, int)
     def createMatch(self, local_index: int, visit_index: int, game_type_index: int) -> None:
         self._window.create_match(local_index, visit_index, game_type_index)
@@ -238,21 +342,40 @@ class OperatorBridge(QObject):
             self._window.manager.set_pregame_countdown(value)
         except ValueError:
             return False
-        else:
-            self._window.refresh()
-            return True
+        return True
 
     @Slot()
     def requestInitialState(self) -> None:
-        self.push_state(self._window.last_state)
+        self.push_state(self._window.last_state, full=True)
 
     # ------------------------------------------------------------------
     # Helpers for Python -> JavaScript notifications
     # ------------------------------------------------------------------
-    def push_state(self, state: Optional[Dict[str, object]]) -> None:
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def push_state(self, state: Optional[Dict[str, object]], full: bool = False) -> None:
         if not state:
             return
-        payload = json.dumps(state)
+        previous = self._sent_state
+        if full or previous is None:
+            changes = state
+            full = True
+        else:
+            changes = {key: value for key, value in state.items() if previous.get(key) != value}
+            if not changes:
+                return
+        self._version += 1
+        self._sent_state = state
+        payload = json.dumps({
+            "version": self._version,
+            "full": full,
+            "state": changes,
+            "now_ms": clock_now_ms(self._window.manager),
+        })
+        metrics.count("bridge_messages")
+        metrics.count("bridge_bytes", len(payload))
         self.stateUpdated.emit(payload)
 
 
@@ -268,12 +391,22 @@ class OperatorWindow(QWidget):
         on_set_display_template: Callable[[str], None],
         initial_operator_template: Optional[str] = None,
         initial_display_template: Optional[str] = None,
+        updates: Optional[UpdateScheduler] = None,
+        court_name: Optional[str] = None,
+        metrics_panel: Optional[MetricsPanel] = None,
     ) -> None:
         super().__init__()
-        self.setWindowTitle("BasketBoard Pro — Operador")
+        self.setWindowTitle(_window_title("Operador", court_name))
+        if metrics_panel is not None:
+            # Hidden diagnostics panel, not linked from any template
+            shortcut = QShortcut(QKeySequence("Ctrl+Shift+M"), self)
+            shortcut.activated.connect(metrics_panel.toggle_visible)
 
         self.manager = manager
-        self.manager.updated.connect(self.refresh)
+        if updates is not None:
+            updates.register(self.refresh, self._is_loading)
+        else:
+            self.manager.updated.connect(self.refresh)
 
         self.teams = teams
         self.game_types = game_types
@@ -315,6 +448,15 @@ class OperatorWindow(QWidget):
 
         self._page_ready = False
         self.last_state: Optional[Dict[str, object]] = None
+        # Shared snapshot of the current version plus this window's template picks
+        self.manager.snapshots.set_presets(teams, game_types)
+        self._state_source: Optional[Dict[str, object]] = None
+        self._state_templates: Tuple[str, str] = ("", "")
+        self._state: Dict[str, object] = {}
+
+        registry = template_registry()
+        registry.templatesChanged.connect(self._on_templates_changed)
+        registry.templateModified.connect(self._on_template_modified)
 
         self.view.loadFinished.connect(self._on_load_finished)
         self._render_template()
@@ -323,64 +465,38 @@ class OperatorWindow(QWidget):
     # ------------------------------------------------------------------
     # State building helpers
     # ------------------------------------------------------------------
-    def _team_index(self, team: Team) -> int:
-        try:
-            return self.teams.index(team)
-        except ValueError:
-            return 0
-
-    def _game_type_index(self, game_type: GameType) -> int:
-        try:
-            return self.game_types.index(game_type)
-        except ValueError:
-            return 0
-
     def _build_state(self) -> Dict[str, object]:
-        match = self.manager.match
-        time_value, time_style = _format_game_time(self.manager.timer)
-        state = {
-            "time": time_value,
-            "time_style": time_style,
-            "period": match.current_period,
-            "points_local": match.points_local,
-            "points_visit": match.points_visit,
-            "fouls_local": match.fouls_local,
-            "fouls_visit": match.fouls_visit,
-            "countdown": self.manager.countdown.remaining_mmss,
-            "team_local": _team_view(match.team_local),
-            "team_visit": _team_view(match.team_visit),
-            "game_type": _game_type_view(match.game_type),
-            "selected": {
-                "local": self._team_index(match.team_local),
-                "visit": self._team_index(match.team_visit),
-                "game_type": self._game_type_index(match.game_type),
-            },
-            "operator_template": self._operator_template,
-            "display_template": self._display_template,
-        }
-        return state
+        snapshot = self.manager.snapshots.operator_state()
+        templates = (self._operator_template, self._display_template)
+        if snapshot is not self._state_source or templates != self._state_templates:
+            self._state_source = snapshot
+            self._state_templates = templates
+            self._state = FrozenDict(
+                snapshot,
+                operator_template=self._operator_template,
+                display_template=self._display_template,
+            )
+        return self._state
 
     def _build_template_context(self) -> Dict[str, object]:
         state = self._build_state()
-        operator_options = [
-            {"value": name, "label": _template_label(name)}
-            for name in self.available_operator_templates
-        ]
-        display_options = [
-            {"value": name, "label": _template_label(name)}
-            for name in self.available_display_templates
+        teams, game_types = self.manager.snapshots.preset_views()
+        registry = template_registry()
+        operator_options = registry.options("operator")
+        display_options = registry.options("display") + [
+            {"value": NATIVE_TEMPLATE, "label": NATIVE_TEMPLATE_LABEL}
         ]
         return {
             "state": state,
-            "teams": [_team_view(team) for team in self.teams],
-            "game_types": [_game_type_view(game_type) for game_type in self.game_types],
+            "teams": list(teams),
+            "game_types": list(game_types),
             "selected": state["selected"],
             "operator_templates": operator_options,
             "display_templates": display_options,
             "operator_template": self._operator_template,
             "display_template": self._display_template,
             "static_url": "ui/static",
-            "template_url": _template_assets_url(self._operator_template),
+            "template_url": registry.assets_url(self._operator_template),
         }
 
     # ------------------------------------------------------------------
@@ -389,11 +505,17 @@ class OperatorWindow(QWidget):
     def _render_template(self) -> None:
         self._page_ready = False
         html = renderer.render(self._operator_template, self._build_template_context())
-        self.view.setHtml(html, BASE_URL)
+        metrics.count("set_html")
+        self.view.setHtml(html, base_url())
 
     def _on_load_finished(self, _success: bool) -> None:
         self._page_ready = True
-        self.refresh()
+        # A freshly loaded page has no base state to patch.
+        self.last_state = self._build_state()
+        self._bridge.push_state(self.last_state, full=True)
+
+    def _is_loading(self) -> bool:
+        return not self._page_ready
 
     def refresh(self) -> None:
         state = self._build_state()
@@ -422,10 +544,18 @@ class OperatorWindow(QWidget):
         self._operator_template = template_name
         self._render_template()
 
+    def _on_templates_changed(self, _section: str) -> None:
+        # Template pickers are rendered server-side; re-render to list the new set.
+        self._render_template()
+
+    def _on_template_modified(self, template_name: str) -> None:
+        if template_name == self._operator_template:
+            self._render_template()
+
     @property
-    def available_operator_templates(self) -> List[str]:
-        return _list_templates("operator")
+    def available_operator_templates(self) -> Sequence[str]:
+        return template_registry().templates("operator")
 
     @property
-    def available_display_templates(self) -> List[str]:
-        return _list_templates("display")
+    def available_display_templates(self) -> Sequence[str]:
+        return available_display_templates()
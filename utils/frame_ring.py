@@ -0,0 +1,192 @@
+"""
+Anillo de frames RGBA en memoria compartida (sin Qt).
+
+Lo escribe ui.frame_sink y lo lee un proceso local (p. ej. un encoder):
+el lector toma el frame directamente de la memoria compartida, sin que
+los píxeles pasen por un pipe ni se copien entre procesos.
+
+Layout (little-endian):
+
+    0   cabecera fija    "BBPF", versión, ancho, alto, stride, slots, fps, 0
+    32  cabecera viva    seq (u64), rasters (u64), slot (u32), 0, timestamp_ns (u64)
+    64  slots            'slots' frames RGBA de stride * alto bytes cada uno
+
+La cabecera viva es un seqlock: el escritor deja 'seq' impar mientras la
+actualiza y par al terminar, así el lector nunca ve slot y timestamp de
+frames distintos. Cada frame publicado suma 2 a 'seq' (frame = seq // 2),
+pero sólo se rasteriza (y se ocupa un slot nuevo) cuando cambia el estado;
+los frames sin cambios vuelven a publicar el mismo slot. Un slot se
+reescribe recién 'slots' rasterizaciones después, así que un lector que
+tarda menos que eso en consumir un frame nunca lo ve a medio pintar
+(FrameRingReader.intact() lo verifica).
+
+Uso (encoder con fondo transparente):
+    python -m utils.frame_ring bbp-frames-1 | ffmpeg -f rawvideo -pix_fmt rgba \\
+        -s 1920x1080 -r 60 -i - -c:v qtrle overlay.mov
+"""
+
+import argparse
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+MAGIC = b"BBPF"
+LAYOUT_VERSION = 1
+DEFAULT_SLOTS = 4
+BYTES_PER_PIXEL = 4  # RGBA8888, alfa no premultiplicado (pix_fmt "rgba" de ffmpeg)
+
+_FIXED = struct.Struct("<4sIIIIIII")
+_LIVE = struct.Struct("<QQIIQ")
+_LIVE_OFFSET = _FIXED.size
+_SEQ = struct.Struct("<Q")
+HEADER_SIZE = 64
+# Reintentos de lectura antes de suponer que el escritor murió a mitad de una publicación
+_MAX_RETRIES = 100_000
+
+
+def ring_size(width: int, height: int, slots: int = DEFAULT_SLOTS) -> int:
+    return HEADER_SIZE + slots * width * BYTES_PER_PIXEL * height
+
+
+class Frame(NamedTuple):
+    number: int
+    timestamp_ns: int
+    rasters: int
+    pixels: memoryview
+
+
+class FrameRingWriter:
+    """
+    Crea el segmento y publica frames.
+    - slot_buffer(i): memoryview escribible del slot i (se pinta ahí directo)
+    - next_slot(): slot libre para la próxima rasterización
+    - publish(slot, timestamp_ns, rasterized): publica un frame
+    """
+
+    def __init__(self, name: str, width: int, height: int, fps: int, slots: int = DEFAULT_SLOTS):
+        self.width = width
+        self.height = height
+        self.stride = width * BYTES_PER_PIXEL
+        self.fps = fps
+        self.slots = slots
+        self.frame_size = self.stride * height
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=ring_size(width, height, slots))
+        except FileExistsError:
+            # Segmento de una ejecución anterior que no se cerró bien
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=ring_size(width, height, slots))
+        self.name = self._shm.name
+        _FIXED.pack_into(self._shm.buf, 0, MAGIC, LAYOUT_VERSION, width, height, self.stride, slots, fps, 0)
+        self._seq = 0
+        self._rasters = 0
+        self._slot = 0
+        _LIVE.pack_into(self._shm.buf, _LIVE_OFFSET, 0, 0, 0, 0, 0)
+
+    def slot_buffer(self, index: int) -> memoryview:
+        start = HEADER_SIZE + index * self.frame_size
+        return self._shm.buf[start:start + self.frame_size]
+
+    def next_slot(self) -> int:
+        return (self._slot + 1) % self.slots if self._rasters else 0
+
+    def publish(self, slot: int, timestamp_ns: int, rasterized: bool) -> int:
+        """Publica un frame y devuelve su número."""
+        if rasterized:
+            self._rasters += 1
+            self._slot = slot
+        buf = self._shm.buf
+        _SEQ.pack_into(buf, _LIVE_OFFSET, self._seq + 1)
+        _LIVE.pack_into(buf, _LIVE_OFFSET, self._seq + 1, self._rasters, self._slot, 0, timestamp_ns)
+        self._seq += 2
+        _SEQ.pack_into(buf, _LIVE_OFFSET, self._seq)
+        return self._seq // 2
+
+    def close(self) -> None:
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class FrameRingReader:
+    """Se conecta a un anillo existente y lee el último frame publicado."""
+
+    def __init__(self, name: str):
+        self._shm = shared_memory.SharedMemory(name=name)
+        if sys.version_info < (3, 13):
+            # Sin esto el resource_tracker borraría el segmento del escritor al salir
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        magic, version, self.width, self.height, self.stride, self.slots, self.fps, _ = \
+            _FIXED.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._shm.close()
+            raise ValueError(f"'{name}' no es un anillo de frames v{LAYOUT_VERSION}")
+        self.frame_size = self.stride * self.height
+
+    def read(self) -> Optional[Frame]:
+        """Último frame publicado (None si todavía no hay ninguno)."""
+        buf = self._shm.buf
+        for _ in range(_MAX_RETRIES):
+            seq, rasters, slot, _, timestamp_ns = _LIVE.unpack_from(buf, _LIVE_OFFSET)
+            if not seq & 1 and _SEQ.unpack_from(buf, _LIVE_OFFSET)[0] == seq:
+                break
+        else:
+            raise RuntimeError("El anillo de frames quedó a medio publicar (¿el escritor terminó?)")
+        if not seq:
+            return None
+        start = HEADER_SIZE + slot * self.frame_size
+        return Frame(seq // 2, timestamp_ns, rasters, buf[start:start + self.frame_size])
+
+    def intact(self, frame: Frame) -> bool:
+        """True si el slot de 'frame' no se reescribió desde que se leyó."""
+        _, rasters, _, _, _ = _LIVE.unpack_from(self._shm.buf, _LIVE_OFFSET)
+        return rasters - frame.rasters < self.slots - 1
+
+    def close(self) -> None:
+        self._shm.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Vuelca a stdout cada frame publicado en un anillo de frames.")
+    parser.add_argument("name", help="nombre del segmento (frame_output_name en data/config.json)")
+    args = parser.parse_args(argv)
+
+    reader = FrameRingReader(args.name)
+    out = sys.stdout.buffer
+    period_s = 1 / max(1, reader.fps)
+    print(f"{args.name}: {reader.width}x{reader.height} rgba @ {reader.fps} fps", file=sys.stderr)
+    last = 0
+    dropped = torn = 0
+    frame = None
+    try:
+        while True:
+            frame = reader.read()
+            if frame is None or frame.number == last:
+                time.sleep(period_s / 8)
+                continue
+            if last and frame.number > last + 1:
+                dropped += frame.number - last - 1
+            last = frame.number
+            out.write(frame.pixels)
+            if not reader.intact(frame):
+                torn += 1
+            frame = None
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        frame = None  # suelta el memoryview antes de cerrar el segmento
+        print(f"{args.name}: {last} frames, {dropped} perdidos, {torn} reescritos durante la lectura",
+              file=sys.stderr)
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
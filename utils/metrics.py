@@ -0,0 +1,178 @@
+"""
+Métricas livianas de los caminos calientes (render, bridges, reloj, loop).
+
+Desactivadas por defecto: count() y observe() sólo chequean un booleano
+de módulo y vuelven, así que pueden quedar en el código de producción.
+Al activarlas se acumulan contadores (total y tasa por segundo sobre una
+ventana móvil) e histogramas de latencia en milisegundos.
+
+    from utils import metrics
+    metrics.count("renders")
+    metrics.count("bridge_bytes", len(payload))
+    metrics.observe("timer_lateness_ms", lateness)
+    metrics.snapshot()          # dict serializable
+    metrics.export(path)        # mismo dict en un archivo JSON
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250)
+RATE_WINDOW_S = 10
+
+# Leído en cada count()/observe(): con False no se hace nada más
+enabled = False
+
+_lock = threading.Lock()
+_counters: Dict[str, "_Counter"] = {}
+_histograms: Dict[str, "_Histogram"] = {}
+_started_at = time.monotonic()
+
+
+class _Counter:
+    """Total acumulado más una ventana de los últimos segundos completos."""
+
+    __slots__ = ("total", "_second", "_current", "_window")
+
+    def __init__(self, now_s: int):
+        self.total = 0
+        self._second = now_s
+        self._current = 0
+        self._window: deque = deque(maxlen=RATE_WINDOW_S)
+
+    def _roll(self, now_s: int) -> None:
+        if now_s == self._second:
+            return
+        self._window.append(self._current)
+        # Segundos sin actividad cuentan como cero
+        for _ in range(min(RATE_WINDOW_S, now_s - self._second - 1)):
+            self._window.append(0)
+        self._second = now_s
+        self._current = 0
+
+    def add(self, amount: int, now_s: int) -> None:
+        self._roll(now_s)
+        self._current += amount
+        self.total += amount
+
+    def rate(self, now_s: int) -> float:
+        self._roll(now_s)
+        return sum(self._window) / len(self._window) if self._window else 0.0
+
+
+class _Histogram:
+    __slots__ = ("bounds", "buckets", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        index = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, object]:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+# -------------------------------------------------
+# 📈 Registro (llamado desde los caminos calientes)
+# -------------------------------------------------
+def count(name: str, amount: int = 1) -> None:
+    """Suma 'amount' al contador 'name'."""
+    if not enabled:
+        return
+    now_s = int(time.monotonic())
+    with _lock:
+        counter = _counters.get(name)
+        if counter is None:
+            counter = _counters[name] = _Counter(now_s)
+        counter.add(amount, now_s)
+
+
+def observe(name: str, value: float, bounds: Sequence[float] = LATENCY_BUCKETS_MS) -> None:
+    """Registra una muestra en el histograma 'name'."""
+    if not enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = _Histogram(bounds)
+        histogram.observe(value)
+
+
+def track_engine(engine) -> None:
+    """Cuenta acciones y emisiones de 'updated' de un MatchEngine."""
+    engine.action.connect(lambda *_: count("actions"))
+    engine.updated.connect(lambda: count("updated_emits"))
+
+
+# -------------------------------------------------
+# ⚙️ Control y lectura
+# -------------------------------------------------
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = bool(on)
+
+
+def reset() -> None:
+    global _started_at
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _started_at = time.monotonic()
+
+
+def snapshot() -> Dict[str, object]:
+    """Estado actual de todas las métricas como dict serializable a JSON."""
+    now = time.monotonic()
+    now_s = int(now)
+    with _lock:
+        counters = {
+            name: {"total": counter.total, "per_s": round(counter.rate(now_s), 2)}
+            for name, counter in sorted(_counters.items())
+        }
+        histograms = {name: histogram.to_dict() for name, histogram in sorted(_histograms.items())}
+    actions = counters.get("actions", {}).get("total", 0)
+    updated = counters.get("updated_emits", {}).get("total", 0)
+    return {
+        "enabled": enabled,
+        "uptime_s": round(now - _started_at, 1),
+        "counters": counters,
+        "histograms": histograms,
+        "derived": {
+            "updated_per_action": round(updated / actions, 3) if actions else None,
+        },
+    }
+
+
+def export(path: Optional[Path] = None) -> Path:
+    """Guarda snapshot() como JSON; por defecto en data/metrics/metrics-<fecha>.json."""
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = Path(__file__).resolve().parent.parent / "data" / "metrics" / f"metrics-{stamp}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(snapshot(), indent=2), encoding="utf-8")
+    return path
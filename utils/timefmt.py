@@ -0,0 +1,24 @@
+def mmss_to_secs(mmss: str) -> int:
+    """
+    Convierte 'MM:SS' a segundos (int).
+    Lanza ValueError si el formato no es válido.
+    """
+    mmss = (mmss or "").strip()
+    if ":" not in mmss:
+        raise ValueError(f"Formato inválido (esperado MM:SS): {mmss!r}")
+    m, s = mmss.split(":")
+    m_i, s_i = int(m), int(s)
+    if m_i < 0 or s_i < 0 or s_i > 59:
+        raise ValueError(f"Valores fuera de rango en MM:SS: {mmss!r}")
+    return m_i * 60 + s_i
+
+
+def secs_to_mmss(secs: int) -> str:
+    """
+    Convierte segundos (int) a formato 'MM:SS'.
+    No permite negativos (clampa en 0).
+    """
+    secs = max(0, int(secs))
+    m = secs // 60
+    s = secs % 60
+    return f"{m:02d}:{s:02d}"